@@ -0,0 +1,49 @@
+"""
+Command line entry point.
+
+    python -m FDocs export myapp.main:app --output site/
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m FDocs", description="F-Docs command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="write the docs as a static site")
+    export.add_argument("app", help='the FastAPI app, as "module:attr"')
+    export.add_argument("-o", "--output", default="docs-site", help="output directory (default: docs-site)")
+    export.add_argument("--app-dir", default=".", help="directory added to sys.path to import the app (default: .)")
+    export.add_argument("--title", default="F-Docs", help="page title")
+    export.add_argument("--base-url", default="", help='URL the site is hosted at, e.g. "/docs/" (default: relative)')
+    export.add_argument("--server-url", help="API server the docs send requests to, when hosted elsewhere")
+    export.add_argument("--lazy-chunks", action="store_true", help="write a tag manifest and per-tag chunks")
+    export.add_argument("--aggregate", action="store_true", help="include FastAPI apps mounted under the app")
+    export.add_argument("--no-docs-index", dest="docs_index", action="store_false", help="skip the prebuilt docs index")
+    export.add_argument("--no-search-index", dest="search_index", action="store_false", help="skip the search index")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        sys.path.insert(0, args.app_dir)
+        from .aggregate import load_app
+        from .export import export_site
+
+        written = export_site(
+            load_app(args.app),
+            args.output,
+            title=args.title,
+            base_url=args.base_url,
+            server_url=args.server_url,
+            docs_index=args.docs_index,
+            search_index=args.search_index,
+            lazy_chunks=args.lazy_chunks,
+            aggregate_openapi=args.aggregate,
+        )
+        print(f"F-Docs: wrote {len(written)} files to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
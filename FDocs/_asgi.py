@@ -0,0 +1,218 @@
+"""
+Minimal in-process ASGI client.
+
+Requests are handed straight to the app's ASGI callable on the running event
+loop: no sockets, no HTTP parsing, and the response is collected in memory.
+WebSocket sessions are driven the same way through `ASGIWebSocket`.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
+
+from starlette.types import ASGIApp, Message, Scope
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class ASGIResult:
+    """A response collected from the app, with server-side timings in seconds."""
+
+    __slots__ = ("status", "headers", "body", "elapsed", "first_byte")
+
+    def __init__(self, status: int, headers: Headers, body: bytes, elapsed: float, first_byte: float):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+        self.first_byte = first_byte
+
+
+def is_origin_path(target: str) -> bool:
+    """
+    True if `target` is a path on the current origin ("/items?x=1"), not an
+    absolute or scheme-relative URL that would send a request to another host.
+    """
+    if not target.startswith("/") or target.startswith("//") or "\\" in target:
+        return False
+    parts = urlsplit(target)
+    return not parts.scheme and not parts.netloc
+
+
+def build_scope(
+    base: Scope,
+    method: str,
+    target: str,
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+) -> Scope:
+    """
+    HTTP scope for a request to `target` (path plus optional query string),
+    inheriting server, client, root_path and lifespan state from `base`.
+    """
+    path, _, query = target.partition("?")
+    if not path.startswith("/"):
+        path = "/" + path
+    raw_headers = list(headers)
+    if not any(name == b"host" for name, _ in raw_headers):
+        raw_headers.extend((name, value) for name, value in base.get("headers", ()) if name == b"host")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": base.get("http_version", "1.1"),
+        "method": method.upper(),
+        "scheme": base.get("scheme", "http"),
+        "path": unquote(path),
+        "raw_path": path.encode("latin-1", "replace"),
+        "query_string": query.encode("latin-1", "replace"),
+        "root_path": base.get("root_path", ""),
+        "headers": raw_headers,
+        "client": base.get("client"),
+        "server": base.get("server"),
+        # Marks requests issued by F-Docs itself, e.g. so metrics can skip them
+        "extensions": {"f_docs": {}},
+    }
+    if "state" in base:
+        # Lifespan state is shallow-copied per request, as servers do
+        scope["state"] = dict(base["state"])
+    return scope
+
+
+async def call(app: ASGIApp, scope: Scope, body: bytes = b"") -> ASGIResult:
+    """Runs one request through `app` and collects its response."""
+    request_sent = False
+    response_complete = asyncio.Event()
+    status = 500
+    response_headers: Headers = []
+    chunks: List[bytes] = []
+    first_byte: Optional[float] = None
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Nothing more to read: block until the response is done, then hang up
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status, response_headers, first_byte
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers = list(message.get("headers", ()))
+            first_byte = time.perf_counter() - start
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    start = time.perf_counter()
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # Starlette re-raises handler errors after sending its 500 response
+        if first_byte is None:
+            raise
+    finally:
+        response_complete.set()
+    elapsed = time.perf_counter() - start
+    return ASGIResult(status, response_headers, b"".join(chunks), elapsed, elapsed if first_byte is None else first_byte)
+
+
+def websocket_scope(base: Scope, target: str, headers: Iterable[Tuple[bytes, bytes]] = ()) -> Scope:
+    """WebSocket scope for `target`, inheriting from `base` like `build_scope`."""
+    scope = build_scope(base, "GET", target, headers)
+    del scope["method"]
+    scope["type"] = "websocket"
+    scope["scheme"] = "wss" if scope["scheme"] in ("https", "wss") else "ws"
+    scope["subprotocols"] = []
+    return scope
+
+
+class WebSocketClosed(Exception):
+    """The app closed (or refused) the WebSocket."""
+
+    def __init__(self, code: int):
+        super().__init__(f"WebSocket closed with code {code}")
+        self.code = code
+
+
+class ASGIWebSocket:
+    """
+    A WebSocket client session against an ASGI app, run as a task on the
+    current event loop.
+
+    Usage:
+        ws = ASGIWebSocket(app, websocket_scope(request.scope, "/ws"))
+        await ws.connect()
+        await ws.send("hello")
+        reply = await ws.receive()
+        await ws.close()
+    """
+
+    def __init__(self, app: ASGIApp, scope: Scope):
+        self.app = app
+        self.scope = scope
+        self._to_app: "asyncio.Queue[Message]" = asyncio.Queue()
+        self._to_client: "asyncio.Queue[Message]" = asyncio.Queue()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.close_code: Optional[int] = None
+
+    async def _run(self) -> None:
+        try:
+            await self.app(self.scope, self._to_app.get, self._to_client.put)
+        finally:
+            # However the app returns, the client sees the socket close
+            self._to_client.put_nowait({"type": "websocket.close", "code": 1006})
+
+    async def connect(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        self._to_app.put_nowait({"type": "websocket.connect"})
+        message = await self._to_client.get()
+        if message["type"] != "websocket.accept":
+            self.close_code = message.get("code", 1006) if message["type"] == "websocket.close" else 1006
+            await self._finish()
+            raise WebSocketClosed(self.close_code)
+
+    async def send(self, data: Union[str, bytes]) -> None:
+        if self.close_code is not None:
+            raise WebSocketClosed(self.close_code)
+        key = "bytes" if isinstance(data, bytes) else "text"
+        self._to_app.put_nowait({"type": "websocket.receive", key: data})
+
+    async def receive(self) -> Union[str, bytes]:
+        """Next message from the app; raises `WebSocketClosed` once it closes."""
+        if self.close_code is not None:
+            raise WebSocketClosed(self.close_code)
+        message = await self._to_client.get()
+        if message["type"] == "websocket.send":
+            text = message.get("text")
+            return text if text is not None else message.get("bytes", b"")
+        self.close_code = message.get("code", 1000)
+        raise WebSocketClosed(self.close_code)
+
+    async def close(self, code: int = 1000, timeout: float = 1.0) -> None:
+        """Disconnects and waits up to `timeout` for the app to notice."""
+        if self.close_code is None:
+            self.close_code = code
+        self._to_app.put_nowait({"type": "websocket.disconnect", "code": code})
+        await self._finish(timeout)
+
+    async def _finish(self, timeout: float = 0.0) -> None:
+        if self._task is None:
+            return
+        # Handlers that only ever send (no receive) never see the disconnect
+        done, _ = await asyncio.wait({self._task}, timeout=timeout)
+        if not done:
+            self._task.cancel()
+            await asyncio.wait({self._task})
+        if not self._task.cancelled():
+            self._task.exception()  # the app's own errors are not the client's
+
+
+def header_list(headers: Dict[str, Any]) -> Headers:
+    """Converts a JSON header object into raw ASGI headers."""
+    return [
+        (str(name).lower().encode("latin-1"), str(value).encode("latin-1"))
+        for name, value in (headers or {}).items()
+    ]
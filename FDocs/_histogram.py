@@ -0,0 +1,101 @@
+"""
+Compact latency histogram.
+
+Values are recorded in microseconds into log-linear buckets (exact below 64µs,
+then 32 sub-buckets per power of two, i.e. within ~3%), kept in a flat
+`array` of counters. Recording is O(1) and the histogram is a few KB however
+many samples it holds.
+"""
+from array import array
+from typing import Any, Dict, List, Optional
+
+SUB_BITS = 5
+SUB_BUCKETS = 1 << SUB_BITS
+# Values up to 2**36µs (about 19 hours); anything slower lands in the last bucket
+MAX_BITS = 36
+BUCKET_COUNT = 2 * SUB_BUCKETS + (MAX_BITS - SUB_BITS - 1) * SUB_BUCKETS
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def bucket_index(value: int) -> int:
+    if value < 2 * SUB_BUCKETS:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BITS - 1
+    index = 2 * SUB_BUCKETS + (shift - 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+    return min(index, BUCKET_COUNT - 1)
+
+
+def bucket_upper(index: int) -> int:
+    """Largest value (µs) that falls into bucket `index`."""
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = (index - 2 * SUB_BUCKETS) // SUB_BUCKETS + 1
+    mantissa = (index - 2 * SUB_BUCKETS) % SUB_BUCKETS + SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Counts latencies (given in seconds) and answers percentile queries."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    def record(self, seconds: float) -> None:
+        value = int(seconds * 1_000_000)
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Latency in seconds below which `percent`% of the samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bucket_upper(index), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, mean, min, max and the usual percentiles, in milliseconds."""
+        summary = {
+            "count": self.count,
+            "mean": round(self.total / self.count / 1000, 3) if self.count else 0.0,
+            "min": round((self.min or 0) / 1000, 3),
+            "max": round(self.max / 1000, 3),
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent:g}".replace(".", "")] = round(self.percentile(percent) * 1000, 3)
+        return summary
+
+    def buckets(self) -> List[List[float]]:
+        """Non-empty buckets as `[upper bound in ms, count]` pairs."""
+        return [
+            [round(bucket_upper(index) / 1000, 3), n]
+            for index, n in enumerate(self.counts)
+            if n
+        ]
@@ -0,0 +1,184 @@
+import gzip
+import hashlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 512
+
+# Preferred encodings, best first
+ENCODINGS = ("br", "gzip")
+
+
+@lru_cache(maxsize=128)
+def accepted_encodings(accept_encoding: str) -> Tuple[str, ...]:
+    """
+    Parses an Accept-Encoding header into the encodings we can serve, best first.
+    Header values repeat across clients, so the result is memoized.
+    """
+    accepted = set()
+    refused = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        (accepted if q > 0 else refused).add(name.strip())
+    if "*" in accepted:
+        # The wildcard covers every encoding not refused by name
+        return tuple(e for e in ENCODINGS if e not in refused)
+    return tuple(e for e in ENCODINGS if e in accepted)
+
+
+def compress(content: bytes) -> Dict[str, bytes]:
+    """Returns the compressed variants of `content` that are actually smaller."""
+    variants = {}
+    if len(content) < MIN_COMPRESS_SIZE:
+        return variants
+    gz = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(gz) < len(content):
+        variants["gzip"] = gz
+    if brotli is not None:
+        br = brotli.compress(content, quality=11)
+        if len(br) < len(content):
+            variants["br"] = br
+    return variants
+
+
+def expose_header(headers: List[Tuple[bytes, bytes]], name: bytes) -> List[Tuple[bytes, bytes]]:
+    """
+    Returns `headers` with `name` listed in Access-Control-Expose-Headers,
+    merged into the value already there (e.g. from CORSMiddleware) rather
+    than sent as a second header.
+    """
+    for i, (key, value) in enumerate(headers):
+        if key == b"access-control-expose-headers":
+            listed = {item.strip().lower() for item in value.split(b",")}
+            if name.lower() in listed or b"*" in listed:
+                return headers
+            return headers[:i] + [(key, value + b", " + name)] + headers[i + 1:]
+    return headers + [(b"access-control-expose-headers", name)]
+
+
+def etag_matches(if_none_match: str, digest: str) -> bool:
+    """Checks an If-None-Match header against the digest shared by all variants."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag.split("-", 1)[0] == digest:
+            return True
+    return False
+
+
+class CachedBody:
+    """
+    A response body encoded once up front, with gzip/brotli variants and a strong ETag.
+    Header lists are precomputed per encoding so serving is a lookup.
+    """
+
+    def __init__(
+        self,
+        content: bytes,
+        media_type: str,
+        *,
+        status_code: int = 200,
+        cache_control: str = "no-cache",
+        variants: Optional[Dict[str, bytes]] = None,
+        digest: Optional[str] = None,
+    ):
+        self.media_type = media_type
+        self.status_code = status_code
+        self.cache_control = cache_control
+        self.digest = digest or hashlib.sha256(content).hexdigest()[:32]
+        self.variants = {"identity": content}
+        self.variants.update(compress(content) if variants is None else variants)
+        self.raw_headers = {
+            encoding: self._build_headers(encoding, body) for encoding, body in self.variants.items()
+        }
+        self.not_modified_headers = {
+            encoding: [h for h in headers if h[0] in (b"etag", b"cache-control", b"vary")]
+            for encoding, headers in self.raw_headers.items()
+        }
+
+    @property
+    def content(self) -> bytes:
+        return self.variants["identity"]
+
+    def etag(self, encoding: str) -> str:
+        # Each encoded representation gets its own strong validator
+        if encoding == "identity":
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def _build_headers(self, encoding: str, body: bytes) -> List[Tuple[bytes, bytes]]:
+        headers = [
+            (b"content-type", self.media_type.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"etag", self.etag(encoding).encode("latin-1")),
+            (b"cache-control", self.cache_control.encode("latin-1")),
+        ]
+        if len(self.variants) > 1:
+            headers.append((b"vary", b"Accept-Encoding"))
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+        return headers
+
+    def select(self, accept_encoding: str) -> str:
+        """Picks the best available encoding for an Accept-Encoding header."""
+        if accept_encoding and len(self.variants) > 1:
+            for encoding in accepted_encodings(accept_encoding):
+                if encoding in self.variants:
+                    return encoding
+        return "identity"
+
+    def resolve(self, accept_encoding: str, if_none_match: Optional[str]) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+        """Returns (status, raw headers, body), answering 304 when the client's copy is current."""
+        encoding = self.select(accept_encoding)
+        if self.status_code == 200 and if_none_match and etag_matches(if_none_match, self.digest):
+            return 304, self.not_modified_headers[encoding], b""
+        return self.status_code, self.raw_headers[encoding], self.variants[encoding]
+
+    def response(self, request: Request) -> Response:
+        """Builds the Starlette response for `request`."""
+        status_code, headers, body = self.resolve(
+            request.headers.get("accept-encoding", ""), request.headers.get("if-none-match")
+        )
+        response = Response(status_code=status_code)
+        response.body = body
+        response.raw_headers = list(headers)
+        return response
+
+    async def send(self, scope: Scope, send: Send) -> None:
+        """Sends the body straight over ASGI, without building Request/Response objects."""
+        status_code, headers, body = self.resolve(*request_validators(scope))
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+def request_validators(scope: Scope) -> Tuple[str, Optional[str]]:
+    """Pulls Accept-Encoding and If-None-Match out of raw ASGI headers."""
+    accept_encoding = ""
+    if_none_match = None
+    for name, value in scope["headers"]:
+        if name == b"accept-encoding":
+            accept_encoding = value.decode("latin-1")
+        elif name == b"if-none-match":
+            if_none_match = value.decode("latin-1")
+    return accept_encoding, if_none_match
@@ -0,0 +1,364 @@
+"""
+One OpenAPI document for a gateway and the FastAPI apps mounted under it.
+
+`AggregatedOpenAPI` replaces `app.openapi` with a builder that merges the
+host's own spec with the specs of its sources: FastAPI sub-applications found
+under `app.mount(...)` (recursively) and any apps listed explicitly, either as
+objects or as `"module:attr"` import paths. Paths are prefixed with the mount
+point, component names shared by identical definitions are merged, and
+conflicting ones are renamed after their source with every `$ref` rewritten.
+
+Each source's spec is memoized on its own fingerprint (its route table, or
+the stamp of its module file for import paths, re-read at most every
+`STAMP_TTL` seconds), so a change in one sub-app regenerates only that
+sub-app. Security requirements follow renamed security schemes, and relative
+OAuth2 flow URLs get the mount prefix. Sources that do need generating run in
+parallel on a thread pool: in-process apps directly, import paths in worker
+interpreters that import the app themselves, so heavy specs use more than
+one core.
+"""
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import re
+import threading
+import subprocess
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from fastapi import FastAPI
+from starlette.routing import Mount
+
+from .openapi import dumps, routes_fingerprint
+
+logger = logging.getLogger("FDocs")
+
+Source = Union[FastAPI, str]
+
+# Components that can be referenced with `#/components/<kind>/<name>`
+_REF = re.compile(r"^#/components/([^/]+)/(.+)$")
+
+# OAuth2 flow fields that hold URLs of the source app
+_FLOW_URLS = ("authorizationUrl", "tokenUrl", "refreshUrl")
+
+# How long a module file's stamp is trusted before the file is stat'ed again
+STAMP_TTL = 1.0
+
+
+def discover_apps(app: FastAPI, prefix: str = "") -> Dict[str, FastAPI]:
+    """FastAPI apps mounted under `app`, including nested mounts, by path prefix."""
+    found: Dict[str, FastAPI] = {}
+    for route in app.routes:
+        if isinstance(route, Mount) and isinstance(route.app, FastAPI):
+            path = prefix + route.path.rstrip("/")
+            found[path] = route.app
+            found.update(discover_apps(route.app, path))
+    return found
+
+
+def load_app(path: str) -> FastAPI:
+    """Imports the app at `"package.module:attr"`."""
+    module_name, _, attr = path.partition(":")
+    app: Any = importlib.import_module(module_name)
+    for name in (attr or "app").split("."):
+        app = getattr(app, name)
+    return app
+
+
+def _generate_from_path(path: str) -> Dict[str, Any]:
+    """
+    Generates the spec of `"module:attr"` in a fresh interpreter, which imports
+    the app itself. Unlike a multiprocessing pool, nothing of this process (its
+    `__main__`, its threads) is re-imported or forked into the worker.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    result = subprocess.run(
+        [sys.executable, "-m", __name__, path], capture_output=True, env=env, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode("utf-8", "replace").strip() or f"exit status {result.returncode}")
+    return json.loads(result.stdout)
+
+
+@lru_cache(maxsize=None)
+def _module_origin(module_name: str) -> Optional[str]:
+    spec = importlib.util.find_spec(module_name)
+    return spec.origin if spec is not None else None
+
+
+def _module_stamp(path: str) -> Hashable:
+    """Changes when the file defining the app's module does (not its imports)."""
+    origin = _module_origin(path.partition(":")[0])
+    try:
+        info = os.stat(origin) if origin else None
+    except OSError:
+        info = None
+    return (path, info.st_mtime_ns, info.st_size) if info is not None else path
+
+
+def _label(prefix: str) -> str:
+    """Component-name-safe label for a prefix, e.g. "/billing/v2" -> "billing_v2"."""
+    return re.sub(r"[^0-9A-Za-z]+", "_", prefix).strip("_") or "root"
+
+
+def _rewrite_refs(value: Any, renames: Dict[Tuple[str, str], str]) -> Any:
+    if isinstance(value, dict):
+        rewritten = {}
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str):
+                match = _REF.match(item)
+                if match and (match.group(1), match.group(2)) in renames:
+                    item = f"#/components/{match.group(1)}/{renames[(match.group(1), match.group(2))]}"
+            rewritten[key] = _rewrite_refs(item, renames)
+        return rewritten
+    if isinstance(value, list):
+        return [_rewrite_refs(item, renames) for item in value]
+    return value
+
+
+def _rewrite_security(spec: Dict[str, Any], renames: Dict[Tuple[str, str], str]) -> Dict[str, Any]:
+    """Renames security schemes in the operations' `security` requirements, which name them without a `$ref`."""
+
+    def rename(requirements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {renames.get(("securitySchemes", name), name): scopes for name, scopes in requirement.items()}
+            for requirement in requirements
+        ]
+
+    paths = {}
+    for path, item in (spec.get("paths") or {}).items():
+        paths[path] = {
+            method: dict(operation, security=rename(operation["security"]))
+            if isinstance(operation, dict) and isinstance(operation.get("security"), list) else operation
+            for method, operation in item.items()
+        }
+    return dict(spec, paths=paths)
+
+
+def _prefix_url(url: str, prefix: str) -> str:
+    """Keeps a URL of the source pointing at it once its spec is served from the host."""
+    if not url or urlsplit(url).scheme or url.startswith("//"):
+        return url
+    if url.startswith("/"):
+        return prefix + url
+    # Relative to the spec, which moves from under the prefix to the host's root
+    return f"{prefix.lstrip('/')}/{url}" if prefix else url
+
+
+def _prefix_oauth_urls(spec: Dict[str, Any], prefix: str) -> Dict[str, Any]:
+    """Copy of `spec` whose OAuth2 flows point at the source's endpoints under `prefix`."""
+    schemes = (spec.get("components") or {}).get("securitySchemes") or {}
+    if not prefix or not any(scheme.get("type") == "oauth2" for scheme in schemes.values()):
+        return spec
+    prefixed = {}
+    for name, scheme in schemes.items():
+        if scheme.get("type") == "oauth2":
+            flows = {
+                flow_name: {key: _prefix_url(value, prefix) if key in _FLOW_URLS else value for key, value in flow.items()}
+                for flow_name, flow in (scheme.get("flows") or {}).items()
+            }
+            scheme = dict(scheme, flows=flows)
+        prefixed[name] = scheme
+    return dict(spec, components=dict(spec["components"], securitySchemes=prefixed))
+
+
+def merge_specs(document: Dict[str, Any], sources: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Merges `(prefix, spec)` sources into a copy of `document`. The inputs are
+    not modified, so memoized specs can be merged again.
+    """
+    merged = dict(document)
+    paths: Dict[str, Dict[str, Any]] = {path: dict(item) for path, item in (document.get("paths") or {}).items()}
+    components: Dict[str, Dict[str, Any]] = {
+        kind: dict(entries) for kind, entries in (document.get("components") or {}).items()
+    }
+    tags = list(document.get("tags") or [])
+    tag_names = {tag.get("name") for tag in tags}
+    operation_ids = {
+        operation.get("operationId")
+        for item in paths.values()
+        for operation in item.values()
+        if isinstance(operation, dict)
+    }
+
+    for prefix, spec in sources:
+        label = _label(prefix)
+        # Before comparing components: the same relative URL means different endpoints per source
+        spec = _prefix_oauth_urls(spec, prefix)
+        renames: Dict[Tuple[str, str], str] = {}
+        for kind, entries in (spec.get("components") or {}).items():
+            existing = components.get(kind, {})
+            for name, value in entries.items():
+                if name in existing and existing[name] != value:
+                    new_name = f"{label}_{name}"
+                    while new_name in existing or new_name in entries or new_name in renames.values():
+                        new_name += "_"
+                    renames[(kind, name)] = new_name
+        if renames:
+            spec = _rewrite_refs(spec, renames)
+            if any(kind == "securitySchemes" for kind, _ in renames):
+                spec = _rewrite_security(spec, renames)
+
+        for kind, entries in (spec.get("components") or {}).items():
+            target = components.setdefault(kind, {})
+            for name, value in entries.items():
+                # Identical definitions (e.g. HTTPValidationError) are kept once
+                target.setdefault(renames.get((kind, name), name), value)
+
+        for path, item in (spec.get("paths") or {}).items():
+            merged_item = paths.setdefault(prefix + path, {})
+            for method, operation in item.items():
+                operation_id = operation.get("operationId") if isinstance(operation, dict) else None
+                if operation_id:
+                    if operation_id in operation_ids:
+                        operation = dict(operation, operationId=f"{label}_{operation_id}")
+                    operation_ids.add(operation["operationId"])
+                merged_item.setdefault(method, operation)
+
+        for tag in spec.get("tags") or []:
+            if tag.get("name") not in tag_names:
+                tag_names.add(tag.get("name"))
+                tags.append(tag)
+
+    if paths:
+        merged["paths"] = paths
+    if components:
+        merged["components"] = {
+            kind: dict(sorted(entries.items())) if kind == "schemas" else entries
+            for kind, entries in components.items()
+            if entries
+        }
+    if tags:
+        merged["tags"] = tags
+    return merged
+
+
+class AggregatedOpenAPI:
+    """
+    Drop-in replacement for `app.openapi` that merges the specs of mounted
+    and listed FastAPI apps into the host's.
+
+    Usage:
+        app.openapi = AggregatedOpenAPI(app, {"/billing": "billing.main:app"})
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        sources: Optional[Dict[str, Source]] = None,
+        *,
+        discover: bool = True,
+        max_workers: Optional[int] = None,
+    ):
+        self.app = app
+        # The host's own generator, e.g. FastAPI's or an `IncrementalOpenAPI`
+        self.base: Callable[[], Dict[str, Any]] = app.openapi
+        self.sources = {prefix.rstrip("/"): source for prefix, source in (sources or {}).items()}
+        self.discover = discover
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._lock = threading.Lock()
+        self._specs: Dict[str, Tuple[Hashable, Dict[str, Any]]] = {}
+        # Mounted apps and the route tables they were found with, walked again when one changes
+        self._discovered: Tuple[Tuple[Hashable, ...], Dict[str, FastAPI]] = ((), {})
+        # Module stamps of import paths and when they were taken
+        self._stamps: Dict[str, Tuple[float, Hashable]] = {}
+        # `fingerprint()` as of the spec memoized in `app.openapi_schema`
+        self._built: Optional[Tuple[Hashable, ...]] = None
+        # Counters, handy when checking how much work a rebuild did
+        self.sources_built = 0
+
+    def _route_tables(self, apps: Dict[str, FastAPI]) -> Tuple[Hashable, ...]:
+        return (routes_fingerprint(self.app),) + tuple(routes_fingerprint(app) for app in apps.values())
+
+    def discovered_apps(self) -> Dict[str, FastAPI]:
+        """`discover_apps(app)`, walked again only when the host's or a mounted app's routes change."""
+        route_tables, apps = self._discovered
+        if self._route_tables(apps) != route_tables:
+            apps = discover_apps(self.app)
+            self._discovered = (self._route_tables(apps), apps)
+        return apps
+
+    def current_sources(self) -> Dict[str, Source]:
+        sources: Dict[str, Source] = dict(self.discovered_apps()) if self.discover else {}
+        sources.update(self.sources)
+        return sources
+
+    def _key(self, source: Source) -> Hashable:
+        if isinstance(source, str):
+            now = time.monotonic()
+            stamp = self._stamps.get(source)
+            if stamp is None or now - stamp[0] >= STAMP_TTL:
+                stamp = self._stamps[source] = (now, _module_stamp(source))
+            return stamp[1]
+        return (id(source), routes_fingerprint(source))
+
+    def fingerprint(self) -> Tuple[Hashable, ...]:
+        """Identity of the host's and every source's routes; changes when any of them does."""
+        sources = self.current_sources()
+        return (routes_fingerprint(self.app),) + tuple(
+            (prefix, self._key(source)) for prefix, source in sorted(sources.items())
+        )
+
+    def __call__(self) -> Dict[str, Any]:
+        fingerprint = self.fingerprint()
+        if self.app.openapi_schema and fingerprint == self._built:
+            return self.app.openapi_schema
+        with self._lock:
+            self.app.openapi_schema = self.build()
+            self._built = fingerprint
+        return self.app.openapi_schema
+
+    @staticmethod
+    def _generate(app: FastAPI) -> Dict[str, Any]:
+        app.openapi_schema = None
+        return app.openapi()
+
+    def build(self) -> Dict[str, Any]:
+        """Merges the host's spec with every source's, generating only those that changed."""
+        sources = self.current_sources()
+        keys = {prefix: self._key(source) for prefix, source in sources.items()}
+        stale = {
+            prefix: source for prefix, source in sources.items()
+            if self._specs.get(prefix, (None,))[0] != keys[prefix]
+        }
+
+        futures: Dict[str, Future] = {}
+        # Import paths only wait on their subprocess here, so threads are enough to run them in parallel
+        threads = ThreadPoolExecutor(min(self.max_workers, len(stale)), "f-docs-openapi") if stale else None
+        try:
+            for prefix, source in stale.items():
+                generate = _generate_from_path if isinstance(source, str) else self._generate
+                futures[prefix] = threads.submit(generate, source)
+            # The host's spec is generated here, meanwhile
+            self.app.openapi_schema = None
+            document = self.base()
+            for prefix, future in futures.items():
+                try:
+                    self._specs[prefix] = (keys[prefix], future.result())
+                except Exception:
+                    # Left out of this build and retried on the next one
+                    logger.exception("F-Docs: could not generate the OpenAPI spec mounted at %s", prefix)
+                    self._specs.pop(prefix, None)
+                    continue
+                self.sources_built += 1
+        finally:
+            if threads is not None:
+                # What has not started yet is dropped (`cancel_futures` needs Python 3.9)
+                for future in futures.values():
+                    future.cancel()
+                threads.shutdown(wait=False)
+
+        # Forget sources that were unmounted
+        self._specs = {prefix: spec for prefix, spec in self._specs.items() if prefix in sources}
+        return merge_specs(document, [(prefix, self._specs[prefix][1]) for prefix in sorted(self._specs)])
+
+
+if __name__ == "__main__":
+    # Worker entry point of `_generate_from_path`: print the spec of sys.argv[1]
+    sys.stdout.buffer.write(dumps(load_app(sys.argv[1]).openapi()))
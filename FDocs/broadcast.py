@@ -0,0 +1,213 @@
+"""
+WebSocket broadcast hub with per-connection backpressure.
+
+Broadcasting with `for ws in connections: await ws.send_text(msg)` lets one
+slow client stall every other one, and a dead socket raises halfway through
+the loop. `BroadcastHub` instead gives each connection a bounded queue drained
+by its own sender task: a broadcast encodes the message once and only enqueues
+it, so fan-out never waits on a client. When a client's queue is full the
+hub either drops that client's oldest pending message or disconnects it.
+
+Personal messages go through the same queue, so they keep their order
+relative to broadcasts and never run two sends on one socket at once.
+
+Hubs are registered by name, which must be unique among live hubs;
+`f_docs(..., broadcast_metrics=True)` serves their counters for the
+WebSocket tester.
+"""
+import asyncio
+import json
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple, Union
+
+from starlette.websockets import WebSocket
+
+from ._histogram import LatencyHistogram
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+# Close code sent to clients evicted for falling behind ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+_hubs: "weakref.WeakValueDictionary[str, BroadcastHub]" = weakref.WeakValueDictionary()
+
+Frame = Tuple[Dict[str, Any], float]
+
+Message = Union[str, bytes, Dict[str, Any], list]
+
+
+def registered_hubs() -> Dict[str, "BroadcastHub"]:
+    """Live hubs by name."""
+    return dict(_hubs)
+
+
+def _encode(message: Message) -> Dict[str, Any]:
+    if isinstance(message, bytes):
+        return {"type": "websocket.send", "bytes": message}
+    if not isinstance(message, str):
+        message = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+    return {"type": "websocket.send", "text": message}
+
+
+class _Connection:
+    __slots__ = ("websocket", "queue", "task", "sent", "dropped")
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: "asyncio.Queue[Frame]" = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional["asyncio.Task[None]"] = None
+        self.sent = 0
+        self.dropped = 0
+
+
+class BroadcastHub:
+    """
+    Fans messages out to many WebSocket connections.
+
+    Usage:
+        hub = BroadcastHub("chat", queue_size=100, policy="drop_oldest")
+
+        @app.websocket("/ws/chat")
+        async def chat(websocket: WebSocket):
+            await hub.connect(websocket)
+            try:
+                while True:
+                    await hub.broadcast({"message": await websocket.receive_text()})
+            except WebSocketDisconnect:
+                hub.disconnect(websocket)
+    """
+
+    def __init__(self, name: str = "default", *, queue_size: int = 256, policy: str = DROP_OLDEST):
+        if policy not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"policy must be {DROP_OLDEST!r} or {DISCONNECT!r}, not {policy!r}")
+        if name in _hubs:
+            # Its counters would replace the other hub's in the metrics
+            raise ValueError(f"a BroadcastHub named {name!r} already exists")
+        self.name = name
+        self.queue_size = queue_size
+        self.policy = policy
+        self._connections: Dict[int, _Connection] = {}
+        self.started = time.time()
+        # Counters
+        self.broadcasts = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.send_errors = 0
+        self.peak_connections = 0
+        # Time from broadcast to the frame being handed to the server
+        self.delivery_latency = LatencyHistogram()
+        _hubs[name] = self
+
+    @property
+    def active_connections(self) -> int:
+        return len(self._connections)
+
+    async def connect(self, websocket: WebSocket, accept: bool = True) -> None:
+        """Accepts `websocket` (unless already accepted) and starts its sender."""
+        if accept:
+            await websocket.accept()
+        connection = _Connection(websocket, self.queue_size)
+        connection.task = asyncio.create_task(self._sender(connection))
+        self._connections[id(websocket)] = connection
+        self.peak_connections = max(self.peak_connections, len(self._connections))
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        """Forgets `websocket` and drops its pending messages. Safe to call twice."""
+        connection = self._connections.pop(id(websocket), None)
+        if connection is not None and connection.task is not None:
+            connection.task.cancel()
+
+    def _enqueue(self, connection: _Connection, item: Frame) -> bool:
+        """Queues `item` for `connection` under the hub's policy; False if it was evicted."""
+        queue = connection.queue
+        if queue.full():
+            if self.policy == DISCONNECT:
+                self._evict(connection)
+                return False
+            queue.get_nowait()
+            connection.dropped += 1
+            self.dropped += 1
+        queue.put_nowait(item)
+        return True
+
+    def publish(self, message: Message) -> int:
+        """
+        Encodes `message` once and queues it for every connection, without
+        waiting on any of them. Returns the number of recipients.
+        """
+        item = (_encode(message), time.perf_counter())
+        self.broadcasts += 1
+
+        recipients = 0
+        for connection in list(self._connections.values()):
+            if self._enqueue(connection, item):
+                recipients += 1
+        return recipients
+
+    async def broadcast(self, message: Message) -> int:
+        """Awaitable alias of `publish`, matching the usual ConnectionManager API."""
+        return self.publish(message)
+
+    async def send_personal_message(self, message: Message, websocket: WebSocket) -> bool:
+        """
+        Queues `message` for one connected `websocket`, behind what is already
+        queued for it. Returns False if the client was evicted instead.
+        """
+        connection = self._connections.get(id(websocket))
+        if connection is None:
+            raise ValueError("websocket is not connected to this hub")
+        return self._enqueue(connection, (_encode(message), time.perf_counter()))
+
+    def _evict(self, connection: _Connection) -> None:
+        self.disconnect(connection.websocket)
+        self.evicted += 1
+
+        async def close() -> None:
+            try:
+                await connection.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+            except Exception:
+                pass  # already gone
+
+        asyncio.get_running_loop().create_task(close())
+
+    async def _sender(self, connection: _Connection) -> None:
+        send = connection.websocket.send
+        queue = connection.queue
+        latency = self.delivery_latency
+        try:
+            while True:
+                frame, queued_at = await queue.get()
+                await send(frame)
+                latency.record(time.perf_counter() - queued_at)
+                connection.sent += 1
+                self.delivered += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Closed or broken socket: stop sending to it, leave others alone
+            self.send_errors += 1
+            self._connections.pop(id(connection.websocket), None)
+
+    def metrics(self) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        depths = [connection.queue.qsize() for connection in self._connections.values()]
+        return {
+            "name": self.name,
+            "policy": self.policy,
+            "queueSize": self.queue_size,
+            "connections": len(depths),
+            "peakConnections": self.peak_connections,
+            "broadcasts": self.broadcasts,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+            "sendErrors": self.send_errors,
+            "queued": sum(depths),
+            "maxQueued": max(depths, default=0),
+            "uptime": round(uptime, 3),
+            "deliveredPerSecond": round(self.delivered / uptime, 3) if uptime else 0.0,
+            "deliveryLatency": self.delivery_latency.summary(),
+        }
@@ -0,0 +1,825 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import unquote
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.routing import Route
+
+from ._http import CachedBody
+from .openapi import OpenAPICache, dumps
+from .static import PrecompressedStaticFiles
+
+# Get the path to the current file (package root)
+PACKAGE_ROOT = Path(__file__).parent
+DEFAULT_HTML_PATH = PACKAGE_ROOT / "dist" / "index.html"
+DEFAULT_ASSETS_PATH = PACKAGE_ROOT / "dist" / "assets"
+
+# Sent by the docs page with every request to an endpoint that runs requests
+DOCS_REQUEST_HEADER = "x-fdocs-request"
+
+# Values derived from the spec by name, built on first use (or at warm-up)
+Builders = Dict[str, Callable[[Dict[str, Any]], CachedBody]]
+
+
+def _render_docs_page(html_path: Path, config_data: dict) -> CachedBody:
+    """
+    Reads the UI template and injects the config, once.
+    The result is kept as pre-encoded bytes with compressed variants.
+    """
+    try:
+        html_content = html_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        html_content = f"<h1>Error</h1><p>Could not find {html_path}. Did you run 'npm run build'?</p>"
+        return CachedBody(
+            html_content.encode("utf-8"), "text/html; charset=utf-8", status_code=500, cache_control="no-store"
+        )
+
+    script_tag = f"<script>window.NEXUS_CONFIG = {json.dumps(config_data)};</script>"
+
+    # Inject before </head>
+    if "</head>" in html_content:
+        final_html = html_content.replace("</head>", f"{script_tag}</head>")
+    else:
+        final_html = script_tag + html_content
+
+    return CachedBody(final_html.encode("utf-8"), "text/html; charset=utf-8")
+
+
+def _remove_route(app: FastAPI, path: str) -> None:
+    """Drops plain routes registered at `path` (e.g. FastAPI's own openapi_url)."""
+    app.router.routes[:] = [
+        r for r in app.router.routes if not (isinstance(r, Route) and r.path == path)
+    ]
+
+
+def _add_root_path_server(app: FastAPI, request: Request) -> bool:
+    """Mirrors FastAPI's openapi route: advertise the ASGI root_path as a server."""
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    if not root_path or not app.root_path_in_servers:
+        return False
+    if any(server.get("url") == root_path for server in app.servers):
+        return False
+    app.servers.insert(0, {"url": root_path})
+    return True
+
+
+async def _derived_response(cache: OpenAPICache, request: Request, name: str, build: Callable[[Dict[str, Any]], CachedBody]) -> Response:
+    """Serves a value derived from the spec, building it off the event loop when needed."""
+    if not cache.is_ready(name):
+        await run_in_threadpool(cache.derive, name, build)
+    return cache.derive(name, build).response(request)
+
+
+def _reject_cross_site(request: Request) -> Optional[JSONResponse]:
+    """
+    Guards the endpoints that run requests with the caller's cookies and
+    credentials. They only accept JSON sent with `X-FDocs-Request`; a cross-site
+    form or fetch cannot send either without passing a CORS preflight.
+    """
+    content_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if content_type != "application/json":
+        return JSONResponse({"detail": "Expected application/json"}, status_code=415)
+    if DOCS_REQUEST_HEADER not in request.headers:
+        return JSONResponse({"detail": "Missing X-FDocs-Request header"}, status_code=403)
+    return None
+
+
+def is_docs_warm(app: FastAPI) -> bool:
+    """True once the spec has been generated by `f_docs(..., warm_openapi=True)`."""
+    cache = getattr(app.state, "f_docs_openapi", None)
+    return cache is not None and cache.warm.is_set()
+
+
+def _mount_assets(app: FastAPI, assets_path: Path, assets_url: str) -> Optional[PrecompressedStaticFiles]:
+    """Mounts the UI assets, loaded into memory with their .br/.gz siblings, if they exist."""
+    if not assets_path.exists():
+        return None
+    assets_app = PrecompressedStaticFiles(assets_path)
+    app.mount(assets_url, assets_app, name="f_docs_assets")
+    return assets_app
+
+
+def _install_openapi(
+    app: FastAPI,
+    openapi_url: str,
+    *,
+    cache_openapi: bool,
+    incremental_openapi: bool,
+    aggregate_openapi: bool,
+    openapi_sources: Optional[Dict[str, Any]],
+) -> OpenAPICache:
+    """Sets up the spec generator and its cache, optionally serving `openapi_url` from it."""
+    if incremental_openapi:
+        from .incremental import IncrementalOpenAPI
+
+        app.openapi = IncrementalOpenAPI(app)
+
+    aggregated = None
+    if aggregate_openapi or openapi_sources:
+        from .aggregate import AggregatedOpenAPI
+
+        aggregated = AggregatedOpenAPI(app, openapi_sources, discover=aggregate_openapi)
+        app.openapi = aggregated
+
+    openapi_cache = OpenAPICache(app, aggregated.fingerprint if aggregated is not None else None)
+    app.state.f_docs_openapi = openapi_cache
+
+    if cache_openapi:
+        _remove_route(app, openapi_url)
+
+        @app.get(openapi_url, include_in_schema=False)
+        async def f_docs_openapi(request: Request):
+            if _add_root_path_server(app, request):
+                openapi_cache.invalidate()
+            if openapi_cache.is_stale():
+                # Generating the schema is CPU-bound; keep it off the event loop
+                await run_in_threadpool(openapi_cache.get)
+            return openapi_cache.get().response(request)
+
+    return openapi_cache
+
+
+def _install_docs_index(app: FastAPI, openapi_cache: OpenAPICache, url: str, builders: Builders) -> None:
+    """Serves the pre-normalized docs index next to the docs page."""
+    from .docs_index import build_docs_index
+
+    def _build_index(schema: dict) -> CachedBody:
+        return CachedBody(dumps(build_docs_index(schema)), "application/json")
+
+    builders["docs_index"] = _build_index
+
+    @app.get(url, include_in_schema=False)
+    async def f_docs_index(request: Request):
+        return await _derived_response(openapi_cache, request, "docs_index", _build_index)
+
+
+def _install_chunks(app: FastAPI, openapi_cache: OpenAPICache, manifest_url: str, chunks_url: str, builders: Builders) -> None:
+    """Serves the tag manifest and per-tag chunks, each built on first use."""
+    from .docs_index import build_manifest, build_tag_chunk
+
+    def _build_manifest(schema: dict) -> CachedBody:
+        return CachedBody(dumps(build_manifest(schema)), "application/json")
+
+    builders["manifest"] = _build_manifest
+
+    @app.get(manifest_url, include_in_schema=False)
+    async def f_docs_manifest(request: Request):
+        return await _derived_response(openapi_cache, request, "manifest", _build_manifest)
+
+    def _chunk_tags(schema: dict) -> frozenset:
+        return frozenset(t["name"] for t in build_manifest(schema)["tags"])
+
+    @app.get(chunks_url + "/{name}.json", include_in_schema=False)
+    async def f_docs_chunk(request: Request, name: str):
+        # The file name of `chunk_file_name`, as in an exported site
+        tag = unquote(name)
+        # Only the spec's own tags get a chunk, so clients cannot grow the cache
+        if not openapi_cache.is_ready("chunk_tags"):
+            await run_in_threadpool(openapi_cache.derive, "chunk_tags", _chunk_tags)
+        if tag not in openapi_cache.derive("chunk_tags", _chunk_tags):
+            return JSONResponse({"detail": "Unknown tag"}, status_code=404)
+
+        def _build_chunk(schema: dict) -> CachedBody:
+            return CachedBody(dumps(build_tag_chunk(schema, tag)), "application/json")
+
+        return await _derived_response(openapi_cache, request, f"chunk:{tag}", _build_chunk)
+
+
+def _install_search(app: FastAPI, openapi_cache: OpenAPICache, url: str, builders: Builders) -> None:
+    """Serves the search index, versioned by the spec hash."""
+    from .search import build_search_index
+
+    def _build_search(schema: dict) -> CachedBody:
+        index = build_search_index(schema, version=openapi_cache.version)
+        return CachedBody(dumps(index), "application/json")
+
+    builders["search"] = _build_search
+
+    @app.get(url, include_in_schema=False)
+    async def f_docs_search(request: Request):
+        return await _derived_response(openapi_cache, request, "search", _build_search)
+
+
+def _install_live_updates(app: FastAPI, openapi_cache: OpenAPICache, url: str) -> None:
+    """Pushes spec diffs to open docs tabs."""
+    from fastapi.responses import StreamingResponse
+    from .live import SpecPublisher
+
+    publisher = SpecPublisher(openapi_cache)
+
+    @app.get(url, include_in_schema=False)
+    async def f_docs_events(request: Request):
+        return StreamingResponse(
+            publisher.stream(request),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
+def _install_warm_up(app: FastAPI, openapi_cache: OpenAPICache, ready_url: str, builders: Builders) -> None:
+    """Generates the spec and `builders` in the background at startup."""
+    from contextlib import asynccontextmanager
+
+    # Wraps the lifespan rather than adding a startup handler, which a
+    # `FastAPI(lifespan=...)` app never runs
+    lifespan_context = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def warm_lifespan(app: Any):
+        async with lifespan_context(app) as state:
+            # After the app's own startup, so routes it adds are in the spec
+            openapi_cache.warm_up(builders)
+            yield state
+
+    app.router.lifespan_context = warm_lifespan
+
+    @app.get(ready_url, include_in_schema=False)
+    async def f_docs_ready():
+        warm = openapi_cache.warm.is_set()
+        return JSONResponse({"warm": warm}, status_code=200 if warm else 503)
+
+
+def _install_execute(app: FastAPI, url: str, runner_urls: List[str]) -> None:
+    """Runs batches of "try it out" requests in-process."""
+    from .execute import MAX_BATCH_SIZE, execute_batch
+
+    @app.post(url, include_in_schema=False)
+    async def f_docs_execute(request: Request):
+        rejected = _reject_cross_site(request)
+        if rejected is not None:
+            return rejected
+        try:
+            payload = await request.json()
+        except ValueError:
+            return JSONResponse({"detail": "Invalid JSON"}, status_code=400)
+        items = payload.get("requests") if isinstance(payload, dict) else None
+        if not isinstance(items, list):
+            return JSONResponse({"detail": "Expected {\"requests\": [...]}"}, status_code=422)
+        if len(items) > MAX_BATCH_SIZE:
+            return JSONResponse({"detail": f"At most {MAX_BATCH_SIZE} requests per batch"}, status_code=413)
+        result = await execute_batch(app, request.scope, items, runner_urls)
+        return JSONResponse(result)
+
+
+def _install_load_testing(app: FastAPI, url: str, runner_urls: List[str], network_origin: Optional[str]) -> None:
+    """Load-tests a prepared request, streaming progress as NDJSON."""
+    from fastapi.responses import StreamingResponse
+    from . import _asgi
+    from .execute import decode_body, is_blocked
+    from .loadtest import MAX_CONCURRENCY, MAX_TOTAL, run_load_test
+
+    @app.post(url, include_in_schema=False)
+    async def f_docs_loadtest(request: Request):
+        rejected = _reject_cross_site(request)
+        if rejected is not None:
+            return rejected
+        try:
+            payload = await request.json()
+            item = payload["request"]
+            total = int(payload.get("total", 100))
+            concurrency = int(payload.get("concurrency", 10))
+            rps = float(payload["rps"]) if payload.get("rps") else None
+            mode = payload.get("mode", "asgi")
+            path = str(item.get("path") or "/")
+            target = _asgi.build_scope(request.scope, str(item.get("method") or "GET"), path)
+            # Checked here: once the stream has started, errors can no longer become a 422
+            decode_body(item)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return JSONResponse({"detail": "Expected a request object with a valid body and numeric total, concurrency and rps"}, status_code=422)
+        if not _asgi.is_origin_path(path):
+            # Over HTTP, an absolute URL would leave network_origin with the caller's credentials
+            return JSONResponse({"detail": "The request path must start with a single /"}, status_code=400)
+        if not (0 < total <= MAX_TOTAL and 0 < concurrency <= MAX_CONCURRENCY) or (rps is not None and rps <= 0):
+            return JSONResponse(
+                {"detail": f"total must be 1-{MAX_TOTAL}, concurrency 1-{MAX_CONCURRENCY}, rps positive"},
+                status_code=422,
+            )
+        if mode not in ("asgi", "http") or (mode == "http" and not network_origin) or is_blocked(target, runner_urls):
+            return JSONResponse({"detail": "Unsupported load test"}, status_code=422)
+
+        async def lines():
+            async for event in run_load_test(
+                app,
+                request.scope,
+                item,
+                total=total,
+                concurrency=concurrency,
+                rps=rps,
+                base_url=network_origin if mode == "http" else None,
+            ):
+                yield dumps(event) + b"\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
+
+def _install_route_metrics(app: FastAPI, url: str) -> None:
+    """Records per-route metrics and serves them at `url`."""
+    from .metrics import MetricsMiddleware, MetricsRegistry
+
+    registry = MetricsRegistry()
+    app.state.f_docs_metrics = registry
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @app.get(url, include_in_schema=False)
+    async def f_docs_metrics():
+        return JSONResponse(registry.snapshot(), headers={"Cache-Control": "no-store"})
+
+
+def _install_profiling(app: FastAPI, profile_token: str, profiles_url: str, docs_root: str) -> None:
+    """Profiles requests carrying `profile_token`, serving the results under `profiles_url`."""
+    import hmac
+    from .profiling import ProfileStore, ProfilingMiddleware
+
+    profiles = ProfileStore()
+    # The docs' own requests (the profile fetch carries the header too) are never profiled
+    docs_prefix = f"{docs_root}/" if docs_root else f"{profiles_url}/"
+    app.add_middleware(ProfilingMiddleware, token=profile_token, store=profiles, exclude=[docs_prefix])
+
+    @app.get(profiles_url + "/{profile_id}", include_in_schema=False)
+    async def f_docs_profile(request: Request, profile_id: str):
+        token = request.headers.get("x-fdocs-profile", "")
+        if not hmac.compare_digest(token.encode("latin-1"), profile_token.encode("latin-1")):
+            return JSONResponse({"detail": "Invalid profiling token"}, status_code=403)
+        profile = profiles.get(profile_id)
+        if profile is None:
+            return JSONResponse({"detail": "Profile not found"}, status_code=404)
+        return JSONResponse(profile.to_dict(), headers={"Cache-Control": "no-store"})
+
+
+def _install_server_timing(app: FastAPI) -> None:
+    """Breaks docs-initiated requests down with Server-Timing."""
+    from fastapi.routing import APIRoute
+
+    from .timing import ServerTimingMiddleware, ServerTimingRoute
+
+    app.add_middleware(ServerTimingMiddleware)
+    # Routes declared from here on get the full breakdown; a custom class is kept
+    if app.router.route_class is APIRoute:
+        app.router.route_class = ServerTimingRoute
+
+
+def _install_broadcast_metrics(app: FastAPI, url: str) -> None:
+    """Exposes the counters of every `BroadcastHub`."""
+    from .broadcast import registered_hubs
+
+    @app.get(url, include_in_schema=False)
+    async def f_docs_broadcast():
+        hubs = [hub.metrics() for hub in registered_hubs().values()]
+        return JSONResponse({"hubs": hubs}, headers={"Cache-Control": "no-store"})
+
+
+def _install_soak(app: FastAPI, url: str, network_origin: Optional[str]) -> None:
+    """Soak-tests a WebSocket route with many concurrent clients, streaming progress as NDJSON."""
+    from fastapi.responses import StreamingResponse
+    from . import _asgi
+    from .soak import DEFAULT_MESSAGE, MAX_CLIENTS, MAX_DURATION, MAX_RATE, ClientSlots, run_soak
+
+    # Shared by concurrent soaks, so together they stay under MAX_CLIENTS
+    soak_slots = ClientSlots(MAX_CLIENTS)
+
+    @app.post(url, include_in_schema=False)
+    async def f_docs_soak(request: Request):
+        rejected = _reject_cross_site(request)
+        if rejected is not None:
+            return rejected
+        try:
+            payload = await request.json()
+            path = str(payload["path"])
+            clients = int(payload.get("clients", 100))
+            duration = float(payload.get("duration", 10))
+            rate = float(payload.get("rate") or 0)
+            ramp_up = float(payload.get("rampUp") or 0)
+            message = str(payload.get("message") or DEFAULT_MESSAGE)
+            mode = payload.get("mode", "asgi")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return JSONResponse({"detail": "Expected a path and numeric clients, duration, rate and rampUp"}, status_code=422)
+        if not _asgi.is_origin_path(path):
+            return JSONResponse({"detail": "The path must start with a single /"}, status_code=400)
+        if not (0 < clients <= MAX_CLIENTS and 0 < duration and 0 <= ramp_up and ramp_up + duration <= MAX_DURATION and 0 <= rate <= MAX_RATE):
+            return JSONResponse(
+                {"detail": f"clients must be 1-{MAX_CLIENTS}, rampUp plus duration at most {MAX_DURATION:g}s, rate 0-{MAX_RATE:g}/s"},
+                status_code=422,
+            )
+        if mode not in ("asgi", "ws") or (mode == "ws" and not network_origin):
+            return JSONResponse({"detail": "Unsupported soak test"}, status_code=422)
+
+        async def lines():
+            async for event in run_soak(
+                app,
+                request.scope,
+                path,
+                clients=clients,
+                duration=duration,
+                rate=rate,
+                ramp_up=ramp_up,
+                message=message,
+                base_url=network_origin if mode == "ws" else None,
+                slots=soak_slots,
+            ):
+                yield dumps(event) + b"\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
+
+def _install_socketio(app: FastAPI, socketio_server: Any, url: str) -> None:
+    """Catalogs and instruments a Socket.IO server."""
+    from .sio import EmitStats, EventCatalog
+
+    catalog = EventCatalog(socketio_server)
+    emit_stats = EmitStats()
+    emit_stats.instrument(socketio_server)
+
+    @app.get(url, include_in_schema=False)
+    async def f_docs_socketio():
+        return JSONResponse(
+            {"namespaces": catalog.namespaces(), "emits": emit_stats.snapshot()},
+            headers={"Cache-Control": "no-store"},
+        )
+
+
+def _install_mcp_bench(app: FastAPI, url: str, bridge: Any, mcp_path: str) -> None:
+    """Benchmarks concurrent MCP tool calls against the bridge and the routes behind it."""
+    from fastapi.responses import StreamingResponse
+    from .execute import request_headers
+    from .mcpbench import MAX_CONCURRENCY, MAX_TOTAL, MAX_WEIGHT, run_mcp_benchmark
+
+    @app.post(url, include_in_schema=False)
+    async def f_docs_mcp_bench(request: Request):
+        rejected = _reject_cross_site(request)
+        if rejected is not None:
+            return rejected
+        try:
+            payload = await request.json()
+            calls = [
+                {"tool": str(call["tool"]), "arguments": dict(call.get("arguments") or {}), "weight": int(call.get("weight") or 1)}
+                for call in payload["calls"]
+            ]
+            total = int(payload.get("total", 100))
+            concurrency = int(payload.get("concurrency", 10))
+            compare_direct = bool(payload.get("compareDirect", True))
+            # The docs page's cookies and credentials are forwarded as for "try it out"
+            headers = request_headers({"headers": payload.get("headers")}, request.scope, b"")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return JSONResponse({"detail": "Expected calls of {tool, arguments, weight} and numeric total and concurrency"}, status_code=422)
+        if not (calls and 0 < total <= MAX_TOTAL and 0 < concurrency <= MAX_CONCURRENCY) or not all(0 < c["weight"] <= MAX_WEIGHT for c in calls):
+            return JSONResponse(
+                {"detail": f"At least one call; total must be 1-{MAX_TOTAL}, concurrency 1-{MAX_CONCURRENCY}, weights 1-{MAX_WEIGHT}"},
+                status_code=422,
+            )
+        await run_in_threadpool(bridge.sync)
+        tools = {tool.name for tool in bridge.server.tools}
+        unknown = sorted({c["tool"] for c in calls} - tools)
+        if unknown:
+            return JSONResponse({"detail": f"Unknown tools: {', '.join(unknown)}"}, status_code=422)
+
+        async def lines():
+            async for event in run_mcp_benchmark(
+                app,
+                request.scope,
+                mcp_path,
+                calls,
+                total=total,
+                concurrency=concurrency,
+                headers=headers,
+                operations=bridge.server.operation_map if compare_direct else None,
+            ):
+                yield dumps(event) + b"\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-cache"})
+
+
+def _install_fast_docs(
+    app: FastAPI,
+    openapi_cache: OpenAPICache,
+    builders: Builders,
+    fast_routes: Dict[str, Any],
+    derived_urls: Dict[str, str],
+    openapi_url: Optional[str],
+    assets: Dict[str, Any],
+) -> None:
+    """
+    Answers docs traffic ahead of the middleware stack: `fast_routes` as given,
+    the spec at `openapi_url` (when cached) and each built value of `builders`
+    at its URL in `derived_urls`.
+    """
+    from .dispatch import install_fast_path
+
+    def _derived_body(name: str):
+        # Not built yet: the regular route builds it off the event loop
+        return lambda scope: openapi_cache.derive(name, builders[name]) if openapi_cache.is_ready(name) else None
+
+    fast_routes = dict(fast_routes)
+    if openapi_url is not None:
+        def _spec_body(scope):
+            root_path = scope.get("root_path", "").rstrip("/")
+            # The regular route adds a root_path server first, or regenerates a stale spec off the event loop
+            if root_path and app.root_path_in_servers and not any(s.get("url") == root_path for s in app.servers):
+                return None
+            return None if openapi_cache.is_stale() else openapi_cache.get()
+
+        fast_routes[openapi_url] = _spec_body
+    for name, url in derived_urls.items():
+        if name in builders:
+            fast_routes[url] = _derived_body(name)
+    install_fast_path(app, fast_routes, assets)
+
+
+def f_docs(
+    app: FastAPI,
+    *,
+    docs_url: str = "/docs",
+    openapi_url: str = "/openapi.json",
+    title: str = "F-Docs",
+    html_path: str = None,
+    assets_path: str = None,
+    assets_url: str = "/assets",
+    cache_openapi: bool = False,
+    docs_index: bool = False,
+    lazy_chunks: bool = False,
+    search_index: bool = False,
+    live_updates: bool = False,
+    warm_openapi: bool = False,
+    incremental_openapi: bool = False,
+    execute_requests: bool = False,
+    load_testing: bool = False,
+    route_metrics: bool = False,
+    profile_token: Optional[str] = None,
+    server_timing: bool = False,
+    broadcast_metrics: bool = False,
+    websocket_soak: bool = False,
+    socketio_server: Any = None,
+    mcp_path: Optional[str] = None,
+    aggregate_openapi: bool = False,
+    openapi_sources: Optional[Dict[str, Any]] = None,
+    fast_docs: bool = False,
+    network_origin: Optional[str] = None
+) -> FastAPI:
+    """
+    Integrates F-Docs into a FastAPI application.
+
+    With `cache_openapi=True`, F-Docs takes over `openapi_url`: the spec is
+    serialized once (rebuilt when routes change) and served compressed with an
+    ETag, so repeat loads get a 304.
+
+    With `docs_index=True`, the normalized spec the UI renders is
+    built once on the server and served at `{docs_url}/index.json`, so browsers
+    skip parsing the OpenAPI document themselves.
+
+    With `lazy_chunks=True`, the UI first loads a manifest of tags and operation
+    summaries from `{docs_url}/manifest.json` and fetches each tag's endpoints
+    from `{docs_url}/chunks/<escaped tag>.json` only when it is expanded or
+    opened.
+
+    With `search_index=True`, an inverted index over paths,
+    summaries, descriptions, parameter names and schema properties is served
+    at `{docs_url}/search.json` for the sidebar search.
+
+    With `live_updates=True`, open docs tabs subscribe to `{docs_url}/events`
+    (server-sent events) and receive operation-level diffs whenever routes
+    are added or changed, patching their endpoint list in place.
+
+    With `warm_openapi=True`, the spec and the indexes above are generated in a
+    background thread at startup instead of on the first request. Readiness
+    probes can poll `{docs_url}/ready` (503 until warm) or call `is_docs_warm(app)`.
+
+    With `incremental_openapi=True`, `app.openapi` is replaced by a builder that
+    memoizes each route's fragment, so adding a route only generates that route.
+
+    With `execute_requests=True`, "try it out" calls are posted in batches to
+    `{docs_url}/execute` and run against the app in-process and concurrently,
+    returning responses with server-measured timings. The calls go through the
+    app's middleware but not the network; only enable it where the docs
+    themselves are trusted to reach every route. Only JSON posted with an
+    `X-FDocs-Request` header (as the docs page sends it) is accepted, so other
+    sites cannot drive it with a visitor's cookies.
+
+    With `load_testing=True`, an endpoint card can load-test its prepared request:
+    `{docs_url}/loadtest` drives N requests at a given concurrency (or rate)
+    in-process, or over HTTP against `network_origin` with `httpx`, and streams
+    throughput, error rate and latency percentiles as NDJSON.
+
+    With `route_metrics=True`, a lightweight middleware records request counts,
+    status classes and latency histograms per route. They are served at
+    `{docs_url}/metrics.json` and each operation in the sidebar shows its p99.
+    Call `f_docs` before the app starts so the middleware can be added.
+
+    With `profile_token` set, a request sent with `X-FDocs-Profile: <token>` is
+    profiled by a sampling thread; the collapsed stacks are fetched from
+    `{docs_url}/profiles/{id}` (same header) and rendered as a flame graph next
+    to the response. Other requests are not profiled and pay only a header check.
+
+    With `server_timing=True`, requests sent with `X-FDocs-Timing: 1` (as the
+    docs' own try-it calls are) get a `Server-Timing` header splitting their
+    time into routing, body reading, validation, dependencies, the endpoint
+    function and serialization, shown as a waterfall next to the response.
+    The last four need the route to be a `ServerTimingRoute`: it becomes the
+    app's default route class, so declare routes after `f_docs` or use
+    `APIRouter(route_class=ServerTimingRoute)`.
+
+    With `broadcast_metrics=True`, the counters of every `BroadcastHub`
+    (connections, queued, dropped and evicted messages, delivery latency) are
+    served at `{docs_url}/broadcast.json` and shown in the WebSocket tester.
+
+    With `websocket_soak=True`, the WebSocket tester can soak a route:
+    `{docs_url}/soak` opens up to thousands of concurrent in-process clients
+    (or real ones to `network_origin` with `websockets`), sends tagged messages
+    at a target rate and streams connect latency, round-trip percentiles and
+    drops as NDJSON. Clients open at once across concurrent soaks are capped
+    at `soak.MAX_CLIENTS`, and a run lasts at most `soak.MAX_DURATION`.
+
+    With `socketio_server` set to a `socketio.AsyncServer`, its handlers are
+    introspected into an event catalog (namespaces, arguments, sample payloads)
+    and its `emit` is wrapped to count messages, bytes and latency per event.
+    Both are served at `{docs_url}/socketio.json` for the Socket.IO tester.
+
+    With `mcp_path` set (e.g. "/mcp"), an MCP server (`fastapi-mcp`) is mounted
+    there once per app. Its tool catalog is derived from the cached spec and
+    rebuilt only when the spec changes, so routes added after `f_docs` are
+    picked up and `tools/list` does not re-convert the spec. The MCP tester
+    connects to it by default. Together with `load_testing=True`, it can also
+    benchmark a mix of tool calls at a given concurrency over in-process MCP
+    sessions, next to the same calls made to the routes directly
+    (`{docs_url}/mcp-bench`, streamed as NDJSON).
+
+    With `aggregate_openapi=True`, the spec also documents every FastAPI app
+    mounted under `app` (recursively), with paths prefixed by the mount point
+    and shared component schemas merged. `openapi_sources` adds apps that are
+    not mounted, as `{prefix: app}` or `{prefix: "module:attr"}`. Sub-app specs
+    are generated in parallel (import paths in worker processes) and each is
+    regenerated only when its own routes change.
+
+    With `fast_docs=True`, the docs page, its assets, the prebuilt indexes and
+    (with `cache_openapi`) the spec are answered by a raw ASGI dispatcher in
+    front of the app's middleware stack, from precomputed bodies and headers.
+    Those requests skip the app's middleware (CORS, auth, logging, metrics)
+    entirely, so only use it where the docs need none of it.
+
+    With `network_origin` set (e.g. "http://127.0.0.1:8000"), load tests and
+    WebSocket soaks can also run over the network, against that origin and no
+    other. The target is
+    never taken from the request, whose Host header the client controls.
+
+    Usage:
+        app = FastAPI()
+        app = f_docs(app)
+    """
+    # Use defaults if not provided
+    app.docs_url = None
+    actual_html_path = Path(html_path) if html_path else DEFAULT_HTML_PATH
+    actual_assets_path = Path(assets_path) if assets_path else DEFAULT_ASSETS_PATH
+
+    # 1. Mount Static Assets if they exist
+    assets_app = _mount_assets(app, actual_assets_path, assets_url)
+
+    docs_root = docs_url.rstrip("/")
+    docs_index_url = f"{docs_root}/index.json"
+    manifest_url = f"{docs_root}/manifest.json"
+    chunks_url = f"{docs_root}/chunks"
+    search_url = f"{docs_root}/search.json"
+    events_url = f"{docs_root}/events"
+    ready_url = f"{docs_root}/ready"
+    execute_url = f"{docs_root}/execute"
+    loadtest_url = f"{docs_root}/loadtest"
+    metrics_url = f"{docs_root}/metrics.json"
+    profiles_url = f"{docs_root}/profiles"
+    broadcast_url = f"{docs_root}/broadcast.json"
+    soak_url = f"{docs_root}/soak"
+    socketio_url = f"{docs_root}/socketio.json"
+    mcp_bench_url = f"{docs_root}/mcp-bench"
+    # Endpoints that run requests themselves, never the target of one
+    runner_urls = [execute_url, loadtest_url, soak_url, mcp_bench_url]
+
+    # 2. Render the docs page once; every hit is served from memory
+    config_data = {
+        "openApiUrl": openapi_url,
+        "title": title,
+    }
+    if docs_index:
+        config_data["docsIndexUrl"] = docs_index_url
+    if search_index:
+        config_data["searchIndexUrl"] = search_url
+    if live_updates:
+        config_data["eventsUrl"] = events_url
+    if lazy_chunks:
+        config_data["manifestUrl"] = manifest_url
+        config_data["chunksUrl"] = chunks_url
+    if execute_requests:
+        config_data["executeUrl"] = execute_url
+    if load_testing:
+        config_data["loadTestUrl"] = loadtest_url
+    if network_origin:
+        config_data["networkTests"] = True
+    if route_metrics:
+        config_data["metricsUrl"] = metrics_url
+    if profile_token:
+        config_data["profilesUrl"] = profiles_url
+    if server_timing:
+        config_data["serverTiming"] = True
+    if broadcast_metrics:
+        config_data["broadcastMetricsUrl"] = broadcast_url
+    if websocket_soak:
+        config_data["soakUrl"] = soak_url
+    if socketio_server is not None:
+        config_data["socketIoCatalogUrl"] = socketio_url
+    if mcp_path:
+        config_data["mcpUrl"] = mcp_path
+        if load_testing:
+            config_data["mcpBenchmarkUrl"] = mcp_bench_url
+    page = _render_docs_page(actual_html_path, config_data)
+
+    # 3. Define the Documentation Route
+    @app.get(docs_url, include_in_schema=False, response_class=HTMLResponse)
+    async def f_docs_ui(request: Request):
+        return page.response(request)
+
+    # 4. Optionally take over openapi_url with the cached spec
+    openapi_cache = _install_openapi(
+        app,
+        openapi_url,
+        cache_openapi=cache_openapi,
+        incremental_openapi=incremental_openapi,
+        aggregate_openapi=aggregate_openapi,
+        openapi_sources=openapi_sources,
+    )
+
+    builders: Builders = {}
+
+    # 5. Serve the pre-normalized docs index next to the docs page
+    if docs_index:
+        _install_docs_index(app, openapi_cache, docs_index_url, builders)
+
+    # 6. Serve the tag manifest and per-tag chunks, each built on first use
+    if lazy_chunks:
+        _install_chunks(app, openapi_cache, manifest_url, chunks_url, builders)
+
+    # 7. Serve the search index, versioned by the spec hash
+    if search_index:
+        _install_search(app, openapi_cache, search_url, builders)
+
+    # 8. Push spec diffs to open docs tabs
+    if live_updates:
+        _install_live_updates(app, openapi_cache, events_url)
+
+    # 9. Generate everything in the background at startup
+    if warm_openapi:
+        _install_warm_up(app, openapi_cache, ready_url, builders)
+
+    # 10. Run batches of "try it out" requests in-process
+    if execute_requests:
+        _install_execute(app, execute_url, runner_urls)
+
+    # 11. Load-test a prepared request, streaming progress as NDJSON
+    if load_testing:
+        _install_load_testing(app, loadtest_url, runner_urls, network_origin)
+
+    # 12. Record per-route metrics
+    if route_metrics:
+        _install_route_metrics(app, metrics_url)
+
+    # 13. Profile requests on demand
+    if profile_token:
+        _install_profiling(app, profile_token, profiles_url, docs_root)
+
+    # 14. Break docs-initiated requests down with Server-Timing
+    if server_timing:
+        _install_server_timing(app)
+
+    # 15. Expose WebSocket broadcast hub counters
+    if broadcast_metrics:
+        _install_broadcast_metrics(app, broadcast_url)
+
+    # 16. Soak-test a WebSocket route with many concurrent clients
+    if websocket_soak:
+        _install_soak(app, soak_url, network_origin)
+
+    # 17. Catalog and instrument a Socket.IO server
+    if socketio_server is not None:
+        _install_socketio(app, socketio_server, socketio_url)
+
+    # 18. Mount an MCP server whose tools follow the cached spec
+    if mcp_path:
+        from .mcp_bridge import mount_mcp
+
+        bridge = mount_mcp(app, openapi_cache, mcp_path)
+        builders["mcp"] = bridge._build
+
+        # 19. Benchmark concurrent MCP tool calls against the bridge and the routes behind it
+        if load_testing:
+            _install_mcp_bench(app, mcp_bench_url, bridge, mcp_path)
+
+    # 20. Answer docs traffic ahead of the middleware stack
+    if fast_docs:
+        _install_fast_docs(
+            app,
+            openapi_cache,
+            builders,
+            {docs_url: lambda scope: page},
+            {"docs_index": docs_index_url, "manifest": manifest_url, "search": search_url},
+            openapi_url if cache_openapi else None,
+            {assets_url.rstrip("/"): assets_app} if assets_app is not None else {},
+        )
+
+    return app
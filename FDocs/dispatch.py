@@ -0,0 +1,63 @@
+"""
+Docs fast path ahead of the app's middleware stack.
+
+Every request to the docs page, its assets or the spec otherwise passes
+through the host app's whole middleware chain (CORS, auth, logging, metrics)
+and router, only to return bytes that were built once. `DocsDispatcher` sits
+outside that chain: it matches the docs' own paths with a dict lookup (or a
+prefix check for assets) and sends the precomputed body and headers straight
+over ASGI, without Request or Response objects. Anything else, and any docs
+request it cannot answer from memory, goes on to the app as usual.
+"""
+from typing import Callable, Dict, Optional
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ._http import CachedBody
+from .static import _route_path
+
+# Returns the body to send for a request, or None to let the app handle it
+BodyGetter = Callable[[Scope], Optional[CachedBody]]
+
+
+class DocsDispatcher:
+    """Serves fixed docs paths and asset prefixes from memory, ahead of `app`."""
+
+    def __init__(self, app: ASGIApp, routes: Dict[str, BodyGetter], mounts: Dict[str, ASGIApp]):
+        self.app = app
+        self.routes = routes
+        self.mounts = mounts
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            path = _route_path(scope)
+            get_body = self.routes.get(path)
+            if get_body is not None:
+                body = get_body(scope)
+                if body is not None:
+                    await body.send(scope, send)
+                    return
+            else:
+                for prefix, mount in self.mounts.items():
+                    if path.startswith(prefix + "/"):
+                        # As a Mount would: the prefix moves into root_path
+                        child = dict(scope, root_path=scope.get("root_path", "") + prefix)
+                        await mount(child, receive, send)
+                        return
+        await self.app(scope, receive, send)
+
+
+def install_fast_path(app: FastAPI, routes: Dict[str, BodyGetter], mounts: Dict[str, ASGIApp]) -> None:
+    """Puts a `DocsDispatcher` outside the app's middleware stack, including `ServerErrorMiddleware`."""
+    if app.middleware_stack is not None:
+        # Already started: wrap the built stack in place
+        app.middleware_stack = DocsDispatcher(app.middleware_stack, routes, mounts)
+        return
+
+    build_middleware_stack = app.build_middleware_stack
+
+    def build_with_fast_path() -> ASGIApp:
+        return DocsDispatcher(build_middleware_stack(), routes, mounts)
+
+    app.build_middleware_stack = build_with_fast_path
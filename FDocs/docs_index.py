@@ -0,0 +1,363 @@
+"""
+Server-side counterpart of `frontend/services/openapiParser.ts`.
+
+`build_docs_index` turns an OpenAPI document into the normalized `ApiSpec`
+structure the UI renders (endpoints, tags, security schemes, examples with
+every `$ref` resolved), so browsers can load it directly instead of parsing
+the spec on the main thread. Keep the two implementations in step.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+HTTP_METHODS = ("get", "post", "put", "delete", "patch", "head", "options")
+
+# Fixed, so the index (and its ETag) is the same on every worker and every build
+EXAMPLE_DATE_TIME = "2024-01-01T00:00:00.000Z"
+
+
+def _truthy(value: Any) -> bool:
+    # JavaScript truthiness: empty objects and arrays are truthy, 0 and "" are not
+    if value is None or value is False or value == "":
+        return False
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value != 0
+    return True
+
+
+def _or(*values: Any) -> Any:
+    """JavaScript `a || b || ...`."""
+    for value in values:
+        if _truthy(value):
+            return value
+    return values[-1]
+
+
+def _pretty(value: Any) -> str:
+    """`JSON.stringify(value, null, 2)`."""
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def _compact(obj: Dict[str, Any]) -> Dict[str, Any]:
+    # JSON.stringify drops undefined members
+    return {k: v for k, v in obj.items() if v is not None}
+
+
+def resolve_ref(ref: str, spec: Dict[str, Any]) -> Any:
+    if not ref or not ref.startswith("#/"):
+        return {}
+    current: Any = spec
+    for part in ref.split("/")[1:]:
+        part = part.replace("~1", "/").replace("~0", "~")
+        current = current.get(part) if isinstance(current, dict) else None
+        if not _truthy(current):
+            return {}
+    return current
+
+
+def _deref(obj: Any, spec: Dict[str, Any]) -> Any:
+    if isinstance(obj, dict) and "$ref" in obj:
+        return resolve_ref(obj["$ref"], spec)
+    return obj if obj is not None else {}
+
+
+def generate_example(schema: Any, spec: Dict[str, Any], depth: int = 0) -> Any:
+    """Builds an example value for `schema`, following `$ref`s up to a fixed depth."""
+    if not isinstance(schema, dict):
+        return {}
+    if depth > 5:
+        return "possible_circular_ref"
+
+    if "$ref" in schema:
+        return generate_example(resolve_ref(schema["$ref"], spec), spec, depth + 1)
+
+    if "allOf" in schema:
+        combined: Dict[str, Any] = {}
+        for sub_schema in schema["allOf"]:
+            part = generate_example(sub_schema, spec, depth + 1)
+            if isinstance(part, dict):
+                combined.update(part)
+            elif isinstance(part, (str, list)):
+                combined.update((str(i), v) for i, v in enumerate(part))
+        return combined
+
+    # Check for default value first (before example)
+    if "default" in schema:
+        return schema["default"]
+
+    if _truthy(schema.get("example")):
+        return schema["example"]
+
+    schema_type = schema.get("type")
+    if schema_type == "object" or (not schema_type and _truthy(schema.get("properties"))):
+        return {
+            key: generate_example(prop, spec, depth + 1)
+            for key, prop in (schema.get("properties") or {}).items()
+        }
+
+    if schema_type == "array":
+        if _truthy(schema.get("items")):
+            return [generate_example(schema["items"], spec, depth + 1)]
+        return []
+
+    if schema_type == "string":
+        if schema.get("format") == "date-time":
+            return EXAMPLE_DATE_TIME
+        if schema.get("format") == "uuid":
+            return "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+        if schema.get("enum"):
+            return schema["enum"][0]
+        return "string"
+    if schema_type in ("number", "integer"):
+        return 0
+    if schema_type == "boolean":
+        return True
+
+    return {}
+
+
+def _status_code(code: str) -> int:
+    # parseInt(code) || 200
+    match = re.match(r"\s*[+-]?\d+", str(code))
+    value = int(match.group()) if match else 0
+    return value or 200
+
+
+def _base_url(spec: Dict[str, Any]) -> str:
+    servers = spec.get("servers") or []
+    if servers and isinstance(servers[0], dict) and servers[0].get("url"):
+        return servers[0]["url"]
+    if spec.get("host"):
+        scheme = (spec.get("schemes") or ["https"])[0]
+        return f"{scheme}://{spec['host']}{spec.get('basePath') or ''}"
+    # Relative to wherever the docs are served from; the UI resolves it
+    return ""
+
+
+def _parameters(all_params: List[Any], spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    parameters = []
+    for p in all_params:
+        param = _deref(p, spec)
+        # Keep only standard parameters, exclude body/formData
+        if param.get("in") not in ("query", "path", "header"):
+            continue
+        schema = param.get("schema") or {}
+        parameters.append(_compact({
+            "name": param.get("name"),
+            "in": param.get("in"),
+            "required": _or(param.get("required"), False),
+            "type": _or(schema.get("type"), param.get("type"), "string"),
+            "enum": _or(schema.get("enum"), param.get("enum")),
+            "description": param.get("description"),
+            "default": _or(schema.get("default"), param.get("default")),
+        }))
+    return parameters
+
+
+def _request_body(op: Dict[str, Any], all_params: List[Any], spec: Dict[str, Any]) -> Dict[str, Any]:
+    body_schema = ""
+    body_type = ""
+    body_properties: List[Dict[str, Any]] = []
+
+    # Strategy 1: OpenAPI 3.0 requestBody
+    if _truthy(op.get("requestBody")):
+        content = _deref(op["requestBody"], spec).get("content") or {}
+        # Find content type (prefer json or multipart)
+        content_type = next(
+            (t for t in content if "json" in t or "multipart" in t or "form-urlencoded" in t), None
+        )
+        if content_type:
+            body_type = content_type
+            schema = (content[content_type] or {}).get("schema") or {}
+            resolved = _deref(schema, spec)
+
+            # If multipart or form-urlencoded, extract properties for the form builder
+            if "multipart" in content_type or "form-urlencoded" in content_type:
+                required = resolved.get("required") or []
+                for key, prop in (resolved.get("properties") or {}).items():
+                    prop = _deref(prop, spec)
+                    body_properties.append(_compact({
+                        "name": key,
+                        "type": _or(prop.get("type"), "string"),
+                        "format": prop.get("format"),
+                        "description": prop.get("description"),
+                        "required": key in required,
+                    }))
+
+            body_schema = _pretty(generate_example(schema, spec))
+
+    # Strategy 2: Swagger 2.0 formData/body
+    else:
+        resolved_params = [_deref(p, spec) for p in all_params]
+        body_param = next((p for p in resolved_params if p.get("in") == "body"), None)
+        form_params = [p for p in resolved_params if p.get("in") == "formData"]
+
+        if body_param is not None:
+            body_type = "application/json"
+            body_schema = _pretty(generate_example(body_param.get("schema"), spec))
+        elif form_params:
+            body_type = "multipart/form-data"
+            body_schema = "{}"
+            body_properties = [
+                _compact({
+                    "name": p.get("name"),
+                    "type": _or(p.get("type"), "string"),
+                    # 'binary' or 'file' indicates file upload
+                    "format": p.get("format"),
+                    "description": p.get("description"),
+                    "required": p.get("required"),
+                })
+                for p in form_params
+            ]
+
+    return {
+        "requestBodySchema": body_schema,
+        "requestBodyType": body_type,
+        "requestBodyProperties": body_properties,
+    }
+
+
+def _responses(op: Dict[str, Any], spec: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    responses: Dict[int, Dict[str, Any]] = {}
+    for code, res in (op.get("responses") or {}).items():
+        res = _deref(res, spec)
+        example: Optional[str] = None
+        json_content = (res.get("content") or {}).get("application/json") or {}
+        # Strategy 1: OpenAPI 3.0 content.application/json.schema
+        if _truthy(json_content.get("schema")):
+            example = _pretty(generate_example(json_content["schema"], spec))
+        # Strategy 2: Swagger 2.0 schema property directly on response
+        elif _truthy(res.get("schema")):
+            example = _pretty(generate_example(res["schema"], spec))
+
+        responses[_status_code(code)] = _compact({
+            "description": _or(res.get("description"), "No description"),
+            "schema": example,
+        })
+    # Object keys come out in ascending numeric order, as in JavaScript
+    return {str(code): responses[code] for code in sorted(responses)}
+
+
+def build_endpoint(path: str, method: str, op: Dict[str, Any], path_item: Dict[str, Any], spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalizes one operation into the UI's `Endpoint` shape."""
+    all_params = list(op.get("parameters") or []) + list(path_item.get("parameters") or [])
+    # Endpoint level security overrides global
+    security = op["security"] if op.get("security") is not None else (spec.get("security") or [])
+    endpoint = {
+        "id": f"{method}-{path}",
+        "path": path,
+        "method": method.upper(),
+        "summary": _or(op.get("summary"), path),
+        "description": _or(op.get("description"), ""),
+        "tags": _or(op.get("tags"), ["Default"]),
+        "parameters": _parameters(all_params, spec),
+    }
+    endpoint.update(_request_body(op, all_params, spec))
+    endpoint["responses"] = _responses(op, spec)
+    endpoint["security"] = security
+    return endpoint
+
+
+def iter_operations(spec: Dict[str, Any]):
+    """Yields (path, method, operation, path_item) in document order."""
+    for path, path_item in (spec.get("paths") or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for method, op in path_item.items():
+            if method.lower() in HTTP_METHODS and isinstance(op, dict):
+                yield path, method, op, path_item
+
+
+def build_docs_index(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Produces the normalized `ApiSpec` for an OpenAPI (or Swagger 2.0) document."""
+    info = spec.get("info") or {}
+    tags = [
+        {"name": t.get("name"), "description": _or(t.get("description"), "")}
+        for t in (spec.get("tags") or [])
+    ]
+
+    endpoints = [
+        build_endpoint(path, method, op, path_item, spec)
+        for path, method, op, path_item in iter_operations(spec)
+    ]
+
+    known = {t["name"] for t in tags}
+    for endpoint in endpoints:
+        for tag_name in endpoint["tags"]:
+            if tag_name not in known:
+                known.add(tag_name)
+                tags.append({"name": tag_name, "description": ""})
+
+    # Support both OpenAPI 3.0 (components.securitySchemes) and Swagger 2.0 (securityDefinitions)
+    security_schemes = (spec.get("components") or {}).get("securitySchemes") or spec.get("securityDefinitions") or {}
+
+    return {
+        "title": _or(info.get("title"), "Unknown API"),
+        "version": _or(info.get("version"), "1.0.0"),
+        "baseUrl": _base_url(spec),
+        "endpoints": endpoints,
+        "tags": tags,
+        "securitySchemes": security_schemes,
+    }
+
+
+def build_manifest(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lightweight outline of the docs: tags plus one-line operation summaries.
+    Full endpoints are fetched per tag with `build_tag_chunk`, so the first
+    render does not pay for examples or schema resolution.
+    """
+    info = spec.get("info") or {}
+    tags = [
+        {"name": t.get("name"), "description": _or(t.get("description"), "")}
+        for t in (spec.get("tags") or [])
+    ]
+    known = {t["name"] for t in tags}
+
+    endpoints = []
+    for path, method, op, _ in iter_operations(spec):
+        op_tags = _or(op.get("tags"), ["Default"])
+        endpoints.append({
+            "id": f"{method}-{path}",
+            "path": path,
+            "method": method.upper(),
+            "summary": _or(op.get("summary"), path),
+            "tags": op_tags,
+        })
+        for tag_name in op_tags:
+            if tag_name not in known:
+                known.add(tag_name)
+                tags.append({"name": tag_name, "description": ""})
+
+    security_schemes = (spec.get("components") or {}).get("securitySchemes") or spec.get("securityDefinitions") or {}
+
+    return {
+        "title": _or(info.get("title"), "Unknown API"),
+        "version": _or(info.get("version"), "1.0.0"),
+        "baseUrl": _base_url(spec),
+        "endpoints": endpoints,
+        "tags": tags,
+        "securitySchemes": security_schemes,
+    }
+
+
+def chunk_file_name(tag: str) -> str:
+    """
+    File name of a tag's chunk: the tag as `encodeURIComponent` escapes it, so
+    "/" and dot segments never become directories. The UI escapes this name
+    once more in chunk URLs.
+    """
+    return quote(tag, safe="!*'()") + ".json"
+
+
+def build_tag_chunk(spec: Dict[str, Any], tag: str) -> Dict[str, Any]:
+    """Fully normalized endpoints for the operations carrying `tag`."""
+    return {
+        "tag": tag,
+        "endpoints": [
+            build_endpoint(path, method, op, path_item, spec)
+            for path, method, op, path_item in iter_operations(spec)
+            if tag in _or(op.get("tags"), ["Default"])
+        ],
+    }
@@ -0,0 +1,117 @@
+"""
+Batched "try it out" execution.
+
+The docs UI posts a batch of prepared requests to `{docs_url}/execute`; each
+one is run against the app in-process (see `_asgi`) and the batch runs
+concurrently, so exercising many endpoints costs a single round trip and the
+reported timings are measured on the server, without network or browser
+overhead.
+"""
+import asyncio
+import base64
+import binascii
+import posixpath
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from starlette.types import ASGIApp, Scope
+
+from . import _asgi
+from .static import _route_path
+
+# Upper bound on requests per batch and on how many run at once
+MAX_BATCH_SIZE = 100
+MAX_CONCURRENCY = 16
+
+# Headers of the docs page request that a same-origin fetch would also send
+FORWARDED_HEADERS = (b"cookie", b"authorization")
+
+
+def _error(message: str) -> Dict[str, Any]:
+    return {"status": 0, "headers": [], "body": "", "error": message, "elapsedMs": 0.0, "firstByteMs": 0.0}
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(body).decode("ascii"), "bodyEncoding": "base64"}
+
+
+def decode_body(item: Dict[str, Any]) -> bytes:
+    body = item.get("body")
+    if body is None:
+        return b""
+    if item.get("bodyEncoding") == "base64":
+        return base64.b64decode(body, validate=True)
+    return str(body).encode("utf-8")
+
+
+def request_headers(item: Dict[str, Any], base: Scope, body: bytes) -> _asgi.Headers:
+    """Headers of a batch item, plus the docs page's cookies and credentials unless overridden."""
+    headers = _asgi.header_list(item.get("headers") or {})
+    names = {name for name, _ in headers}
+    headers.extend(
+        (name, value) for name, value in base.get("headers", ())
+        if name in FORWARDED_HEADERS and name not in names
+    )
+    if body and b"content-length" not in names:
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    return headers
+
+
+def is_blocked(scope: Scope, blocked_paths: Iterable[str]) -> bool:
+    """
+    True if `scope` targets one of `blocked_paths`. The path is compared as the
+    router sees it (percent-decoded, past root_path), with repeated slashes,
+    dot segments and a trailing slash folded away.
+    """
+    path = posixpath.normpath(re.sub(r"/+", "/", _route_path(scope)))
+    return path in {posixpath.normpath(blocked) for blocked in blocked_paths}
+
+
+async def execute_one(
+    app: ASGIApp, base: Scope, item: Dict[str, Any], blocked_paths: List[str]
+) -> Dict[str, Any]:
+    """Runs one batch item and returns its JSON-ready result."""
+    if not isinstance(item, dict):
+        return _error("Each request must be an object")
+    method = str(item.get("method") or "GET")
+    target = str(item.get("path") or "/")
+    try:
+        body = decode_body(item)
+    except (binascii.Error, ValueError):
+        return _error("Invalid base64 body")
+
+    headers = request_headers(item, base, body)
+    scope = _asgi.build_scope(base, method, target, headers)
+    if is_blocked(scope, blocked_paths):
+        return _error("Requests to F-Docs' own endpoints cannot be batched")
+    result = await _asgi.call(app, scope, body)
+    response = {
+        "status": result.status,
+        "headers": [[name.decode("latin-1"), value.decode("latin-1")] for name, value in result.headers],
+        "elapsedMs": round(result.elapsed * 1000, 3),
+        "firstByteMs": round(result.first_byte * 1000, 3),
+    }
+    response.update(_encode_body(result.body))
+    return response
+
+
+async def execute_batch(
+    app: ASGIApp, base: Scope, items: List[Any], blocked_paths: List[str], concurrency: Optional[int] = None
+) -> Dict[str, Any]:
+    """Runs every item concurrently (bounded) and returns results in request order."""
+    semaphore = asyncio.Semaphore(concurrency or MAX_CONCURRENCY)
+
+    async def run(item: Any) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await execute_one(app, base, item, blocked_paths)
+            except Exception as exc:  # an app error must not sink the whole batch
+                return _error(f"{type(exc).__name__}: {exc}")
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(run(item) for item in items))
+    return {"responses": responses, "elapsedMs": round((time.perf_counter() - start) * 1000, 3)}
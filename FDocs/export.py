@@ -0,0 +1,125 @@
+"""
+Static export of the docs site.
+
+`export_site` renders everything the docs page would fetch from the app, once,
+into a directory that any static host or CDN can serve: `index.html` with the
+config baked in, the UI assets, the spec and the prebuilt indexes. The spec,
+the indexes, the chunk directory and the assets Vite content-hashed (see
+`static.is_hashed`) have hash-bearing names and can be cached forever;
+`index.html` and any other asset keep their names and should be revalidated.
+Each file is written with `.gz` (and `.br`, with `brotli` installed) siblings
+for servers that serve precompressed files (nginx `gzip_static`/`brotli_static`).
+
+Interactive server-side features (in-process execution, load tests, metrics,
+live updates) need the app and are left out; "try it out" requests go
+straight to the API, at `server_url` when the docs are hosted elsewhere.
+
+Usage:
+    python -m FDocs export myapp.main:app --output site/
+"""
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from fastapi import FastAPI
+
+from ._http import CachedBody
+from .openapi import OpenAPICache, dumps
+
+# Written next to each file for servers that look for precompressed siblings
+SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+# Asset URLs in the built index.html, e.g. src="/assets/index-Btr0A8ND.js"
+_ASSET_URL = re.compile(r'((?:src|href)=")/assets/')
+
+
+def _write(output: Path, name: str, body: CachedBody, written: List[str]) -> None:
+    path = output / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for encoding, content in body.variants.items():
+        target = path if encoding == "identity" else path.with_name(path.name + SUFFIXES[encoding])
+        target.write_bytes(content)
+        written.append(target.relative_to(output).as_posix())
+
+
+def _write_json(output: Path, stem: str, value: Any, written: List[str]) -> str:
+    """Writes `value` as `<stem>.<hash>.json` and returns that name."""
+    body = CachedBody(dumps(value), "application/json")
+    name = f"{stem}.{body.digest[:12]}.json"
+    _write(output, name, body, written)
+    return name
+
+
+def export_site(
+    app: FastAPI,
+    output: Union[str, Path],
+    *,
+    title: str = "F-Docs",
+    base_url: str = "",
+    server_url: Optional[str] = None,
+    docs_index: bool = True,
+    search_index: bool = True,
+    lazy_chunks: bool = False,
+    aggregate_openapi: bool = False,
+    html_path: Optional[str] = None,
+    assets_path: Optional[str] = None,
+) -> List[str]:
+    """
+    Writes the static docs site for `app` to `output` and returns the written
+    paths. `base_url` is where the site will be hosted (e.g. "/docs/" or a CDN
+    URL); by default URLs are relative to `index.html`.
+    """
+    from .core import DEFAULT_ASSETS_PATH, DEFAULT_HTML_PATH, _render_docs_page
+    from .docs_index import build_docs_index, build_manifest, build_tag_chunk, chunk_file_name
+    from .search import build_search_index
+    from .static import PrecompressedStaticFiles
+
+    if base_url and not base_url.endswith("/"):
+        base_url += "/"
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    written: List[str] = []
+
+    # The same spec the live docs would serve, from f_docs' own cache (as the app configured it, if it did);
+    # otherwise generated without installing anything on the app
+    cache = getattr(app.state, "f_docs_openapi", None)
+    if cache is not None:
+        spec = cache.schema
+    elif aggregate_openapi:
+        from .aggregate import AggregatedOpenAPI
+
+        spec = AggregatedOpenAPI(app).build()
+    else:
+        spec = OpenAPICache(app).schema
+    if server_url:
+        spec = dict(spec, servers=[{"url": server_url}])
+
+    spec_name = _write_json(output, "openapi", spec, written)
+    version = spec_name.split(".")[1]
+    config: Dict[str, Any] = {"openApiUrl": base_url + spec_name, "title": title}
+    if docs_index:
+        config["docsIndexUrl"] = base_url + _write_json(output, "index", build_docs_index(spec), written)
+    if search_index:
+        index = build_search_index(spec, version=version)
+        config["searchIndexUrl"] = base_url + _write_json(output, "search", index, written)
+    if lazy_chunks:
+        manifest = build_manifest(spec)
+        config["manifestUrl"] = base_url + _write_json(output, "manifest", manifest, written)
+        # One directory per spec version, so chunk URLs change with the spec too
+        chunks_dir = f"chunks.{version}"
+        for tag in manifest["tags"]:
+            body = CachedBody(dumps(build_tag_chunk(spec, tag["name"])), "application/json")
+            _write(output, f"{chunks_dir}/{chunk_file_name(tag['name'] or '')}", body, written)
+        config["chunksUrl"] = base_url + chunks_dir
+
+    actual_assets_path = Path(assets_path) if assets_path else DEFAULT_ASSETS_PATH
+    if actual_assets_path.exists():
+        for key, body in PrecompressedStaticFiles(actual_assets_path).files.items():
+            _write(output, "assets" + key, body, written)
+
+    page = _render_docs_page(Path(html_path) if html_path else DEFAULT_HTML_PATH, config)
+    if page.status_code != 200:
+        raise FileNotFoundError("The docs UI template is missing; build the frontend first")
+    html = _ASSET_URL.sub(lambda m: m.group(1) + base_url + "assets/", page.content.decode("utf-8"))
+    _write(output, "index.html", CachedBody(html.encode("utf-8"), "text/html; charset=utf-8"), written)
+    return written
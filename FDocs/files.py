@@ -0,0 +1,227 @@
+"""
+File download helpers for `/files`-style endpoints.
+
+`FileDownload` extends Starlette's `FileResponse`, which already answers
+`Range`/`If-Range` requests, sends ETag/Last-Modified from stat data and
+hands whole files to the server with `http.response.pathsend` when offered.
+It adds conditional requests (`If-None-Match`/`If-Modified-Since` get a 304
+without opening the file) and, when the server offers the
+`http.response.zerocopysend` extension, sends the whole file or a single
+range as one zero-copy message, parsing `Range` itself. Few servers offer
+that extension (uvicorn and Hypercorn do not); everywhere else the response
+is exactly `FileResponse`'s, reading the file in threadpool chunks.
+
+`DirectoryListing` caches a directory's entries until its mtime changes, so
+a listing endpoint costs one `stat` per call instead of a full scan.
+"""
+import os
+import stat
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+from ._http import etag_matches
+from .uploads import PARTIAL_SUFFIX
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+def _not_modified(scope: Scope, etag: str, mtime: float) -> bool:
+    if_none_match = if_modified_since = None
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            if_none_match = value.decode("latin-1")
+        elif name == b"if-modified-since":
+            if_modified_since = value.decode("latin-1")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+        return etag_matches(if_none_match, etag.strip('"'))
+    if if_modified_since is not None:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _single_range(value: str, size: int) -> Optional[Tuple[int, int]]:
+    """`(start, end)` of a satisfiable single-range `Range` value, else None."""
+    unit, _, spec = value.partition("=")
+    start, dash, end = spec.strip().partition("-")
+    if unit.strip().lower() != "bytes" or not dash:
+        return None
+    if start.isdigit() and (end.isdigit() or not end):
+        first, last = int(start), min(int(end) + 1, size) if end else size
+    elif not start and end.isdigit():
+        # Suffix range: the last `end` bytes
+        first, last = max(size - int(end), 0), size
+    else:
+        return None
+    return (first, last) if first < last else None
+
+
+class FileDownload(FileResponse):
+    """
+    A `FileResponse` with conditional requests and zero-copy sending.
+
+    Usage:
+        @app.get("/files/{filename}")
+        async def get_file(filename: str):
+            return await serve_file(UPLOAD_DIR, filename)
+    """
+
+    # Fewer, larger reads when falling back to the threadpool
+    chunk_size = 256 * 1024
+
+    def __init__(self, *args: Any, cache_control: str = "no-cache", **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.headers.setdefault("cache-control", cache_control)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            if self.stat_result is None:
+                # Stat here (not in FileResponse) so a 304 can be answered first
+                try:
+                    self.stat_result = await run_in_threadpool(os.stat, self.path)
+                except FileNotFoundError:
+                    raise RuntimeError(f"File at path {self.path} does not exist.")
+                self.set_stat_headers(self.stat_result)
+            if (
+                self.status_code == 200
+                and scope["method"] in ("GET", "HEAD")
+                and _not_modified(scope, self.headers["etag"], self.stat_result.st_mtime)
+            ):
+                headers = [(k, v) for k, v in self.raw_headers if k in (b"etag", b"last-modified", b"cache-control")]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            extensions = scope.get("extensions", {})
+            if ZEROCOPY_EXTENSION in extensions and self.status_code == 200 and scope["method"] == "GET":
+                span = self._zerocopy_span(scope, "http.response.pathsend" in extensions)
+                if span is not None:
+                    await self._zerocopy_send(send, *span)
+                    if self.background is not None:
+                        await self.background()
+                    return
+        await super().__call__(scope, receive, send)
+
+    def _zerocopy_span(self, scope: Scope, pathsend: bool) -> Optional[Tuple[int, int, int]]:
+        """
+        `(status, start, end)` to send zero-copy, or None for what `FileResponse`
+        answers itself: multiple, malformed or unsatisfiable ranges, and whole
+        files when the server also offers `pathsend`.
+        """
+        size = self.stat_result.st_size
+        http_range = if_range = None
+        for name, value in scope["headers"]:
+            if name == b"range":
+                http_range = value.decode("latin-1")
+            elif name == b"if-range":
+                if_range = value.decode("latin-1")
+        if if_range is not None and if_range not in (self.headers["etag"], self.headers["last-modified"]):
+            # The client's copy is outdated: the whole file, as if no Range was sent
+            http_range = None
+        if http_range is None:
+            return None if pathsend else (200, 0, size)
+        span = _single_range(http_range, size)
+        return (206, *span) if span is not None else None
+
+    async def _zerocopy_send(self, send: Send, status: int, start: int, end: int) -> None:
+        headers = [(k, v) for k, v in self.raw_headers if k not in (b"content-length", b"content-range")]
+        if status == 206:
+            headers.append((b"content-range", f"bytes {start}-{end - 1}/{self.stat_result.st_size}".encode("latin-1")))
+        headers.append((b"content-length", str(end - start).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        file = await run_in_threadpool(open, self.path, "rb")
+        try:
+            await send({
+                "type": ZEROCOPY_EXTENSION,
+                "file": file,
+                "offset": start,
+                "count": end - start,
+                "more_body": False,
+            })
+        finally:
+            await run_in_threadpool(file.close)
+
+
+def resolve_file(directory: Union[str, Path], filename: str) -> Path:
+    """`directory / filename`, refusing names that would escape `directory`."""
+    root = Path(directory).resolve()
+    path = (root / filename).resolve()
+    if path.parent != root and root not in path.parents:
+        raise HTTPException(status_code=404, detail="File not found")
+    return path
+
+
+async def serve_file(
+    directory: Union[str, Path],
+    filename: str,
+    *,
+    download_name: Optional[str] = None,
+    media_type: Optional[str] = None,
+    cache_control: str = "no-cache",
+) -> FileDownload:
+    """
+    Responds with `filename` from `directory`, or a 404 when it is missing,
+    not a regular file or outside `directory`.
+    """
+    path = resolve_file(directory, filename)
+    try:
+        stat_result = await run_in_threadpool(os.stat, path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="File not found")
+    return FileDownload(
+        path,
+        stat_result=stat_result,
+        filename=download_name,
+        media_type=media_type,
+        content_disposition_type="inline",
+        cache_control=cache_control,
+    )
+
+
+class DirectoryListing:
+    """
+    The regular files of a directory, rescanned only when its mtime changes.
+
+    Adding, removing or renaming a file updates the directory's mtime;
+    rewriting one in place does not, so sizes may lag until the next change
+    (uploads through `save_upload` are renamed into place and always show).
+    """
+
+    def __init__(self, directory: Union[str, Path], url_prefix: Optional[str] = None):
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix.rstrip("/") if url_prefix is not None else None
+        self._key: Optional[Tuple[int, int]] = None
+        self._entries: List[Dict[str, Any]] = []
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                # In-progress uploads (see `uploads.save_stream`) are not listed
+                if entry.name.endswith(PARTIAL_SUFFIX) or not entry.is_file():
+                    continue
+                info = entry.stat()
+                item: Dict[str, Any] = {"filename": entry.name, "size": info.st_size, "modified": info.st_mtime}
+                if self.url_prefix is not None:
+                    item["url"] = f"{self.url_prefix}/{entry.name}"
+                entries.append(item)
+        entries.sort(key=lambda item: item["filename"])
+        return entries
+
+    async def entries(self) -> List[Dict[str, Any]]:
+        info = await run_in_threadpool(os.stat, self.directory)
+        key = (info.st_mtime_ns, info.st_ino)
+        if key != self._key:
+            self._entries = await run_in_threadpool(self._scan)
+            self._key = key
+        return self._entries
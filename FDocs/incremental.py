@@ -0,0 +1,161 @@
+"""
+Incremental OpenAPI generation.
+
+FastAPI regenerates the whole document whenever it is asked for a fresh
+schema. `IncrementalOpenAPI` instead generates one fragment per route (paths
+plus the component schemas that route needs) with FastAPI's own
+`get_openapi`, memoizes it on the route's signature and model identity, and
+re-assembles the document from the fragments. After a route is added or
+replaced only that route's fragment is generated again.
+
+Component names are chosen per fragment, so a model that FastAPI would split
+into `Model-Input`/`Model-Output` because different routes use it in
+different modes may appear here as a single `Model`; every `$ref` still
+resolves. If two fragments disagree about a component (different models
+sharing a name) the document is generated in full, exactly as FastAPI would.
+The two routes are remembered, and while both are unchanged later builds go
+straight to the full generation instead of redoing the fragment pass.
+"""
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+
+def in_schema(route: BaseRoute) -> bool:
+    """Whether FastAPI would document `route` (plain Starlette routes and mounts are skipped)."""
+    if not getattr(route, "include_in_schema", True):
+        return False
+    return isinstance(route, APIRoute) or hasattr(route, "original_router")
+
+
+def route_key(route: BaseRoute) -> Hashable:
+    """Identity of everything that shapes a route's OpenAPI fragment."""
+    key: Tuple[Any, ...] = (
+        id(route),
+        type(route),
+        getattr(route, "path", None),
+        tuple(sorted(getattr(route, "methods", None) or ())),
+        id(getattr(route, "endpoint", None)),
+        id(getattr(route, "response_model", None)),
+        id(getattr(route, "body_field", None)),
+        getattr(route, "include_in_schema", True),
+        getattr(route, "operation_id", None),
+    )
+    # Routers kept nested by newer FastAPI versions carry their own change counter
+    original_router = getattr(route, "original_router", None)
+    if original_router is not None and hasattr(original_router, "_get_routes_version"):
+        key += (original_router._get_routes_version(),)
+    return key
+
+
+class IncrementalOpenAPI:
+    """
+    Drop-in replacement for `app.openapi` that memoizes per-route fragments.
+
+    Usage:
+        app.openapi = IncrementalOpenAPI(app)
+    """
+
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self._lock = threading.Lock()
+        self._fragments: Dict[Hashable, Dict[str, Any]] = {}
+        # Keys of the two routes whose fragments last disagreed about a component
+        self._conflict: Optional[Tuple[Hashable, Hashable]] = None
+        # Counters, handy when checking how much work a rebuild did
+        self.fragments_built = 0
+        self.full_builds = 0
+
+    def __call__(self) -> Dict[str, Any]:
+        if self.app.openapi_schema:
+            return self.app.openapi_schema
+        with self._lock:
+            self.app.openapi_schema = self.build()
+        return self.app.openapi_schema
+
+    def _generate(self, routes: List[BaseRoute], webhooks: Optional[List[BaseRoute]] = None) -> Dict[str, Any]:
+        app = self.app
+        return get_openapi(
+            title=app.title,
+            version=app.version,
+            openapi_version=app.openapi_version,
+            summary=getattr(app, "summary", None),
+            description=app.description,
+            terms_of_service=app.terms_of_service,
+            contact=app.contact,
+            license_info=app.license_info,
+            routes=routes,
+            webhooks=webhooks,
+            tags=app.openapi_tags,
+            servers=app.servers,
+            separate_input_output_schemas=app.separate_input_output_schemas,
+            **({"external_docs": app.openapi_external_docs} if hasattr(app, "openapi_external_docs") else {}),
+        )
+
+    def _fragment(self, route: BaseRoute, key: Hashable, fragments: Dict[Hashable, Dict[str, Any]]) -> Dict[str, Any]:
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            generated = self._generate([route])
+            fragment = {"paths": generated.get("paths", {}), "components": generated.get("components", {})}
+            self.fragments_built += 1
+        fragments[key] = fragment
+        return fragment
+
+    def build(self) -> Dict[str, Any]:
+        """Assembles the document, generating only fragments for new or changed routes."""
+        app = self.app
+        fragments: Dict[Hashable, Dict[str, Any]] = {}
+        webhooks = list(app.webhooks.routes) if getattr(app, "webhooks", None) else []
+        keys = [(route, route_key(route)) for route in app.routes if in_schema(route)]
+
+        # Fragments are fixed per key, so the same two routes would conflict again
+        if self._conflict is not None:
+            current = {key for _, key in keys}
+            if all(key in current for key in self._conflict):
+                return self._full_build(self._fragments, webhooks)
+            self._conflict = None
+
+        # Document skeleton: info, servers, tags and webhooks, without any paths
+        document = self._generate([], webhooks or None)
+
+        paths: Dict[str, Dict[str, Any]] = {}
+        components: Dict[str, Dict[str, Any]] = {}
+        # Route that contributed each component, None for the skeleton's own
+        owners: Dict[Tuple[str, str], Hashable] = {}
+        for name, entries in (document.get("components") or {}).items():
+            components[name] = dict(entries)
+
+        for route, key in keys:
+            fragment = self._fragment(route, key, fragments)
+            for path, item in fragment["paths"].items():
+                paths.setdefault(path, {}).update(item)
+            for kind, entries in fragment["components"].items():
+                merged = components.setdefault(kind, {})
+                for name, value in entries.items():
+                    if name in merged and merged[name] != value:
+                        self._conflict = (owners.get((kind, name)), key)
+                        return self._full_build({**self._fragments, **fragments}, webhooks)
+                    merged[name] = value
+                    owners.setdefault((kind, name), key)
+
+        # Drop fragments of routes that no longer exist
+        self._fragments = fragments
+
+        if paths:
+            document["paths"] = paths
+        if components:
+            document["components"] = {
+                kind: dict(sorted(entries.items())) if kind == "schemas" else entries
+                for kind, entries in components.items()
+                if entries
+            }
+        return document
+
+    def _full_build(self, fragments: Dict[Hashable, Dict[str, Any]], webhooks: List[BaseRoute]) -> Dict[str, Any]:
+        self._fragments = fragments
+        self.full_builds += 1
+        return self._generate(list(self.app.routes), webhooks or None)
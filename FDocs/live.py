@@ -0,0 +1,192 @@
+"""
+Operation-level diffs of the app's spec, pushed to open docs tabs over
+server-sent events.
+
+`SpecPublisher` remembers the last published spec. When the route table
+changes it computes which operations were added, removed or changed
+(including operations whose referenced component schemas changed) and
+publishes the normalized endpoints for just those operations.
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+from .docs_index import build_endpoint, build_manifest, iter_operations, resolve_ref
+from .openapi import OpenAPICache
+
+# How many diffs are kept for clients reconnecting with Last-Event-ID
+HISTORY_SIZE = 32
+
+KEEPALIVE_SECONDS = 15.0
+
+
+def _collect_refs(obj: Any, out: Set[str]) -> None:
+    if isinstance(obj, dict):
+        ref = obj.get("$ref")
+        if isinstance(ref, str):
+            out.add(ref)
+        for value in obj.values():
+            _collect_refs(value, out)
+    elif isinstance(obj, list):
+        for value in obj:
+            _collect_refs(value, out)
+
+
+def _closure(refs: Set[str], spec: Dict[str, Any], memo: Dict[str, Set[str]]) -> Set[str]:
+    """All refs reachable from `refs`, memoized per ref."""
+    reachable: Set[str] = set()
+    for ref in refs:
+        if ref not in memo:
+            memo[ref] = {ref}  # placeholder while recursive schemas are walked
+            direct: Set[str] = set()
+            _collect_refs(resolve_ref(ref, spec), direct)
+            memo[ref] = {ref} | _closure(direct, spec, memo)
+        reachable |= memo[ref]
+    return reachable
+
+
+def _components(spec: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        f"#/components/{kind}/{name}": value
+        for kind, entries in (spec.get("components") or {}).items()
+        if isinstance(entries, dict)
+        for name, value in entries.items()
+    }
+
+
+def diff_specs(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compares two OpenAPI documents operation by operation.
+    Added and changed operations are returned normalized, as the UI renders them.
+    """
+    old_components = _components(old)
+    new_components = _components(new)
+    changed_refs = {
+        ref for ref in old_components.keys() | new_components.keys()
+        if old_components.get(ref) != new_components.get(ref)
+    }
+
+    old_ops = {f"{method}-{path}": op for path, method, op, _ in iter_operations(old)}
+    memo: Dict[str, Set[str]] = {}
+    added: List[Dict[str, Any]] = []
+    changed: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+
+    for path, method, op, path_item in iter_operations(new):
+        endpoint_id = f"{method}-{path}"
+        seen.add(endpoint_id)
+        previous = old_ops.get(endpoint_id)
+        if previous is None:
+            added.append(build_endpoint(path, method, op, path_item, new))
+            continue
+        old_path_item = (old.get("paths") or {}).get(path) or {}
+        is_changed = previous != op or old_path_item.get("parameters") != path_item.get("parameters")
+        if not is_changed and changed_refs:
+            refs: Set[str] = set()
+            _collect_refs(op, refs)
+            is_changed = not changed_refs.isdisjoint(_closure(refs, new, memo))
+        if is_changed:
+            changed.append(build_endpoint(path, method, op, path_item, new))
+
+    manifest = build_manifest(new)
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": [endpoint_id for endpoint_id in old_ops if endpoint_id not in seen],
+        "components": sorted(ref.rsplit("/", 1)[-1] for ref in changed_refs),
+        "tags": manifest["tags"],
+        "securitySchemes": manifest["securitySchemes"],
+    }
+
+
+class SpecPublisher:
+    """
+    Tracks the last published spec and the recent diffs, shared by every
+    connected docs tab. Route changes are detected by polling the OpenAPI
+    cache, at most once per `interval` seconds whatever the number of clients.
+    """
+
+    def __init__(self, cache: OpenAPICache, interval: float = 1.0):
+        self.cache = cache
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last_poll = 0.0
+        self._version: Optional[str] = None
+        self._spec: Optional[Dict[str, Any]] = None
+        self.events: Deque[Tuple[str, str, Dict[str, Any]]] = deque(maxlen=HISTORY_SIZE)
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def poll(self) -> None:
+        """Publishes a diff if the spec changed since the last poll. Blocking."""
+        with self._lock:
+            now = time.monotonic()
+            if self._version is not None and now - self._last_poll < self.interval:
+                return
+            self._last_poll = now
+
+            version = self.cache.version
+            if version == self._version:
+                return
+            spec = self.cache.schema
+            if self._spec is not None:
+                diff = diff_specs(self._spec, spec)
+                diff["version"] = version
+                self.events.append((self._version, version, diff))
+            self._version = version
+            self._spec = spec
+
+    def events_since(self, version: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Diffs published after `version`; None if `version` is unknown and a full reload is needed."""
+        if version == self._version:
+            return []
+        events = list(self.events)
+        for i, (previous, _, _) in enumerate(events):
+            if previous == version:
+                return [diff for _, _, diff in events[i:]]
+        return None
+
+    async def stream(self, request: Request) -> AsyncIterator[str]:
+        """Server-sent events for one client."""
+        await run_in_threadpool(self.poll)
+        client_version = request.headers.get("last-event-id")
+        if client_version is None:
+            # Fresh connection: the tab has just loaded the current docs
+            client_version = self._version
+            yield _sse("hello", {"version": client_version}, client_version)
+
+        last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            if time.monotonic() - self._last_poll >= self.interval:
+                await run_in_threadpool(self.poll)
+
+            if client_version != self._version:
+                pending = self.events_since(client_version)
+                if pending is None:
+                    yield _sse("reload", {"version": self._version}, self._version)
+                else:
+                    for diff in pending:
+                        yield _sse("diff", diff, diff["version"])
+                client_version = self._version
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+
+            await asyncio.sleep(self.interval)
+
+
+def _sse(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,132 @@
+"""
+Load-test runner for a single prepared request.
+
+`run_load_test` drives `total` requests with `concurrency` workers, optionally
+paced to a target rate, and yields progress snapshots (throughput, error rate,
+latency percentiles) while it runs. Requests are dispatched in-process over
+ASGI by default; `base_url` sends them over HTTP instead (requires `httpx`).
+
+In-process runs share the server's event loop, so they measure the app and
+its middleware, not the network or the ASGI server.
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from starlette.types import ASGIApp, Scope
+
+from . import _asgi
+from ._histogram import LatencyHistogram
+from .execute import decode_body, request_headers
+
+MAX_TOTAL = 100_000
+MAX_CONCURRENCY = 256
+
+PROGRESS_INTERVAL = 0.5
+
+
+class LoadTestStats:
+    """Shared by all workers of one run; only touched from the event loop."""
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.completed = 0
+        self.started = time.perf_counter()
+
+    def add(self, status: int, elapsed: float) -> None:
+        self.completed += 1
+        self.latency.record(elapsed)
+        key = str(status) if status else "failed"
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if not status or status >= 400:
+            self.errors += 1
+
+    def snapshot(self, total: int) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "completed": self.completed,
+            "total": total,
+            "elapsed": round(elapsed, 3),
+            "throughput": round(self.completed / elapsed, 1) if elapsed else 0.0,
+            "errorRate": round(self.errors / self.completed, 4) if self.completed else 0.0,
+            "statuses": dict(self.statuses),
+            "latency": self.latency.summary(),
+        }
+
+
+async def run_load_test(
+    app: ASGIApp,
+    base: Scope,
+    item: Dict[str, Any],
+    *,
+    total: int,
+    concurrency: int,
+    rps: Optional[float] = None,
+    base_url: Optional[str] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Runs the load test, yielding `{"type": "progress", ...}` snapshots and a
+    final `{"type": "result", ...}` that also carries the latency histogram.
+    `item` is a request in the batch format of `execute`; its body must be valid.
+    """
+    method = str(item.get("method") or "GET").upper()
+    target = str(item.get("path") or "/")
+    body = decode_body(item)
+    headers = request_headers(item, base, body)
+
+    stats = LoadTestStats()
+    issued = 0
+
+    client = None
+    if base_url is not None:
+        import httpx  # optional: only needed to test over the network
+
+        # An absolute target would make httpx ignore the origin
+        if not _asgi.is_origin_path(target):
+            raise ValueError(f"Not a path on {base_url}: {target!r}")
+        url = base_url.rstrip("/") + target
+        client = httpx.AsyncClient(timeout=None)
+        http_headers = [(name.decode("latin-1"), value.decode("latin-1")) for name, value in headers]
+
+    async def send_one() -> None:
+        start = time.perf_counter()
+        try:
+            if client is not None:
+                response = await client.request(method, url, headers=http_headers, content=body)
+                status = response.status_code
+            else:
+                scope = _asgi.build_scope(base, method, target, headers)
+                status = (await _asgi.call(app, scope, body)).status
+        except Exception:
+            status = 0
+        stats.add(status, time.perf_counter() - start)
+
+    async def worker() -> None:
+        nonlocal issued
+        while issued < total:
+            sequence = issued
+            issued += 1
+            if rps:
+                # Open-loop pacing: request n is due n/rps seconds after the start
+                delay = stats.started + sequence / rps - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await send_one()
+
+    stats.started = time.perf_counter()
+    workers = asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    try:
+        while not workers.done():
+            await asyncio.wait({workers}, timeout=progress_interval)
+            if not workers.done():
+                yield {"type": "progress", **stats.snapshot(total)}
+        workers.result()
+    finally:
+        workers.cancel()
+        if client is not None:
+            await client.aclose()
+
+    yield {"type": "result", **stats.snapshot(total), "histogram": stats.latency.buckets()}
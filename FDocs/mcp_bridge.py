@@ -0,0 +1,107 @@
+"""
+MCP server backed by the cached OpenAPI spec.
+
+`fastapi_mcp.FastApiMCP` converts the app's routes into MCP tools when it is
+constructed, and never again: routes added later are missing, and building a
+second instance (or mounting twice) repeats the whole conversion. `MCPBridge`
+wraps one instance per app and takes its tool catalog from `OpenAPICache`:
+the conversion is memoized next to the spec, so it reruns only when the spec
+hash changes, and `tools/list` is a memory read in between. A raw ASGI
+middleware brings the catalog up to date before each MCP request.
+
+Requires `fastapi-mcp`.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .openapi import OpenAPICache, routes_fingerprint
+
+logger = logging.getLogger("FDocs")
+
+Catalog = Tuple[List[Any], Dict[str, Any]]
+
+
+class MCPBridge:
+    """A `FastApiMCP` server whose tools follow the app's cached spec."""
+
+    def __init__(self, app: FastAPI, cache: OpenAPICache, mount_path: str = "/mcp", **options: Any):
+        from fastapi_mcp import FastApiMCP
+
+        self.app = app
+        self.cache = cache
+        self.mount_path = mount_path
+        self.server = FastApiMCP(app, **options)
+        # What the constructor converted; reused if the routes are unchanged by the first request
+        self._initial: Optional[Catalog] = (self.server.tools, self.server.operation_map)
+        self._initial_fingerprint: Optional[Tuple[int, ...]] = None
+        self._catalog: Optional[Catalog] = None
+
+    def _build(self, schema: Dict[str, Any]) -> Catalog:
+        initial, self._initial = self._initial, None
+        if initial is not None and routes_fingerprint(self.app) == self._initial_fingerprint:
+            return initial
+        from fastapi_mcp.openapi.convert import convert_openapi_to_mcp_tools
+
+        server = self.server
+        tools, operation_map = convert_openapi_to_mcp_tools(
+            schema,
+            describe_all_responses=getattr(server, "_describe_all_responses", False),
+            describe_full_response_schema=getattr(server, "_describe_full_response_schema", False),
+        )
+        logger.info("F-Docs: rebuilt the MCP catalog (%d tools)", len(tools))
+        return server._filter_tools(tools, schema), operation_map
+
+    def sync(self) -> None:
+        """Points the server at the catalog of the current spec. Blocking when it must be rebuilt."""
+        catalog = self.cache.derive("mcp", self._build)
+        if catalog is not self._catalog:
+            self.server.tools, self.server.operation_map = catalog
+            self._catalog = catalog
+
+    def mount(self) -> None:
+        self.server.mount_http(mount_path=self.mount_path)
+        # The MCP route itself is not a tool; only later routes invalidate the initial catalog
+        self._initial_fingerprint = routes_fingerprint(self.app)
+
+
+def mount_mcp(app: FastAPI, cache: OpenAPICache, mount_path: str = "/mcp", **options: Any) -> MCPBridge:
+    """
+    Mounts an MCP server at `mount_path`, once per app. Calling it again
+    returns the existing bridge; a route already at `mount_path` that F-Docs
+    did not mount is an error rather than a second server.
+    """
+    bridge: Optional[MCPBridge] = getattr(app.state, "f_docs_mcp", None)
+    if bridge is not None:
+        if bridge.mount_path != mount_path:
+            raise RuntimeError(f"An MCP server is already mounted at {bridge.mount_path}")
+        return bridge
+    if any(getattr(route, "path", None) == mount_path for route in app.router.routes):
+        raise RuntimeError(f"{mount_path} is already routed; mount the MCP server once, through f_docs")
+
+    bridge = MCPBridge(app, cache, mount_path, **options)
+    bridge.mount()
+    app.add_middleware(MCPCatalogMiddleware, bridge=bridge)
+    app.state.f_docs_mcp = bridge
+    return bridge
+
+
+class MCPCatalogMiddleware:
+    """Refreshes the MCP catalog before requests to the MCP endpoint when the spec changed."""
+
+    def __init__(self, app: ASGIApp, bridge: MCPBridge):
+        self.app = app
+        self.bridge = bridge
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope["path"] if scope["type"] == "http" else ""
+        mount_path = self.bridge.mount_path
+        if path == mount_path or path.startswith(mount_path + "/"):
+            if self.bridge.cache.is_ready("mcp"):
+                self.bridge.sync()  # a dict lookup
+            else:
+                await run_in_threadpool(self.bridge.sync)
+        await self.app(scope, receive, send)
@@ -0,0 +1,309 @@
+"""
+Concurrent MCP tool-call benchmark.
+
+`run_mcp_benchmark` fires `tools/call` requests at the mounted MCP endpoint
+with `concurrency` workers, each holding its own MCP session like a separate
+agent, and yields progress snapshots with latency percentiles, error rates and
+payload sizes per tool. Requests are dispatched in-process over ASGI, so they
+go through the app's middleware and the MCP transport but not the network.
+
+Given the tools' operations, every call is also made straight to the route
+behind the tool, interleaved with the MCP calls so both see the same load. The
+difference between the two is the bridge's overhead: JSON-RPC framing, session
+handling and the tool's own HTTP hop back into the app.
+"""
+import asyncio
+import itertools
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from starlette.types import ASGIApp, Scope
+
+from . import _asgi
+from ._histogram import LatencyHistogram
+from .openapi import dumps
+
+MAX_TOTAL = 100_000
+MAX_CONCURRENCY = 256
+MAX_WEIGHT = 100
+
+PROGRESS_INTERVAL = 0.5
+
+PROTOCOL_VERSION = "2025-03-26"
+ACCEPT = b"application/json, text/event-stream"
+
+
+class MCPSessionError(Exception):
+    """The MCP endpoint refused to open a session."""
+
+
+def _header(result: _asgi.ASGIResult, name: bytes) -> Optional[bytes]:
+    for key, value in result.headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def rpc_response(result: _asgi.ASGIResult, request_id: int) -> Optional[Dict[str, Any]]:
+    """The JSON-RPC response to `request_id` in a JSON or SSE body, if any."""
+    content_type = (_header(result, b"content-type") or b"").decode("latin-1")
+    if content_type.startswith("text/event-stream"):
+        messages = []
+        for line in result.body.decode("utf-8", "replace").splitlines():
+            if line.startswith("data:"):
+                try:
+                    messages.append(json.loads(line[5:]))
+                except ValueError:
+                    continue
+    else:
+        try:
+            decoded = json.loads(result.body)
+        except ValueError:
+            return None
+        messages = decoded if isinstance(decoded, list) else [decoded]
+    for message in messages:
+        if isinstance(message, dict) and message.get("id") == request_id:
+            return message
+    return None
+
+
+class MCPSession:
+    """One in-process MCP client session over the streamable HTTP transport."""
+
+    def __init__(self, app: ASGIApp, base: Scope, mount_path: str, headers: _asgi.Headers):
+        self.app = app
+        self.base = base
+        self.mount_path = mount_path
+        self.headers = headers
+        self.session_id: Optional[bytes] = None
+        self._ids = itertools.count(1)
+
+    def _scope(self, method: str, body: bytes) -> Scope:
+        headers = list(self.headers)
+        headers.append((b"accept", ACCEPT))
+        if body:
+            headers.append((b"content-type", b"application/json"))
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        if self.session_id is not None:
+            headers.append((b"mcp-session-id", self.session_id))
+            headers.append((b"mcp-protocol-version", PROTOCOL_VERSION.encode("latin-1")))
+        return _asgi.build_scope(self.base, method, self.mount_path, headers)
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Tuple[_asgi.ASGIResult, Optional[Dict[str, Any]], int]:
+        """Sends a JSON-RPC request; returns the raw result, its response and the request size."""
+        request_id = next(self._ids)
+        body = dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        result = await _asgi.call(self.app, self._scope("POST", body), body)
+        return result, rpc_response(result, request_id), len(body)
+
+    async def open(self) -> None:
+        result, response, _ = await self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "f-docs-benchmark", "version": "1.0"},
+        })
+        if result.status >= 400 or response is None or "error" in response:
+            raise MCPSessionError(f"initialize failed with status {result.status}")
+        self.session_id = _header(result, b"mcp-session-id")
+        body = dumps({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        await _asgi.call(self.app, self._scope("POST", body), body)
+
+    async def close(self) -> None:
+        if self.session_id is not None:
+            session_id, self.session_id = self.session_id, None
+            scope = self._scope("DELETE", b"")
+            scope["headers"].append((b"mcp-session-id", session_id))
+            try:
+                await _asgi.call(self.app, scope)
+            except Exception:
+                pass  # the server drops idle sessions anyway
+
+
+def direct_request(operation: Dict[str, Any], arguments: Dict[str, Any]) -> Tuple[str, str, _asgi.Headers, bytes]:
+    """
+    The route request behind a tool call, split the way `fastapi-mcp` does:
+    path, query and header parameters by name, the remaining arguments as
+    the JSON body.
+    """
+    path = str(operation["path"])
+    arguments = dict(arguments)
+    query: List[Tuple[str, Any]] = []
+    headers: _asgi.Headers = []
+    for parameter in operation.get("parameters") or []:
+        name = parameter.get("name")
+        if name not in arguments:
+            continue
+        value = arguments.pop(name)
+        location = parameter.get("in")
+        if location == "path":
+            path = path.replace("{%s}" % name, quote(str(value), safe=""))
+        elif location == "query":
+            if isinstance(value, list):
+                query.extend((name, item) for item in value)
+            else:
+                query.append((name, value))
+        elif location == "header":
+            headers.append((name.lower().encode("latin-1"), str(value).encode("latin-1")))
+    body = dumps(arguments) if arguments else b""
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    target = f"{path}?{urlencode(query)}" if query else path
+    return str(operation.get("method", "get")).upper(), target, headers, body
+
+
+class _ToolCounters:
+    __slots__ = ("tool", "via", "calls", "errors", "request_bytes", "response_bytes", "max_response_bytes", "latency")
+
+    def __init__(self, tool: str, via: str):
+        self.tool = tool
+        self.via = via
+        self.calls = 0
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.max_response_bytes = 0
+        self.latency = LatencyHistogram()
+
+
+class MCPBenchmarkStats:
+    """Shared by all workers of one run; only touched from the event loop."""
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.sessions = 0
+        self.session_errors = 0
+        self.session_latency = LatencyHistogram()
+        self.started = time.perf_counter()
+        self._tools: Dict[Tuple[str, str], _ToolCounters] = {}
+
+    def add(self, tool: str, via: str, ok: bool, request_bytes: int, response_bytes: int, elapsed: float) -> None:
+        counters = self._tools.get((tool, via))
+        if counters is None:
+            counters = self._tools[(tool, via)] = _ToolCounters(tool, via)
+        counters.calls += 1
+        counters.errors += not ok
+        counters.request_bytes += request_bytes
+        counters.response_bytes += response_bytes
+        counters.max_response_bytes = max(counters.max_response_bytes, response_bytes)
+        counters.latency.record(elapsed)
+
+    def snapshot(self, total: int) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        tools = []
+        for counters in self._tools.values():
+            calls = counters.calls
+            tools.append({
+                "tool": counters.tool,
+                "via": counters.via,
+                "calls": calls,
+                "errors": counters.errors,
+                "errorRate": round(counters.errors / calls, 4) if calls else 0.0,
+                "requestBytes": round(counters.request_bytes / calls) if calls else 0,
+                "responseBytes": round(counters.response_bytes / calls) if calls else 0,
+                "maxResponseBytes": counters.max_response_bytes,
+                "latency": counters.latency.summary(),
+            })
+        return {
+            "completed": self.completed,
+            "total": total,
+            "elapsed": round(elapsed, 3),
+            "throughput": round(self.completed / elapsed, 1) if elapsed else 0.0,
+            "sessions": self.sessions,
+            "sessionErrors": self.session_errors,
+            "sessionLatency": self.session_latency.summary(),
+            "tools": sorted(tools, key=lambda t: (t["tool"], t["via"])),
+        }
+
+
+async def run_mcp_benchmark(
+    app: ASGIApp,
+    base: Scope,
+    mount_path: str,
+    calls: List[Dict[str, Any]],
+    *,
+    total: int,
+    concurrency: int,
+    headers: Optional[_asgi.Headers] = None,
+    operations: Optional[Dict[str, Dict[str, Any]]] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Runs the benchmark, yielding `{"type": "progress", ...}` snapshots and a
+    final `{"type": "result", ...}`. `calls` is the mix: `{"tool", "arguments",
+    "weight"}` entries, interleaved in proportion to their weights. With
+    `operations` (the bridge's operation map), each call is repeated against
+    its route directly and reported with `"via": "direct"`.
+    """
+    schedule = [call for call in calls for _ in range(int(call.get("weight") or 1))]
+    headers = list(headers or [])
+    stats = MCPBenchmarkStats()
+    issued = 0
+
+    async def call_tool(session: MCPSession, call: Dict[str, Any]) -> None:
+        tool = call["tool"]
+        start = time.perf_counter()
+        try:
+            result, response, request_bytes = await session.request(
+                "tools/call", {"name": tool, "arguments": call.get("arguments") or {}}
+            )
+        except Exception:
+            stats.add(tool, "mcp", False, 0, 0, time.perf_counter() - start)
+            return
+        elapsed = time.perf_counter() - start
+        ok = (
+            result.status < 400
+            and response is not None
+            and "error" not in response
+            and not (response.get("result") or {}).get("isError")
+        )
+        stats.add(tool, "mcp", ok, request_bytes, len(result.body), elapsed)
+
+    async def call_route(call: Dict[str, Any]) -> None:
+        tool = call["tool"]
+        method, target, route_headers, body = direct_request(operations[tool], call.get("arguments") or {})
+        scope = _asgi.build_scope(base, method, target, headers + route_headers)
+        start = time.perf_counter()
+        try:
+            result = await _asgi.call(app, scope, body)
+        except Exception:
+            stats.add(tool, "direct", False, len(body), 0, time.perf_counter() - start)
+            return
+        stats.add(tool, "direct", result.status < 400, len(body), len(result.body), time.perf_counter() - start)
+
+    async def worker() -> None:
+        nonlocal issued
+        session = MCPSession(app, base, mount_path, headers)
+        start = time.perf_counter()
+        try:
+            await session.open()
+        except Exception:
+            stats.session_errors += 1
+            return
+        stats.sessions += 1
+        stats.session_latency.record(time.perf_counter() - start)
+        try:
+            while issued < total:
+                call = schedule[issued % len(schedule)]
+                issued += 1
+                await call_tool(session, call)
+                stats.completed += 1
+                if operations is not None and call["tool"] in operations:
+                    await call_route(call)
+        finally:
+            await session.close()
+
+    stats.started = time.perf_counter()
+    workers = asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    try:
+        while not workers.done():
+            await asyncio.wait({workers}, timeout=progress_interval)
+            if not workers.done():
+                yield {"type": "progress", **stats.snapshot(total)}
+        workers.result()
+    finally:
+        workers.cancel()
+
+    yield {"type": "result", **stats.snapshot(total)}
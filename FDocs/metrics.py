@@ -0,0 +1,132 @@
+"""
+Per-route request metrics.
+
+`MetricsMiddleware` is a raw ASGI middleware that times every HTTP request and
+files it under the route that handled it: request count, status classes and a
+latency histogram (see `_histogram`), all kept in preallocated arrays. The
+per-request work is a couple of dict lookups and array increments, cheap
+enough to leave on in production.
+
+Metrics are per process; with several workers each reports its own share.
+Requests issued in-process by the docs themselves are not counted.
+"""
+import time
+from array import array
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ._histogram import LatencyHistogram
+
+STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+
+# Bucket for methods a route does not handle, whatever the client sent
+OTHER_METHOD = "OTHER"
+# Methods counted on routes that do not declare theirs
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+class RouteStats:
+    """Counters for one (route, method) pair."""
+
+    __slots__ = ("id", "statuses", "latency")
+
+    def __init__(self, endpoint_id: str):
+        self.id = endpoint_id
+        self.statuses = array("Q", bytes(8 * len(STATUS_CLASSES)))
+        self.latency = LatencyHistogram()
+
+    def record(self, status: int, elapsed: float) -> None:
+        self.statuses[min(max(status // 100, 1), 5) - 1] += 1
+        self.latency.record(elapsed)
+
+    def summary(self, uptime: float) -> Dict[str, Any]:
+        count = self.latency.count
+        return {
+            "count": count,
+            "throughput": round(count / uptime, 3) if uptime else 0.0,
+            "statuses": {name: n for name, n in zip(STATUS_CLASSES, self.statuses) if n},
+            "latency": self.latency.summary(),
+        }
+
+
+class MetricsRegistry:
+    """All route stats of an app, keyed by route and then by method."""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        # Routes are unhashable; key by id and hold a reference so ids are not reused
+        self._routes: Dict[int, Tuple[BaseRoute, Dict[str, RouteStats]]] = {}
+
+    def stats_for(self, route: BaseRoute, method: str) -> Optional[RouteStats]:
+        """
+        The stats of `route` for `method`. Methods the route does not handle
+        share one bucket, so clients cannot add entries by inventing methods.
+        """
+        if method not in (getattr(route, "methods", None) or HTTP_METHODS):
+            method = OTHER_METHOD
+        entry = self._routes.get(id(route))
+        if entry is None:
+            entry = self._routes[id(route)] = (route, {})
+        by_method = entry[1]
+        stats = by_method.get(method)
+        if stats is None:
+            if not getattr(route, "include_in_schema", True):
+                # Docs, assets and other undocumented routes are not tracked
+                return None
+            path = getattr(route, "path_format", None) or getattr(route, "path", "")
+            # Same id as the docs' endpoints, so the UI can match them up
+            stats = by_method[method] = RouteStats(f"{method.lower()}-{path}")
+        return stats
+
+    def reset(self) -> None:
+        self.started = time.time()
+        self._routes = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        routes: Dict[str, Any] = {}
+        for _, by_method in list(self._routes.values()):
+            for stats in list(by_method.values()):
+                routes[stats.id] = stats.summary(uptime)
+        return {"since": self.started, "uptime": round(uptime, 3), "routes": routes}
+
+
+class MetricsMiddleware:
+    """
+    Records per-route metrics into `registry`.
+
+    Usage:
+        registry = MetricsRegistry()
+        app.add_middleware(MetricsMiddleware, registry=registry)
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "f_docs" in scope.get("extensions", ()):
+            # Synthetic traffic from the docs (try-it batches, load tests) is not production traffic
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router leaves the matched route in the scope
+            route = scope.get("route")
+            if route is not None:
+                stats = self.registry.stats_for(route, scope["method"])
+                if stats is not None:
+                    stats.record(status, time.perf_counter() - start)
@@ -0,0 +1,117 @@
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import FastAPI
+
+from ._http import CachedBody
+
+logger = logging.getLogger(__name__)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializes JSON the same way FastAPI's JSONResponse does."""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def routes_fingerprint(app: FastAPI) -> Tuple[int, ...]:
+    """Identity of the app's route table; changes whenever routes are added or removed."""
+    # Newer FastAPI versions keep included routers nested and count their changes
+    get_version = getattr(app.router, "_get_routes_version", None)
+    version = get_version() if get_version is not None else 0
+    return (version,) + tuple(map(id, app.router.routes))
+
+
+class OpenAPICache:
+    """
+    Holds the app's OpenAPI document serialized once, with compressed variants
+    and an ETag derived from the spec hash.
+
+    The cache is rebuilt automatically when the route table changes, e.g. when
+    routers are included after startup. Values derived from the spec (see
+    `derive`) share its lifetime.
+    """
+
+    def __init__(self, app: FastAPI, fingerprint: Optional[Callable[[], Hashable]] = None):
+        self.app = app
+        # What invalidates the spec; the app's route table unless the spec has other sources
+        self.fingerprint = fingerprint or (lambda: routes_fingerprint(app))
+        self._lock = threading.RLock()
+        self._fingerprint: Optional[Hashable] = None
+        self._body: Optional[CachedBody] = None
+        self._schema: Optional[Dict[str, Any]] = None
+        self._derived: Dict[str, Any] = {}
+        # Set once a background warm-up has generated the spec (see `warm_up`)
+        self.warm = threading.Event()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._fingerprint = None
+
+    def is_stale(self) -> bool:
+        return self._body is None or self._fingerprint != self.fingerprint()
+
+    def is_ready(self, name: str) -> bool:
+        """True when the derived value `name` can be served without rebuilding."""
+        return not self.is_stale() and name in self._derived
+
+    def _refresh(self) -> None:
+        fingerprint = self.fingerprint()
+        if self._body is not None and fingerprint == self._fingerprint:
+            return
+        # Drop FastAPI's own memoized schema so new routes are picked up
+        self.app.openapi_schema = None
+        schema = self.app.openapi()
+        content = dumps(schema)
+        self._schema = schema
+        self._body = CachedBody(content, "application/json")
+        self._derived = {}
+        self._fingerprint = fingerprint
+
+    def get(self) -> CachedBody:
+        """Returns the serialized spec, regenerating it only if routes changed. Blocking."""
+        if self.is_stale():
+            with self._lock:
+                self._refresh()
+        return self._body
+
+    @property
+    def schema(self) -> Dict[str, Any]:
+        self.get()
+        return self._schema
+
+    @property
+    def version(self) -> str:
+        """Hash of the current serialized spec."""
+        return self.get().digest
+
+    def derive(self, name: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Memoizes `build(schema)` until the spec changes."""
+        self.get()
+        derived = self._derived
+        if name not in derived:
+            with self._lock:
+                if name not in derived:
+                    derived[name] = build(self._schema)
+        return derived[name]
+
+    def warm_up(self, builders: Dict[str, Callable[[Dict[str, Any]], Any]]) -> threading.Thread:
+        """
+        Generates and serializes the spec, then every derived value in `builders`,
+        in a background thread. `warm` is set when done, even on failure, so a
+        broken spec does not keep readiness probes waiting forever.
+        """
+        def run() -> None:
+            try:
+                self.get()
+                for name, build in builders.items():
+                    self.derive(name, build)
+            except Exception:
+                logger.exception("F-Docs: OpenAPI warm-up failed")
+            finally:
+                self.warm.set()
+
+        thread = threading.Thread(target=run, name="f-docs-warm-up", daemon=True)
+        thread.start()
+        return thread
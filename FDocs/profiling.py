@@ -0,0 +1,246 @@
+"""
+On-demand sampling profiler for single requests.
+
+A request carrying `X-FDocs-Profile: <token>` is profiled: while it runs, a
+background thread samples stacks every `interval` seconds (in practice no
+faster than the interpreter's GIL switch interval) and aggregates them
+into collapsed stacks (`frame;frame;frame count`, the flame graph input
+format). The profile is stored under an id returned in the
+`X-FDocs-Profile-Id` response header. Requests without the header only pay
+for a scan of their header list.
+
+Event-loop samples are attributed through the running task's context (on
+Python < 3.12, to the request's own task only), so concurrent async requests
+do not leak into the profile. Threadpool work (sync handlers and
+dependencies) is sampled from busy worker threads and, under concurrency,
+may include other requests' sync work.
+"""
+import asyncio
+import contextvars
+import hmac
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ._http import expose_header
+from .static import _route_path
+
+PROFILE_HEADER = b"x-fdocs-profile"
+PROFILE_ID_HEADER = b"x-fdocs-profile-id"
+
+DEFAULT_INTERVAL = 0.001
+MAX_PROFILES = 32
+MAX_DEPTH = 128
+
+# Id of the profile the current task (and the tasks it spawns) belongs to
+_current_profile: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("f_docs_profile", default=None)
+
+_labels: Dict[CodeType, str] = {}
+
+
+def _label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label
+
+
+def _frames(frame: Optional[FrameType]) -> List[FrameType]:
+    """Frames from the outermost call down to `frame`."""
+    frames = []
+    while frame is not None and len(frames) < MAX_DEPTH:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _is_library(frame: FrameType, package: str) -> bool:
+    return f"{os.sep}{package}{os.sep}" in frame.f_code.co_filename
+
+
+def _loop_stack(frame: FrameType) -> List[str]:
+    # Drop the event loop's own frames, down to the handle that steps the task
+    frames = _frames(frame)
+    start = 0
+    for i, f in enumerate(frames):
+        if f.f_code.co_name == "_run" and _is_library(f, "asyncio"):
+            start = i + 1
+    return [_label(f.f_code) for f in frames[start:]]
+
+
+def _worker_stack(frame: FrameType) -> Optional[List[str]]:
+    """Stack of a threadpool worker running a call, or None when it is idle."""
+    frames = _frames(frame)
+    for i, f in enumerate(frames):
+        if _is_library(f, "anyio") and f.f_code.co_name == "run":
+            # Idle workers wait on their queue right below WorkerThread.run
+            busy = frames[i + 1:]
+            if not busy or busy[0].f_code.co_name == "get":
+                return None
+            return ["[threadpool]"] + [_label(f.f_code) for f in busy]
+    return None
+
+
+def _belongs_to(task: "asyncio.Task[Any]", profile_id: str, root: Optional["asyncio.Task[Any]"]) -> bool:
+    get_context = getattr(task, "get_context", None)
+    if get_context is not None:
+        # Python 3.12+: tasks spawned by the request inherit its context
+        return get_context().get(_current_profile) == profile_id
+    return task is root
+
+
+class Profile:
+    """Aggregated samples of one request."""
+
+    def __init__(self, method: str, path: str, interval: float):
+        self.id = uuid.uuid4().hex[:16]
+        self.method = method
+        self.path = path
+        self.interval = interval
+        self.started = time.time()
+        self.duration = 0.0
+        self.samples = 0
+        self.stacks: Counter = Counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "started": self.started,
+            "durationMs": round(self.duration * 1000, 3),
+            "intervalMs": self.interval * 1000,
+            "samples": self.samples,
+            # Collapsed stacks, heaviest first
+            "stacks": [[stack, count] for stack, count in self.stacks.most_common()],
+        }
+
+
+class ProfileStore:
+    """The most recent profiles, by id."""
+
+    def __init__(self, max_size: int = MAX_PROFILES):
+        self.max_size = max_size
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        return self._profiles.get(profile_id)
+
+
+class Sampler(threading.Thread):
+    """Samples the event loop thread and busy worker threads until stopped."""
+
+    def __init__(self, profile: Profile, loop: asyncio.AbstractEventLoop, loop_thread: int):
+        super().__init__(name="f-docs-profiler", daemon=True)
+        self.profile = profile
+        self.loop = loop
+        self.loop_thread = loop_thread
+        self.root_task = asyncio.current_task(loop)
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        profile = self.profile
+        while not self.stopped.wait(profile.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.ident:
+                    continue
+                if thread_id == self.loop_thread:
+                    # The task the loop is stepping right now, looked up from this thread
+                    task = asyncio.current_task(self.loop)
+                    if task is None or not _belongs_to(task, profile.id, self.root_task):
+                        continue
+                    stack = _loop_stack(frame)
+                else:
+                    stack = _worker_stack(frame)
+                if stack:
+                    profile.stacks[";".join(stack)] += 1
+                    profile.samples += 1
+
+    async def stop(self) -> None:
+        """Stops sampling and waits for the last sample, without blocking the event loop."""
+        self.stopped.set()
+        await asyncio.get_running_loop().run_in_executor(None, self.join)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that carry a valid `X-FDocs-Profile` token, except
+    those under the `exclude` path prefixes (e.g. the docs' own endpoints).
+
+    Usage:
+        store = ProfileStore()
+        app.add_middleware(ProfilingMiddleware, token="secret", store=store)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: str,
+        store: ProfileStore,
+        interval: float = DEFAULT_INTERVAL,
+        exclude: Sequence[str] = (),
+    ):
+        self.app = app
+        self.token = token.encode("latin-1")
+        self.store = store
+        self.interval = interval
+        self.exclude = tuple(exclude)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                token = value
+                break
+        if token is None or (self.exclude and _route_path(scope).startswith(self.exclude)):
+            await self.app(scope, receive, send)
+            return
+
+        if not hmac.compare_digest(token, self.token):
+            await send({
+                "type": "http.response.start",
+                "status": 403,
+                "headers": [(b"content-type", b"application/json")],
+            })
+            await send({"type": "http.response.body", "body": b'{"detail":"Invalid profiling token"}'})
+            return
+
+        profile = Profile(scope["method"], scope["path"], self.interval)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append((PROFILE_ID_HEADER, profile.id.encode("latin-1")))
+                message = {**message, "headers": expose_header(headers, b"X-FDocs-Profile-Id")}
+            await send(message)
+
+        sampler = Sampler(profile, asyncio.get_running_loop(), threading.get_ident())
+        context_token = _current_profile.set(profile.id)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.duration = time.perf_counter() - start
+            await sampler.stop()
+            _current_profile.reset(context_token)
+            self.store.add(profile)
@@ -0,0 +1,105 @@
+"""
+Inverted index over the app's operations, queried by the UI's sidebar search.
+
+Each operation is indexed under the tokens of its path, summary, description,
+operationId, tags, parameter names and the property names of every schema it
+accepts or returns. Postings are lists of positions in `ids`, which match the
+endpoint ids produced by `docs_index`.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Set
+
+from .docs_index import iter_operations, resolve_ref
+
+# Keep in step with WORDS in frontend/services/searchIndex.ts
+_WORDS = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+|[^\W\d_A-Za-z]+")
+
+MAX_SCHEMA_DEPTH = 8
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercased words, splitting on punctuation, snake_case and camelCase."""
+    if not text:
+        return set()
+    return {word.lower() for word in _WORDS.findall(text)}
+
+
+def _schema_properties(schema: Any, spec: Dict[str, Any], memo: Dict[str, Set[str]], out: Set[str], depth: int = 0) -> None:
+    if not isinstance(schema, dict) or depth > MAX_SCHEMA_DEPTH:
+        return
+    ref = schema.get("$ref")
+    if ref:
+        # Component schemas are shared by many operations; walk each once
+        if ref not in memo:
+            memo[ref] = set()  # placeholder while recursive models are walked
+            properties: Set[str] = set()
+            _schema_properties(resolve_ref(ref, spec), spec, memo, properties)
+            memo[ref] = properties
+        out |= memo[ref]
+        return
+    for name, prop in (schema.get("properties") or {}).items():
+        out.add(name)
+        _schema_properties(prop, spec, memo, out, depth + 1)
+    for key in ("items", "additionalProperties", "not"):
+        _schema_properties(schema.get(key), spec, memo, out, depth + 1)
+    for key in ("allOf", "anyOf", "oneOf"):
+        for sub_schema in schema.get(key) or []:
+            _schema_properties(sub_schema, spec, memo, out, depth + 1)
+
+
+def _content_schemas(obj: Dict[str, Any], spec: Dict[str, Any]) -> Iterable[Any]:
+    if "$ref" in obj:
+        obj = resolve_ref(obj["$ref"], spec)
+    for media in (obj.get("content") or {}).values():
+        if isinstance(media, dict):
+            yield media.get("schema")
+    if "schema" in obj:
+        # Swagger 2.0 responses
+        yield obj["schema"]
+
+
+def operation_text(
+    op: Dict[str, Any], path_item: Dict[str, Any], path: str, spec: Dict[str, Any], memo: Dict[str, Set[str]]
+) -> List[str]:
+    """All searchable strings of one operation."""
+    texts = [path, op.get("summary") or "", op.get("description") or "", op.get("operationId") or ""]
+    texts.extend(op.get("tags") or [])
+
+    schemas: List[Any] = []
+    for param in list(op.get("parameters") or []) + list(path_item.get("parameters") or []):
+        if isinstance(param, dict) and "$ref" in param:
+            param = resolve_ref(param["$ref"], spec)
+        texts.append(param.get("name") or "")
+        schemas.append(param.get("schema"))
+    if isinstance(op.get("requestBody"), dict):
+        schemas.extend(_content_schemas(op["requestBody"], spec))
+    for response in (op.get("responses") or {}).values():
+        if isinstance(response, dict):
+            schemas.extend(_content_schemas(response, spec))
+
+    properties: Set[str] = set()
+    for schema in schemas:
+        _schema_properties(schema, spec, memo, properties)
+    texts.extend(properties)
+    return texts
+
+
+def build_search_index(spec: Dict[str, Any], version: str = "") -> Dict[str, Any]:
+    """Builds the `{version, ids, tokens}` index for `spec`; `tokens` is a sorted list of `[token, postings]`."""
+    ids: List[str] = []
+    postings: Dict[str, List[int]] = {}
+    memo: Dict[str, Set[str]] = {}
+    for position, (path, method, op, path_item) in enumerate(iter_operations(spec)):
+        ids.append(f"{method}-{path}")
+        tokens: Set[str] = set()
+        for text in operation_text(op, path_item, path, spec, memo):
+            tokens |= tokenize(text)
+        for token in tokens:
+            postings.setdefault(token, []).append(position)
+
+    return {
+        "version": version,
+        "ids": ids,
+        # Pairs rather than an object: JavaScript would move integer-like keys ("404") first
+        "tokens": [[token, postings[token]] for token in sorted(postings)],
+    }
@@ -0,0 +1,227 @@
+"""
+Socket.IO event catalog and emit instrumentation.
+
+`EventCatalog` introspects a `socketio.AsyncServer` into the events its
+handlers accept, per namespace, with a sample payload derived from each
+handler's signature (annotations, Pydantic models and defaults). The catalog
+is rebuilt only when the registered handlers change.
+
+`EmitStats` wraps the server's `emit` so every event it sends, including
+those of background emitters, is counted: messages, payload bytes and the
+time `emit` took to encode and queue the message, plus a recent payload as a
+sample. Non-binary payloads are only serialized on every `SIZE_EVERY`-th emit
+of an event, the last measured size standing in for the emits in between.
+Only the server object is touched, so `socketio` itself is never imported here.
+"""
+import inspect
+import json
+import time
+import types
+import typing
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._histogram import LatencyHistogram
+from .openapi import dumps
+
+# Handlers the server calls itself rather than in response to client emits
+LIFECYCLE_EVENTS = ("connect", "disconnect")
+
+# Longest serialized payload kept as an emitted event's sample
+MAX_SAMPLE_BYTES = 2048
+
+# Non-binary payloads are serialized (for their size and sample) on one emit in this many per event
+SIZE_EVERY = 16
+
+_SCALAR_SAMPLES: Dict[Any, Any] = {str: "string", int: 0, float: 0.0, bool: False, dict: {}, list: [], bytes: ""}
+
+
+def _sample(annotation: Any, depth: int = 0) -> Any:
+    """Example value for a type annotation, or None when nothing is known."""
+    if annotation is inspect.Parameter.empty or annotation is Any or depth > 4:
+        return None
+    if annotation in _SCALAR_SAMPLES:
+        return _SCALAR_SAMPLES[annotation]
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if origin is typing.Union or origin is getattr(types, "UnionType", None):
+        return _sample(args[0], depth + 1) if args else None
+    if origin in (list, tuple, set, frozenset):
+        item = _sample(args[0], depth + 1) if args else None
+        return [] if item is None else [item]
+    if origin is dict:
+        return {}
+    fields = getattr(annotation, "model_fields", None)  # Pydantic v2 models
+    if isinstance(fields, dict):
+        sample = {}
+        for name, field in fields.items():
+            default = None if field.is_required() else field.get_default(call_default_factory=True)
+            default = _jsonable(default)
+            sample[field.alias or name] = default if default is not None else _sample(field.annotation, depth + 1)
+        return sample
+    return None
+
+
+def _jsonable(value: Any) -> Any:
+    try:
+        dumps(value)
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+def _describe(event: str, handler: Any) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "name": event,
+        "handler": getattr(handler, "__qualname__", repr(handler)),
+        "doc": inspect.getdoc(handler) or "",
+        "lifecycle": event in LIFECYCLE_EVENTS,
+        "args": [],
+        "sample": None,
+    }
+    if entry["lifecycle"]:
+        return entry
+    try:
+        parameters = list(inspect.signature(handler).parameters.values())
+    except (TypeError, ValueError):
+        return entry
+    # The first argument is the sid; a catch-all "*" handler also gets the event name
+    skip = 2 if event == "*" else 1
+    data = [p for p in parameters[skip:] if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    samples = []
+    for parameter in data:
+        sample = _sample(parameter.annotation)
+        if sample is None and parameter.default is not parameter.empty:
+            sample = _jsonable(parameter.default)
+        entry["args"].append(parameter.name)
+        samples.append(sample)
+    if len(samples) == 1:
+        entry["sample"] = samples[0]
+    elif samples:
+        entry["sample"] = samples
+    return entry
+
+
+def handlers_fingerprint(server: Any) -> Tuple[Any, ...]:
+    """Identity of the server's registered handlers; changes when one is added or replaced."""
+    handlers = getattr(server, "handlers", {})
+    namespaces = getattr(server, "namespace_handlers", {})
+    return (
+        tuple((ns, tuple((event, id(h)) for event, h in events.items())) for ns, events in handlers.items()),
+        tuple((ns, id(handler)) for ns, handler in namespaces.items()),
+    )
+
+
+class EventCatalog:
+    """The events a Socket.IO server handles, by namespace, built once per handler set."""
+
+    def __init__(self, server: Any):
+        self.server = server
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._namespaces: List[Dict[str, Any]] = []
+
+    def namespaces(self) -> List[Dict[str, Any]]:
+        fingerprint = handlers_fingerprint(self.server)
+        if fingerprint != self._fingerprint:
+            self._namespaces = self._build()
+            self._fingerprint = fingerprint
+        return self._namespaces
+
+    def _build(self) -> List[Dict[str, Any]]:
+        events: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for namespace, handlers in getattr(self.server, "handlers", {}).items():
+            for event, handler in handlers.items():
+                events.setdefault(namespace, {})[event] = _describe(event, handler)
+        # Class-based namespaces handle `on_<event>` methods
+        for namespace, handler in getattr(self.server, "namespace_handlers", {}).items():
+            for attr in dir(handler):
+                if attr.startswith("on_") and callable(getattr(handler, attr)):
+                    event = attr[3:]
+                    events.setdefault(namespace, {}).setdefault(event, _describe(event, getattr(handler, attr)))
+        return [
+            {"namespace": namespace, "events": sorted(by_name.values(), key=lambda e: (not e["lifecycle"], e["name"]))}
+            for namespace, by_name in sorted(events.items())
+        ]
+
+
+class _EventCounters:
+    __slots__ = ("event", "namespace", "count", "bytes", "size", "latency", "sample", "last")
+
+    def __init__(self, event: str, namespace: str):
+        self.event = event
+        self.namespace = namespace
+        self.count = 0
+        self.bytes = 0
+        # Last measured payload size, counted for the emits that are not measured
+        self.size = 0
+        self.latency = LatencyHistogram()
+        self.sample: Any = None
+        self.last = 0.0
+
+
+class EmitStats:
+    """
+    Counts every event a Socket.IO server emits.
+
+    Usage:
+        stats = EmitStats()
+        stats.instrument(sio)
+    """
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._events: Dict[Tuple[str, str], _EventCounters] = {}
+
+    def instrument(self, server: Any) -> None:
+        """Wraps `server.emit`; a server is only wrapped once."""
+        emit = server.emit
+        if hasattr(emit, "__f_docs_original__"):
+            return
+
+        async def instrumented_emit(event: str, data: Any = None, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await emit(event, data, *args, **kwargs)
+            finally:
+                self.record(event, kwargs.get("namespace") or "/", data, time.perf_counter() - start)
+
+        instrumented_emit.__f_docs_original__ = emit
+        server.emit = instrumented_emit
+
+    def record(self, event: str, namespace: str, data: Any, elapsed: float) -> None:
+        counters = self._events.get((namespace, event))
+        if counters is None:
+            counters = self._events[(namespace, event)] = _EventCounters(event, namespace)
+        if isinstance(data, (bytes, bytearray)):
+            size = len(data)
+        elif counters.count % SIZE_EVERY == 0:
+            try:
+                encoded = dumps(data)
+            except (TypeError, ValueError):
+                encoded = b""
+            size = counters.size = len(encoded)
+            if 0 < size <= MAX_SAMPLE_BYTES:
+                # A copy: the caller may keep mutating what it emitted
+                counters.sample = json.loads(encoded)
+        else:
+            size = counters.size
+        counters.count += 1
+        counters.bytes += size
+        counters.latency.record(elapsed)
+        counters.last = time.time()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        span = time.time() - self.started
+        events = []
+        for counters in list(self._events.values()):
+            events.append({
+                "event": counters.event,
+                "namespace": counters.namespace,
+                "count": counters.count,
+                "bytes": counters.bytes,
+                "messagesPerSecond": round(counters.count / span, 3) if span else 0.0,
+                "bytesPerSecond": round(counters.bytes / span, 1) if span else 0.0,
+                "lastEmitted": counters.last,
+                "latency": counters.latency.summary(),
+                "sample": counters.sample,
+            })
+        return sorted(events, key=lambda e: (e["namespace"], e["event"]))
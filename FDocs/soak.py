@@ -0,0 +1,253 @@
+"""
+WebSocket soak tester.
+
+`run_soak` opens `clients` concurrent WebSocket sessions against one route,
+ramping them up over `ramp_up` seconds, and has each send a scripted message
+`rate` times per second for `duration` seconds. Every message carries a token
+(`fdocs-<client>-<seq>`, substituted for `{id}` in the template); when a
+frame containing the sender's own token comes back, as from echo or chat
+routes, its round trip is recorded. Messages never echoed before the end of
+the run count as drops, so routes that do not echo should be soaked with
+`rate=0`, which only holds connections open and counts what they receive.
+
+Sessions run in-process over ASGI by default, so a run measures how many
+clients the app itself can hold on one worker; `base_url` connects over the
+network instead (requires `websockets`).
+"""
+import asyncio
+import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from starlette.types import ASGIApp, Scope
+
+from . import _asgi
+from ._histogram import LatencyHistogram
+
+MAX_CLIENTS = 10_000
+MAX_DURATION = 600.0
+MAX_RATE = 100.0
+
+PROGRESS_INTERVAL = 0.5
+
+# Time left for the last messages to come back before clients disconnect
+DRAIN_TIMEOUT = 1.0
+
+DEFAULT_MESSAGE = '{"type": "soak", "id": "{id}"}'
+
+_TOKEN = re.compile(r"fdocs-(\d+)-(\d+)")
+
+
+class SoakStats:
+    """Shared by all clients of one run; only touched from the event loop."""
+
+    def __init__(self, clients: int) -> None:
+        self.clients = clients
+        self.connect_latency = LatencyHistogram()
+        self.round_trip = LatencyHistogram()
+        self.connected = 0
+        self.active = 0
+        self.peak_active = 0
+        self.connect_errors = 0
+        self.closed_by_server = 0
+        self.sent = 0
+        self.received = 0
+        self.received_bytes = 0
+        self.dropped = 0
+        self.started = time.perf_counter()
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "clients": self.clients,
+            "elapsed": round(elapsed, 3),
+            "connected": self.connected,
+            "active": self.active,
+            "peakActive": self.peak_active,
+            "connectErrors": self.connect_errors,
+            "closedByServer": self.closed_by_server,
+            "sent": self.sent,
+            "received": self.received,
+            "receivedBytes": self.received_bytes,
+            "dropped": self.dropped,
+            "sentPerSecond": round(self.sent / elapsed, 1) if elapsed else 0.0,
+            "receivedPerSecond": round(self.received / elapsed, 1) if elapsed else 0.0,
+            "connectLatency": self.connect_latency.summary(),
+            "roundTrip": self.round_trip.summary(),
+        }
+
+
+class ClientSlots:
+    """
+    Soak clients open at once across every run on one app, so that concurrent
+    runs together stay under `limit`. Only touched from the event loop.
+    """
+
+    def __init__(self, limit: int = MAX_CLIENTS) -> None:
+        self.free = limit
+
+    def take(self) -> bool:
+        if self.free <= 0:
+            return False
+        self.free -= 1
+        return True
+
+    def give_back(self) -> None:
+        self.free += 1
+
+
+class _NetworkWebSocket:
+    """Adapts a `websockets` connection to the `ASGIWebSocket` interface."""
+
+    def __init__(self, url: str, headers: List[Any]):
+        self.url = url
+        self.headers = headers
+        self.connection: Any = None
+
+    async def connect(self) -> None:
+        import websockets  # optional: only needed to soak over the network
+
+        self.connection = await websockets.connect(self.url, additional_headers=self.headers, max_queue=None)
+
+    async def send(self, data: Union[str, bytes]) -> None:
+        await self.connection.send(data)
+
+    async def receive(self) -> Union[str, bytes]:
+        import websockets
+
+        try:
+            return await self.connection.recv()
+        except websockets.ConnectionClosed as exc:
+            raise _asgi.WebSocketClosed(exc.rcvd.code if exc.rcvd else 1006) from None
+
+    async def close(self, code: int = 1000, timeout: float = 1.0) -> None:
+        if self.connection is not None:
+            await asyncio.wait_for(self.connection.close(code), timeout)
+
+
+async def run_soak(
+    app: ASGIApp,
+    base: Scope,
+    path: str,
+    *,
+    clients: int,
+    duration: float,
+    rate: float = 0.0,
+    ramp_up: float = 0.0,
+    message: str = DEFAULT_MESSAGE,
+    base_url: Optional[str] = None,
+    slots: Optional["ClientSlots"] = None,
+    progress_interval: float = PROGRESS_INTERVAL,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Runs the soak, yielding `{"type": "progress", ...}` snapshots and a final
+    `{"type": "result", ...}` that also carries the round-trip histogram.
+    `duration` counts from the moment the last client starts connecting.
+    With `slots`, each client holds a slot while connected and is refused
+    (a connect error) when none is free.
+    """
+    stats = SoakStats(clients)
+    cookies = [(name, value) for name, value in base.get("headers", ()) if name == b"cookie"]
+    loop = asyncio.get_running_loop()
+
+    if base_url is not None and not _asgi.is_origin_path(path):
+        raise ValueError(f"Not a path on {base_url}: {path!r}")
+
+    def open_socket() -> Any:
+        if base_url is not None:
+            url = base_url.replace("http", "ws", 1).rstrip("/") + path
+            return _NetworkWebSocket(url, [(n.decode("latin-1"), v.decode("latin-1")) for n, v in cookies])
+        return _asgi.ASGIWebSocket(app, _asgi.websocket_scope(base, path, cookies))
+
+    async def receiver(ws: Any, client: int, pending: Dict[int, float]) -> None:
+        try:
+            while True:
+                data = await ws.receive()
+                now = time.perf_counter()
+                stats.received += 1
+                stats.received_bytes += len(data)
+                if not pending:
+                    continue
+                text = data if isinstance(data, str) else data.decode("utf-8", "replace")
+                for match in _TOKEN.finditer(text):
+                    if int(match.group(1)) == client:
+                        sent_at = pending.pop(int(match.group(2)), None)
+                        if sent_at is not None:
+                            stats.round_trip.record(now - sent_at)
+        except _asgi.WebSocketClosed:
+            pass
+
+    async def session(client: int) -> None:
+        if ramp_up:
+            await asyncio.sleep(ramp_up * client / clients)
+        if slots is None:
+            await connected_session(client)
+        elif not slots.take():
+            stats.connect_errors += 1
+        else:
+            try:
+                await connected_session(client)
+            finally:
+                slots.give_back()
+
+    async def connected_session(client: int) -> None:
+        ws = open_socket()
+        start = time.perf_counter()
+        try:
+            await ws.connect()
+        except Exception:
+            stats.connect_errors += 1
+            return
+        stats.connect_latency.record(time.perf_counter() - start)
+        stats.connected += 1
+        stats.active += 1
+        stats.peak_active = max(stats.peak_active, stats.active)
+
+        pending: Dict[int, float] = {}
+        receiving = asyncio.ensure_future(receiver(ws, client, pending))
+        try:
+            if rate:
+                interval = 1 / rate
+                # Spread clients over the interval so sends do not arrive in lockstep
+                due = loop.time() + interval * client / clients
+                sequence = 0
+                while due < deadline and not receiving.done():
+                    delay = due - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    pending[sequence] = time.perf_counter()
+                    await ws.send(message.replace("{id}", f"fdocs-{client}-{sequence}"))
+                    stats.sent += 1
+                    sequence += 1
+                    due += interval
+                drain_until = loop.time() + DRAIN_TIMEOUT
+                while pending and not receiving.done() and loop.time() < drain_until:
+                    await asyncio.sleep(0.01)
+            else:
+                await asyncio.wait({receiving}, timeout=max(deadline - loop.time(), 0))
+            if receiving.done():
+                stats.closed_by_server += 1
+        except Exception:
+            stats.closed_by_server += 1
+        finally:
+            stats.dropped += len(pending)
+            stats.active -= 1
+            receiving.cancel()
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+    stats.started = time.perf_counter()
+    deadline = loop.time() + ramp_up + duration
+    sessions = asyncio.gather(*(session(client) for client in range(clients)))
+    try:
+        while not sessions.done():
+            await asyncio.wait({sessions}, timeout=progress_interval)
+            if not sessions.done():
+                yield {"type": "progress", **stats.snapshot()}
+        sessions.result()
+    finally:
+        sessions.cancel()
+
+    yield {"type": "result", **stats.snapshot(), "histogram": stats.round_trip.buckets()}
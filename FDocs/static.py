@@ -0,0 +1,99 @@
+import gzip
+import mimetypes
+import re
+from pathlib import Path
+from typing import Dict, Union
+
+from starlette.types import Receive, Scope, Send
+
+from ._http import MIN_COMPRESS_SIZE, CachedBody
+
+# Vite writes content-hashed files straight into its assets directory as
+# <name>-<8 char hash>.<ext>, e.g. index-Btr0A8ND.js
+HASHED_NAME = re.compile(r"^[^/]+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+SIBLING_ENCODINGS = {".br": "br", ".gz": "gzip"}
+
+
+def is_hashed(key: str) -> bool:
+    """True for a file Vite content-hashed, given its path relative to the assets directory."""
+    return HASHED_NAME.match(key) is not None
+
+
+def _route_path(scope: Scope) -> str:
+    # Mounts either strip the prefix from `path` or only extend `root_path`
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):]
+    return path
+
+
+class PrecompressedStaticFiles:
+    """
+    Serves a directory of built assets from memory.
+
+    Every file is read once at startup together with its pre-built `.br`/`.gz`
+    siblings (gzip is produced on the fly when a sibling is missing), so requests
+    never touch the filesystem. Content-hashed files are cached as immutable.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.files: Dict[str, CachedBody] = {}
+        self._load()
+
+    def _load(self) -> None:
+        for path in sorted(self.directory.rglob("*")):
+            if not path.is_file() or path.suffix in SIBLING_ENCODINGS:
+                continue
+
+            content = path.read_bytes()
+            variants = {}
+            for suffix, encoding in SIBLING_ENCODINGS.items():
+                sibling = path.with_name(path.name + suffix)
+                if sibling.is_file():
+                    variants[encoding] = sibling.read_bytes()
+            if "gzip" not in variants and len(content) >= MIN_COMPRESS_SIZE:
+                gz = gzip.compress(content, compresslevel=9, mtime=0)
+                if len(gz) < len(content):
+                    variants["gzip"] = gz
+
+            media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            if media_type.startswith("text/") or media_type == "application/javascript":
+                media_type += "; charset=utf-8"
+
+            relative = path.relative_to(self.directory).as_posix()
+            self.files["/" + relative] = CachedBody(
+                content,
+                media_type,
+                cache_control=IMMUTABLE if is_hashed(relative) else REVALIDATE,
+                variants=variants,
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await send({
+                "type": "http.response.start",
+                "status": 405,
+                "headers": [(b"allow", b"GET, HEAD"), (b"content-length", b"0")],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        body = self.files.get(_route_path(scope))
+        if body is None:
+            await send({
+                "type": "http.response.start",
+                "status": 404,
+                "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", b"9")],
+            })
+            await send({"type": "http.response.body", "body": b"Not Found"})
+            return
+
+        await body.send(scope, send)
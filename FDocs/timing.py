@@ -0,0 +1,184 @@
+"""
+Server-Timing breakdown of a request's phases.
+
+When a request carries `X-FDocs-Timing: 1`, its time is split into routing
+(middleware and route matching), body reading, body parsing with validation
+and dependency resolution, the endpoint function and response serialization,
+and returned as `Server-Timing` entries in that order.
+
+Nothing in FastAPI or Starlette is patched. `ServerTimingMiddleware` times
+body reads on the ASGI `receive` channel, and `ServerTimingRoute`, an
+`APIRoute` subclass, marks the end of routing when its handler is reached and
+times its endpoint function. Parsing, validation and dependencies are what
+lies between the two; serialization is what follows the endpoint until the
+response starts. Untimed requests pay one context variable lookup per mark.
+"""
+import contextvars
+import functools
+import inspect
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ._http import expose_header
+
+TIMING_HEADER = b"x-fdocs-timing"
+
+# Phase name and description, in waterfall order
+PHASES: Tuple[Tuple[str, str], ...] = (
+    ("routing", "Middleware and routing"),
+    ("body", "Body read"),
+    ("dependencies", "Body parsing, validation and dependencies"),
+    ("handler", "Endpoint function"),
+    ("serialize", "Response serialization"),
+)
+
+_current: contextvars.ContextVar[Optional["RequestTimings"]] = contextvars.ContextVar("f_docs_timings", default=None)
+
+
+class RequestTimings:
+    """Marks of one request on the `perf_counter` clock, and the time spent reading its body."""
+
+    __slots__ = ("start", "body", "routed", "body_before_route", "endpoint_start", "endpoint_end")
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.body = 0.0
+        self.routed: Optional[float] = None
+        # Body read by middleware, before routing
+        self.body_before_route = 0.0
+        self.endpoint_start: Optional[float] = None
+        self.endpoint_end: Optional[float] = None
+
+    def durations(self, now: float) -> Dict[str, float]:
+        routed = self.routed if self.routed is not None else now
+        durations = {"routing": max(routed - self.start - self.body_before_route, 0.0)}
+        if self.body:
+            durations["body"] = self.body
+        if self.routed is not None and self.endpoint_start is not None:
+            body_after_route = self.body - self.body_before_route
+            durations["dependencies"] = max(self.endpoint_start - self.routed - body_after_route, 0.0)
+            if self.endpoint_end is not None:
+                durations["handler"] = self.endpoint_end - self.endpoint_start
+                durations["serialize"] = max(now - self.endpoint_end, 0.0)
+        return durations
+
+    def header(self) -> bytes:
+        now = time.perf_counter()
+        durations = self.durations(now)
+        entries: List[str] = []
+        for name, description in PHASES:
+            if name in durations:
+                entries.append(f'{name};dur={durations[name] * 1000:.3f};desc="{description}"')
+        entries.append(f'total;dur={(now - self.start) * 1000:.3f};desc="Until response headers"')
+        return ", ".join(entries).encode("latin-1")
+
+
+def _timed_endpoint(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Times calls of an endpoint function, keeping it sync or async as FastAPI expects."""
+    if getattr(func, "__f_docs_timed__", False):
+        return func
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            timings = _current.get()
+            if timings is None:
+                return await func(*args, **kwargs)
+            timings.endpoint_start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                timings.endpoint_end = time.perf_counter()
+
+        wrapper: Callable[..., Any] = async_wrapper
+    else:
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Runs in the threadpool, which copies the request's context
+            timings = _current.get()
+            if timings is None:
+                return func(*args, **kwargs)
+            timings.endpoint_start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.endpoint_end = time.perf_counter()
+
+        wrapper = sync_wrapper
+    wrapper.__f_docs_timed__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class ServerTimingRoute(APIRoute):
+    """
+    `APIRoute` that reports the end of routing and the endpoint's own time to
+    `ServerTimingMiddleware`. Routes of other classes get routing, body and
+    total only.
+
+    Usage:
+        router = APIRouter(route_class=ServerTimingRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        # Plain functions only: generators stream their response and are left whole
+        if inspect.isfunction(endpoint) and not (
+            inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint)
+        ):
+            endpoint = _timed_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            timings = _current.get()
+            if timings is not None and timings.routed is None:
+                timings.routed = time.perf_counter()
+                timings.body_before_route = timings.body
+            return await handler(request)
+
+        return timed_handler
+
+
+class ServerTimingMiddleware:
+    """
+    Adds a `Server-Timing` breakdown to requests sent with `X-FDocs-Timing`.
+
+    Usage:
+        app.add_middleware(ServerTimingMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not any(name == TIMING_HEADER for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+
+        async def timed_receive() -> Message:
+            start = time.perf_counter()
+            message = await receive()
+            if message["type"] == "http.request":
+                timings.body += time.perf_counter() - start
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append((b"server-timing", timings.header()))
+                message = {**message, "headers": expose_header(headers, b"Server-Timing")}
+            await send(message)
+
+        token = _current.set(timings)
+        try:
+            await self.app(scope, timed_receive, send_wrapper)
+        finally:
+            _current.reset(token)
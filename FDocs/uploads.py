@@ -0,0 +1,147 @@
+"""
+Streaming, non-blocking upload helpers.
+
+`shutil.copyfileobj(upload.file, open(path, "wb"))` inside an `async def`
+blocks the event loop for the whole copy, stalling every other request on the
+worker. `save_upload` instead copies an `UploadFile` in chunks, with each
+chunk's disk write and hash update run in the threadpool, and enforces the size
+limit as it goes. `save_stream` does the same for a raw request body
+(`request.stream()`), where the limit stops the client before the body is
+fully received.
+
+Files are written to a uniquely named `<destination>.<random>.part` next to
+the destination and renamed into place once complete, so a failed or
+rejected upload never leaves a truncated file behind and concurrent uploads
+to the same name never write into each other's file.
+"""
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, Union
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+CHUNK_SIZE = 1024 * 1024
+
+# Suffix of in-progress uploads, which directory listings skip
+PARTIAL_SUFFIX = ".part"
+
+
+class SavedUpload:
+    """A file written by `save_upload` or `save_stream`."""
+
+    __slots__ = ("path", "size", "digest", "algorithm", "filename", "content_type")
+
+    def __init__(self, path: Path, size: int, digest: str, algorithm: str,
+                 filename: Optional[str] = None, content_type: Optional[str] = None):
+        self.path = path
+        self.size = size
+        self.digest = digest
+        self.algorithm = algorithm
+        self.filename = filename
+        self.content_type = content_type
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "saved_filename": self.path.name,
+            "content_type": self.content_type,
+            "size": self.size,
+            self.algorithm: self.digest,
+        }
+
+
+def _write_chunk(file: Any, hasher: Any, chunk: bytes) -> None:
+    # hashlib releases the GIL for large buffers, so hashing overlaps other work too
+    hasher.update(chunk)
+    file.write(chunk)
+
+
+def _partial_path(destination: Path) -> Path:
+    # Unlike a tempfile, keeps the umask's permissions for the renamed file
+    return destination.with_name(f"{destination.name}.{uuid.uuid4().hex}{PARTIAL_SUFFIX}")
+
+
+def _discard(file: Any, path: Path) -> None:
+    file.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _read_upload(upload: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    # UploadFile.read moves to the threadpool once the spooled file is on disk
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def save_stream(
+    chunks: AsyncIterable[bytes],
+    destination: Union[str, Path],
+    *,
+    max_size: Optional[int] = None,
+    algorithm: str = "sha256",
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+) -> SavedUpload:
+    """
+    Writes `chunks` to `destination` off the event loop, hashing as it goes.
+    Raises a 413 `HTTPException` as soon as more than `max_size` bytes arrive.
+    """
+    destination = Path(destination)
+    hasher = hashlib.new(algorithm)
+    size = 0
+    partial = _partial_path(destination)
+    # "x": never opens another upload's partial file
+    file = await run_in_threadpool(open, partial, "xb")
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise HTTPException(status_code=413, detail=f"Upload exceeds the {max_size} byte limit")
+            await run_in_threadpool(_write_chunk, file, hasher, chunk)
+        await run_in_threadpool(file.close)
+        await run_in_threadpool(os.replace, partial, destination)
+    except BaseException:
+        await run_in_threadpool(_discard, file, partial)
+        raise
+    return SavedUpload(destination, size, hasher.hexdigest(), algorithm, filename, content_type)
+
+
+async def save_upload(
+    upload: UploadFile,
+    destination: Union[str, Path],
+    *,
+    max_size: Optional[int] = None,
+    algorithm: str = "sha256",
+    chunk_size: int = CHUNK_SIZE,
+) -> SavedUpload:
+    """
+    Copies an `UploadFile` to `destination` without blocking the event loop.
+
+    Usage:
+        @app.post("/upload")
+        async def upload(file: UploadFile = File(...)):
+            saved = await save_upload(file, UPLOAD_DIR / "data.bin", max_size=50 * 1024 * 1024)
+            return saved.to_dict()
+    """
+    if max_size is not None and upload.size is not None and upload.size > max_size:
+        # Starlette already knows the size of parsed parts; skip the copy
+        raise HTTPException(status_code=413, detail=f"Upload exceeds the {max_size} byte limit")
+    await upload.seek(0)
+    return await save_stream(
+        _read_upload(upload, chunk_size),
+        destination,
+        max_size=max_size,
+        algorithm=algorithm,
+        filename=upload.filename,
+        content_type=upload.content_type,
+    )
@@ -0,0 +1,220 @@
+"""
+Benchmarks for the F-Docs serving layer and spec generation.
+
+Builds synthetic FastAPI apps with N routes and nested Pydantic models, wraps
+them with f_docs(), and drives them in-process over an ASGI transport (no
+network). Results are printed as JSON, one object per app size.
+
+Usage:
+    python benchmarks/bench_f_docs.py
+    python benchmarks/bench_f_docs.py --routes 10,1000,10000 --requests 500 --output results.json
+
+Requires httpx (pip install httpx).
+"""
+import argparse
+import asyncio
+import gc
+import gzip
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from pydantic import BaseModel, create_model
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from FDocs import f_docs  # noqa: E402
+from FDocs.docs_index import build_docs_index  # noqa: E402
+from FDocs.search import build_search_index  # noqa: E402
+
+
+def make_model(name: str, depth: int, width: int) -> Type[BaseModel]:
+    """A model nested `depth` levels deep, with `width` scalar fields per level."""
+    fields: Dict[str, Any] = {f"field_{i}": (Optional[str], None) for i in range(width)}
+    fields["count"] = (int, 0)
+    if depth > 0:
+        child = make_model(f"{name}Child{depth}", depth - 1, width)
+        fields["child"] = (Optional[child], None)
+        fields["children"] = (List[child], [])
+    return create_model(name, **fields)
+
+
+def build_app(routes: int, depth: int, width: int, models: int) -> FastAPI:
+    """A FastAPI app with `routes` operations spread over tags, sharing `models` model trees."""
+    app = FastAPI(title=f"Synthetic {routes}", docs_url=None, redoc_url=None)
+    model_types = [make_model(f"Model{m}", depth, width) for m in range(models)]
+
+    router = APIRouter()
+    for i in range(routes):
+        model = model_types[i % len(model_types)]
+        tag = f"Tag{i % 50}"
+
+        if i % 2:
+            def endpoint(item_id: int, body: model, q: Optional[str] = None) -> model:  # type: ignore[valid-type]
+                return body
+            router.add_api_route(f"/items{i}/{{item_id}}", endpoint, methods=["POST"], tags=[tag], name=f"op_{i}")
+        else:
+            def endpoint(item_id: int, limit: int = 10) -> List[model]:  # type: ignore[valid-type]
+                return []
+            router.add_api_route(f"/items{i}/{{item_id}}", endpoint, methods=["GET"], tags=[tag], name=f"op_{i}")
+    app.include_router(router)
+    return f_docs(app, cache_openapi=True, docs_index=True)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pick(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(pick(0.50) * 1000, 4),
+        "p90_ms": round(pick(0.90) * 1000, 4),
+        "p99_ms": round(pick(0.99) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
+
+
+async def measure(client: httpx.AsyncClient, url: str, requests: int, concurrency: int, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Latency percentiles and throughput for `requests` GETs at `concurrency`."""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    sizes: List[int] = []
+    queue = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in queue:
+            start = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            sizes.append(response.num_bytes_downloaded)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result = percentiles(latencies)
+    result.update({
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / elapsed, 1),
+        "statuses": statuses,
+        "wire_bytes": sizes[0] if sizes else 0,
+    })
+    return result
+
+
+def measure_openapi(app: FastAPI) -> Dict[str, Any]:
+    """Cold app.openapi() generation time, peak memory and payload sizes."""
+    app.openapi_schema = None
+    gc.collect()
+    start = time.perf_counter()
+    schema = app.openapi()
+    elapsed = time.perf_counter() - start
+
+    # Separate pass: tracemalloc slows allocation-heavy code down several times
+    app.openapi_schema = None
+    gc.collect()
+    tracemalloc.start()
+    app.openapi()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    payload = json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    serialize = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = json.dumps(build_docs_index(schema)).encode("utf-8")
+    index_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    search = json.dumps(build_search_index(schema)).encode("utf-8")
+    search_time = time.perf_counter() - start
+
+    return {
+        "generate_ms": round(elapsed * 1000, 2),
+        "generate_peak_mb": round(peak / 1024 / 1024, 2),
+        "serialize_ms": round(serialize * 1000, 2),
+        "spec_bytes": len(payload),
+        "spec_gzip_bytes": len(gzip.compress(payload, mtime=0)),
+        "docs_index_ms": round(index_time * 1000, 2),
+        "docs_index_bytes": len(index),
+        "search_index_ms": round(search_time * 1000, 2),
+        "search_index_bytes": len(search),
+    }
+
+
+async def bench_app(routes: int, args: argparse.Namespace) -> Dict[str, Any]:
+    start = time.perf_counter()
+    app = build_app(routes, args.depth, args.width, args.models)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    result: Dict[str, Any] = {
+        "routes": routes,
+        "model_depth": args.depth,
+        "app_build_ms": round(build_ms, 2),
+        "openapi": measure_openapi(app),
+    }
+
+    asset = next((r for r in app.routes if getattr(r, "name", "") == "f_docs_assets"), None)
+    asset_url = None
+    if asset is not None:
+        name = next((n for n in asset.app.files if n.endswith(".js")), None)
+        asset_url = f"/assets{name}" if name else None
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        n, c = args.requests, args.concurrency
+        result["docs_page"] = await measure(client, "/docs", n, c, {"Accept-Encoding": "gzip"})
+        etag = (await client.get("/docs")).headers.get("etag", "")
+        result["docs_page_304"] = await measure(client, "/docs", n, c, {"If-None-Match": etag})
+
+        cold = time.perf_counter()
+        await client.get("/openapi.json")
+        result["openapi_first_request_ms"] = round((time.perf_counter() - cold) * 1000, 2)
+        result["openapi_endpoint"] = await measure(client, "/openapi.json", n, c, {"Accept-Encoding": "gzip"})
+        etag = (await client.get("/openapi.json")).headers.get("etag", "")
+        result["openapi_304"] = await measure(client, "/openapi.json", n, c, {"If-None-Match": etag})
+        result["docs_index"] = await measure(client, "/docs/index.json", n, c, {"Accept-Encoding": "gzip"})
+
+        if asset_url:
+            result["asset_identity"] = await measure(client, asset_url, n, c, {"Accept-Encoding": "identity"})
+            result["asset_gzip"] = await measure(client, asset_url, n, c, {"Accept-Encoding": "gzip"})
+            result["asset_br"] = await measure(client, asset_url, n, c, {"Accept-Encoding": "br"})
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--routes", default="10,1000,10000", help="comma-separated app sizes")
+    parser.add_argument("--depth", type=int, default=4, help="nesting depth of the request/response models")
+    parser.add_argument("--width", type=int, default=5, help="scalar fields per model level")
+    parser.add_argument("--models", type=int, default=20, help="distinct model trees shared by the routes")
+    parser.add_argument("--requests", type=int, default=200, help="requests per HTTP measurement")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--output", help="write results to this file instead of stdout")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "results": [asyncio.run(bench_app(int(n), args)) for n in args.routes.split(",")],
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,12 @@
 from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, status, Query, Body, WebSocket, WebSocketDisconnect
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_mcp import FastApiMCP
 from typing import List, Optional, Dict, Any,Literal
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 import os
-import shutil
 from pathlib import Path
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -16,10 +14,9 @@ import socketio
 import asyncio
 import random
 import json
-from fastapi_mcp import FastApiMCP
 
 # Import custom F-Docs helper
-from FDocs import f_docs
+from FDocs import f_docs, BroadcastHub, DirectoryListing, save_upload, serve_file
 
 # Initialize FastAPI
 app = FastAPI(
@@ -28,9 +25,6 @@ app = FastAPI(
     redoc_url=None
 )
 
-# Apply F-Docs
-app = f_docs(app, title="F-Docs - Test API")
-
 # Socket.IO setup
 sio = socketio.AsyncServer(
     async_mode='asgi',
@@ -40,6 +34,9 @@ sio = socketio.AsyncServer(
 )
 socket_app = socketio.ASGIApp(sio, app)
 
+# Apply F-Docs
+app = f_docs(app, title="F-Docs - Test API", broadcast_metrics=True, socketio_server=sio, mcp_path="/mcp")
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -71,6 +68,8 @@ fake_users_db = {
 # สร้างโฟลเดอร์สำหรับเก็บรูปภาพ
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+MAX_UPLOAD_SIZE = 20 * 1024 * 1024
+upload_listing = DirectoryListing(UPLOAD_DIR, url_prefix="/files")
 
 # ===== Auth Models =====
 class Token(BaseModel):
@@ -595,13 +594,14 @@ async def upload_images(
         new_filename = f"{name}_{timestamp}_file{idx}{file_ext}"
         file_path = UPLOAD_DIR / new_filename
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # เขียนไฟล์เป็น chunk นอก event loop พร้อมจำกัดขนาดและคำนวณ sha256
+        saved = await save_upload(file, file_path, max_size=MAX_UPLOAD_SIZE)
         
         uploaded_files.append({
             "original_filename": file.filename,
             "saved_filename": new_filename,
-            "size": os.path.getsize(file_path)
+            "size": saved.size,
+            "sha256": saved.digest
         })
     
     return {
@@ -613,26 +613,16 @@ async def upload_images(
 @app.get("/files", tags=["Files"])
 async def get_all_files(current_user: dict = Depends(get_current_active_user)):
     """ดึงรายการไฟล์รูปภาพทั้งหมด"""
-    files = []
-    for file_path in UPLOAD_DIR.iterdir():
-        if file_path.is_file():
-            files.append({
-                "filename": file_path.name,
-                "size": file_path.stat().st_size,
-                "url": f"/files/{file_path.name}"
-            })
+    # สแกนโฟลเดอร์ใหม่เฉพาะเมื่อมีไฟล์เพิ่ม/ลบ/เปลี่ยนชื่อ
+    files = await upload_listing.entries()
     
     return {"total": len(files), "files": files}
 
 @app.get("/files/{filename}", tags=["Files"])
 async def get_file(filename: str, current_user: dict = Depends(get_current_active_user)):
     """ดาวน์โหลดหรือดูรูปภาพ"""
-    file_path = UPLOAD_DIR / filename
-    
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
-    
-    return FileResponse(file_path)
+    # รองรับ Range/If-Range, ETag และ 304 (ตอบ 404 ถ้าไม่พบไฟล์)
+    return await serve_file(UPLOAD_DIR, filename)
 
 @app.delete("/files/{filename}", tags=["Files"])
 async def delete_file(filename: str, current_user: dict = Depends(get_current_active_user)):
@@ -645,35 +635,10 @@ async def delete_file(filename: str, current_user: dict = Depends(get_current_ac
     file_path.unlink()
     return {"message": f"File {filename} deleted successfully"}
 
-# Mount the MCP server
-mcp = FastApiMCP(app)
-mcp.mount_http(mount_path="/mcp")
-
 # ===== WEBSOCKET CONNECTIONS MANAGER =====
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"✅ WebSocket client connected. Total: {len(self.active_connections)}")
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        print(f"❌ WebSocket client disconnected. Total: {len(self.active_connections)}")
-
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
-
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                pass
-
-manager = ConnectionManager()
+# Each client gets a bounded send queue drained by its own task, so a slow or
+# dead client only loses its own oldest messages instead of stalling the room
+manager = BroadcastHub("chat", queue_size=100, policy="drop_oldest")
 
 # ===== WEBSOCKET ENDPOINTS =====
 @app.websocket("/ws")
@@ -682,11 +647,11 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         # ส่งข้อความต้อนรับ
-        await websocket.send_json({
+        await manager.send_personal_message({
             "type": "welcome",
             "message": "Connected to WebSocket server!",
             "timestamp": datetime.now().isoformat()
-        })
+        }, websocket)
         
         while True:
             # รับข้อความจาก client
@@ -702,11 +667,11 @@ async def websocket_endpoint(websocket: WebSocket):
                     "received": message,
                     "timestamp": datetime.now().isoformat()
                 }
-                await websocket.send_json(response)
+                await manager.send_personal_message(response, websocket)
                 
             except json.JSONDecodeError:
                 # ถ้าไม่ใช่ JSON ก็ส่งกลับเป็น text
-                await websocket.send_text(f"Echo: {data}")
+                await manager.send_personal_message(f"Echo: {data}", websocket)
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -791,10 +756,6 @@ async def websocket_chat(websocket: WebSocket):
         }))
 
 
-
-mcp = FastApiMCP(app)
-mcp.mount_http(mount_path="/mcp")
-
 # ===== SOCKET.IO EVENTS =====
 @sio.event
 async def connect(sid, environ):
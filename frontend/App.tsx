@@ -1,15 +1,18 @@
-import React, { useState, useEffect, useCallback, useRef, useLayoutEffect } from 'react';
+import React, { useState, useEffect, useCallback, useRef, useLayoutEffect, useMemo } from 'react';
 import { Layers, Search, Box, Terminal, Zap, Globe, AlertCircle, ArrowRight, ChevronDown, ChevronRight, Lock, Unlock, X, ExternalLink, Loader2, Check, LayoutList, Sidebar, Settings, Activity, Radio, Database, Wrench, MessageSquare, Sun, Moon, Plus, Trash2, Send } from 'lucide-react';
 import { useTheme } from './components/ThemeContext';
 import { Endpoint, ApiTag, SecurityScheme, Method } from './types';
 import { EndpointCard } from './components/EndpointCard';
-import { parseOpenApi } from './services/openapiParser';
+import { parseOpenApi, loadManifest, loadTagChunk } from './services/openapiParser';
+import { loadSearchIndex, searchIndex, LoadedSearchIndex } from './services/searchIndex';
+import { loadRouteMetrics, formatLatency, RouteMetrics } from './services/metricsService';
 import { MethodBadge } from './components/MethodBadge';
 import { WebSocketTester } from './components/WebSocketTester';
 import { SocketIoTester } from './components/SocketIoTester';
 import { useMcp, McpResource, McpTool, McpPrompt } from './hooks/useMcp';
 import { McpConnection } from './components/McpConnection';
 import { McpItemCard } from './components/McpItemCard'; // We will use this directly
+import { McpBenchmarkPanel } from './components/McpBenchmarkPanel';
 import { useSocketIO } from './hooks/useSocketIO';
 import { useWebSocket } from './hooks/useWebSocket';
 
@@ -510,6 +513,8 @@ const ENABLE_API = import.meta.env.VITE_ENABLE_API !== 'false';
 const ENABLE_WS = import.meta.env.VITE_ENABLE_WS !== 'false';
 const ENABLE_IO = import.meta.env.VITE_ENABLE_IO !== 'false';
 const ENABLE_MCP = import.meta.env.VITE_ENABLE_MCP !== 'false';
+// Set by f_docs(..., mcp_path=..., load_testing=True)
+const MCP_BENCHMARK_URL: string | undefined = (window as any).NEXUS_CONFIG?.mcpBenchmarkUrl;
 
 const availableModules = [
   { id: 'api', enabled: ENABLE_API },
@@ -673,9 +678,15 @@ export default function App() {
   const [endpoints, setEndpoints] = useState<Endpoint[]>([]);
   const [tags, setTags] = useState<ApiTag[]>([]);
   const [securitySchemes, setSecuritySchemes] = useState<Record<string, SecurityScheme>>({});
+
+  // Lazy per-tag chunks
+  const chunksUrlRef = useRef<string | null>(null);
+  const loadedChunksRef = useRef<Set<string>>(new Set());
   
   // UI State
   const [searchTerm, setSearchTerm] = useState('');
+  const [serverSearchIndex, setServerSearchIndex] = useState<LoadedSearchIndex | null>(null);
+  const [routeMetrics, setRouteMetrics] = useState<Record<string, RouteMetrics>>({});
   const [selectedTag, setSelectedTag] = useState<string>('All');
   const [viewMode, setViewMode] = useState<'list' | 'focused'>('focused');
   const { theme, toggleTheme } = useTheme();
@@ -900,7 +911,25 @@ export default function App() {
     setIsLoading(true);
     setError(null);
     try {
-      const spec = await parseOpenApi(url);
+      // The server-built docs index only describes the backend's own spec
+      const globalConfig = (window as any).NEXUS_CONFIG || {};
+      const isBackendSpec = url === globalConfig.openApiUrl;
+      const docsIndexUrl = isBackendSpec ? globalConfig.docsIndexUrl : undefined;
+
+      // Lazy mode: render from the manifest, fetch each tag's endpoints on demand
+      loadedChunksRef.current = new Set();
+      chunksUrlRef.current = isBackendSpec && globalConfig.manifestUrl ? globalConfig.chunksUrl : null;
+      const spec = chunksUrlRef.current
+        ? await loadManifest(globalConfig.manifestUrl)
+        : await parseOpenApi(url, docsIndexUrl);
+
+      // Search index loads in the background; plain filtering works until it arrives
+      setServerSearchIndex(null);
+      if (isBackendSpec && globalConfig.searchIndexUrl) {
+        loadSearchIndex(globalConfig.searchIndexUrl)
+          .then(setServerSearchIndex)
+          .catch(e => console.warn("Search index unavailable:", e));
+      }
       setApiTitle(spec.title);
       setApiVersion(spec.version);
       setBaseUrl(spec.baseUrl);
@@ -939,13 +968,103 @@ export default function App() {
     }
   };
 
+  // Per-route production metrics, refreshed periodically
+  useEffect(() => {
+    const globalConfig = (window as any).NEXUS_CONFIG || {};
+    if (!globalConfig.metricsUrl || currentSpecUrl !== globalConfig.openApiUrl) return;
+
+    let cancelled = false;
+    const refresh = async () => {
+      try {
+        const snapshot = await loadRouteMetrics(globalConfig.metricsUrl);
+        if (!cancelled) setRouteMetrics(snapshot.routes);
+      } catch (e) {
+        console.warn("Failed to load route metrics:", e);
+      }
+    };
+    refresh();
+    const timer = setInterval(refresh, 10000);
+    return () => {
+      cancelled = true;
+      clearInterval(timer);
+    };
+  }, [currentSpecUrl]);
+
+  // Live spec updates: patch the endpoint list in place so tester state survives
+  useEffect(() => {
+    const globalConfig = (window as any).NEXUS_CONFIG || {};
+    if (!globalConfig.eventsUrl || currentSpecUrl !== globalConfig.openApiUrl) return;
+
+    const applyDiff = (diff: any) => {
+      const removed = new Set<string>(diff.removed);
+      const changed = new Map<string, Endpoint>(diff.changed.map((ep: Endpoint) => [ep.id, ep]));
+      setEndpoints(prev => [
+        ...prev.filter(ep => !removed.has(ep.id)).map(ep => changed.get(ep.id) || ep),
+        ...diff.added
+      ]);
+      setTags(diff.tags);
+      setSecuritySchemes(diff.securitySchemes || {});
+    };
+
+    // The server lost track of our version (e.g. after a restart): refetch, but keep UI state
+    const refresh = async () => {
+      try {
+        const spec = await parseOpenApi(currentSpecUrl, globalConfig.docsIndexUrl);
+        setEndpoints(spec.endpoints);
+        setTags(spec.tags);
+        setSecuritySchemes(spec.securitySchemes || {});
+      } catch (e) {
+        console.error("Failed to refresh the API spec:", e);
+      }
+    };
+
+    const source = new EventSource(globalConfig.eventsUrl);
+    source.addEventListener('diff', event => applyDiff(JSON.parse((event as MessageEvent).data)));
+    source.addEventListener('reload', () => refresh());
+    return () => source.close();
+  }, [currentSpecUrl]);
+
+  const ensureTagLoaded = useCallback(async (tagName: string) => {
+    const chunksUrl = chunksUrlRef.current;
+    if (!chunksUrl || loadedChunksRef.current.has(tagName)) return;
+    loadedChunksRef.current.add(tagName);
+    try {
+      const loaded = await loadTagChunk(chunksUrl, tagName);
+      const byId = new Map(loaded.map(ep => [ep.id, ep]));
+      setEndpoints(prev => prev.map(ep => byId.get(ep.id) || ep));
+    } catch (e) {
+      loadedChunksRef.current.delete(tagName);
+      console.error(`Failed to load endpoints for tag ${tagName}:`, e);
+    }
+  }, []);
+
+  // Focused view: load the chunk behind the opened endpoint
+  useEffect(() => {
+    const active = endpoints.find(e => e.id === activeEndpointId);
+    if (active?.isStub) ensureTagLoaded(active.tags[0]);
+  }, [activeEndpointId, endpoints, ensureTagLoaded]);
+
+  // List view: load the chunks of the tags being rendered
+  useEffect(() => {
+    if (viewMode !== 'list' || !chunksUrlRef.current) return;
+    tags
+      .filter(tag => selectedTag === 'All' || selectedTag === tag.name)
+      .forEach(tag => ensureTagLoaded(tag.name));
+  }, [viewMode, selectedTag, tags, ensureTagLoaded]);
+
   const toggleSidebarTag = (tagName: string) => {
+    if (!expandedSidebarTags[tagName]) ensureTagLoaded(tagName);
     setExpandedSidebarTags(prev => ({...prev, [tagName]: !prev[tagName]}));
   };
 
   // Filter logic
+  const indexMatches = useMemo(
+    () => (serverSearchIndex && searchTerm ? searchIndex(serverSearchIndex, searchTerm) : null),
+    [serverSearchIndex, searchTerm]
+  );
   const filteredEndpoints = endpoints.filter(ep => {
-    const matchesSearch = ep.path.toLowerCase().includes(searchTerm.toLowerCase()) || 
+    const matchesSearch = !!indexMatches?.has(ep.id) ||
+                          ep.path.toLowerCase().includes(searchTerm.toLowerCase()) || 
                           ep.summary.toLowerCase().includes(searchTerm.toLowerCase());
     
     if (viewMode === 'list') {
@@ -1168,6 +1287,14 @@ export default function App() {
                                                     <MethodBadge method={ep.method} className="w-full block text-center scale-[0.80] origin-left" />
                                                 </div>
                                                 <span className="truncate font-mono">{ep.path}</span>
+                                                {routeMetrics[ep.id] && (
+                                                    <span
+                                                        title={`${routeMetrics[ep.id].count} requests, p50 ${formatLatency(routeMetrics[ep.id].latency.p50)}, 5xx ${routeMetrics[ep.id].statuses['5xx'] || 0}`}
+                                                        className={`ml-auto shrink-0 font-mono text-[9px] ${routeMetrics[ep.id].statuses['5xx'] ? 'text-red-500' : 'text-zinc-400 dark:text-zinc-500'}`}
+                                                    >
+                                                        p99 {formatLatency(routeMetrics[ep.id].latency.p99)}
+                                                    </span>
+                                                )}
                                             </button>
                                         ))}
                                     </div>
@@ -1915,6 +2042,14 @@ export default function App() {
                     <div className="p-4 md:p-6 w-full pb-20 min-w-0 flex-1 max-w-none">
                          <div className="animate-in fade-in slide-in-from-right-4 duration-300 w-full">
 
+                            {MCP_BENCHMARK_URL && mcp.tools.length > 0 && (
+                                <McpBenchmarkPanel
+                                    benchmarkUrl={MCP_BENCHMARK_URL}
+                                    tools={mcp.tools}
+                                    selectedTool={activeMcpItem?.type === 'TOOL' ? activeMcpItem.data.name : undefined}
+                                />
+                            )}
+
                             {activeMcpItem ? (
                                 <McpItemCard 
                                     type={activeMcpItem.type} 
@@ -0,0 +1,41 @@
+import React, { useEffect } from "react";
+import { FileWarning } from "lucide-react";
+import { BinaryPreview, PREVIEW_BYTES } from "../services/binaryPreview";
+import { formatBytes } from "../services/socketIoCatalogService";
+
+/** Renders a binary response: media inline, everything else as a hex dump of its first bytes. */
+export const BinaryPreviewView: React.FC<{ preview: BinaryPreview }> = ({ preview }) => {
+  const { contentType, size, src, hex, truncated, acceptRanges } = preview;
+
+  // Object URLs pin the fetched bytes until revoked
+  useEffect(() => () => {
+    if (src?.startsWith("blob:")) URL.revokeObjectURL(src);
+  }, [src]);
+
+  return (
+    <div className="flex flex-col gap-3">
+      <div className="flex flex-wrap items-center gap-2 text-[10px] font-mono text-zinc-500">
+        <span className="px-1.5 py-0.5 rounded bg-zinc-100 dark:bg-zinc-900 text-zinc-700 dark:text-zinc-300">{contentType}</span>
+        {size !== null && <span>{formatBytes(size)}</span>}
+        <span>{acceptRanges ? "range requests supported" : "no range support"}</span>
+        {truncated && <span>· preview of the first {formatBytes(PREVIEW_BYTES)}</span>}
+      </div>
+
+      {src && contentType.startsWith("image/") && (
+        <img src={src} alt="Response preview" className="max-w-full max-h-[480px] object-contain self-start rounded border border-zinc-200 dark:border-zinc-800" />
+      )}
+      {src && contentType.startsWith("video/") && <video src={src} controls preload="metadata" className="max-w-full max-h-[480px]" />}
+      {src && contentType.startsWith("audio/") && <audio src={src} controls preload="metadata" className="w-full" />}
+
+      {hex && !(src && contentType.startsWith("image/")) && (
+        <pre className="text-[10px] leading-relaxed font-mono text-zinc-700 dark:text-zinc-300 whitespace-pre overflow-x-auto">{hex}</pre>
+      )}
+
+      {!src && !hex && (
+        <div className="flex items-center gap-2 text-xs text-zinc-500">
+          <FileWarning size={14} /> The server does not support range requests, so this file is not previewed.
+        </div>
+      )}
+    </div>
+  );
+};
@@ -0,0 +1,86 @@
+import React, { useEffect, useRef, useState } from "react";
+import { Share2 } from "lucide-react";
+import { BroadcastHubMetrics, loadBroadcastMetrics } from "../services/broadcastService";
+import { formatLatency } from "../services/metricsService";
+
+const POLL_MS = 2000;
+
+/** Live counters of the server's broadcast hubs, with rates derived between polls. */
+export const BroadcastMetricsPanel: React.FC<{ url: string }> = ({ url }) => {
+  const [hubs, setHubs] = useState<BroadcastHubMetrics[]>([]);
+  const [rates, setRates] = useState<Record<string, number>>({});
+  const previousRef = useRef<Record<string, { delivered: number; at: number }>>({});
+
+  useEffect(() => {
+    let cancelled = false;
+    const refresh = async () => {
+      try {
+        const next = await loadBroadcastMetrics(url);
+        if (cancelled) return;
+        const now = Date.now();
+        const nextRates: Record<string, number> = {};
+        for (const hub of next) {
+          const previous = previousRef.current[hub.name];
+          if (previous && now > previous.at) {
+            nextRates[hub.name] = ((hub.delivered - previous.delivered) * 1000) / (now - previous.at);
+          }
+          previousRef.current[hub.name] = { delivered: hub.delivered, at: now };
+        }
+        setHubs(next);
+        setRates(nextRates);
+      } catch (e) {
+        console.warn("Failed to load broadcast metrics:", e);
+      }
+    };
+    refresh();
+    const timer = setInterval(refresh, POLL_MS);
+    return () => {
+      cancelled = true;
+      clearInterval(timer);
+    };
+  }, [url]);
+
+  if (!hubs.length) return null;
+
+  return (
+    <div className="grid grid-cols-1 md:grid-cols-2 gap-3 mb-6">
+      {hubs.map((hub) => (
+        <div key={hub.name} className="rounded-lg border border-zinc-200 dark:border-zinc-800 bg-white dark:bg-zinc-900/50 p-3">
+          <div className="flex items-center justify-between mb-2">
+            <span className="flex items-center gap-2 text-xs font-bold text-zinc-700 dark:text-zinc-200">
+              <Share2 size={12} /> {hub.name}
+            </span>
+            <span className="text-[10px] font-mono text-zinc-500">
+              {hub.policy} · queue {hub.queueSize}
+            </span>
+          </div>
+          <div className="grid grid-cols-4 gap-2 text-[10px] font-mono">
+            {[
+              ["clients", `${hub.connections} (peak ${hub.peakConnections})`],
+              ["msg/s", (rates[hub.name] ?? hub.deliveredPerSecond).toFixed(1)],
+              ["delivered", String(hub.delivered)],
+              ["queued", `${hub.queued} (max ${hub.maxQueued})`],
+              ["dropped", String(hub.dropped)],
+              ["evicted", String(hub.evicted)],
+              ["errors", String(hub.sendErrors)],
+              ["p99", formatLatency(hub.deliveryLatency.p99)],
+            ].map(([label, value]) => (
+              <div key={label}>
+                <div className="uppercase tracking-wide text-zinc-500">{label}</div>
+                <div
+                  className={`font-bold ${
+                    (label === "dropped" || label === "evicted" || label === "errors") && value !== "0"
+                      ? "text-amber-500"
+                      : "text-zinc-800 dark:text-zinc-200"
+                  }`}
+                >
+                  {value}
+                </div>
+              </div>
+            ))}
+          </div>
+        </div>
+      ))}
+    </div>
+  );
+};
@@ -20,7 +20,9 @@ import {
   AlertCircle,
   MoreVertical,
   MessageSquare,
-  Plus
+  Plus,
+  Gauge,
+  Flame
 } from "lucide-react";
 import { useEndpointPersistence } from '../hooks/useEndpointPersistence';
 import { JsonDisplay } from "./JsonDisplay";
@@ -28,7 +30,21 @@ import { JsonEditor } from "./JsonEditor";
 import { MarkdownDisplay } from "./MarkdownDisplay";
 import { Endpoint, Method, SimulationResponse, SecurityScheme } from "../types";
 import { MethodBadge } from "./MethodBadge";
-import { executeRequest } from "../services/mockApiService";
+import { BatchRequest, executeRequest, sameOriginPath } from "../services/mockApiService";
+import { LoadTestPanel } from "./LoadTestPanel";
+import { FlameGraph } from "./FlameGraph";
+import { TimingWaterfall } from "./TimingWaterfall";
+import { BinaryPreviewView } from "./BinaryPreviewView";
+import { parseServerTiming } from "../services/serverTiming";
+import { formatBytes } from "../services/socketIoCatalogService";
+import {
+  PROFILE_HEADER,
+  PROFILE_ID_HEADER,
+  RequestProfile,
+  getProfileToken,
+  loadProfile,
+  setProfileToken,
+} from "../services/profileService";
 import { generateMockPayload } from "../services/geminiService";
 
 interface EndpointCardProps {
@@ -78,6 +94,7 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
   );
 
   const [isLoading, setIsLoading] = useState(false);
+  const [uploadProgress, setUploadProgress] = useState<{ loaded: number; total: number } | null>(null);
   const [isGenerating, setIsGenerating] = useState(false);
   const [response, setResponse] = useState<SimulationResponse | null>(null);
   const [copied, setCopied] = useState(false);
@@ -250,6 +267,28 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
     return { finalPath: path, headers: h };
   }, [endpoint, paramValues, authCredentials, securitySchemes, isSecured]);
 
+  // Server-side load testing (f_docs(..., load_testing=True))
+  const loadTestUrl: string | undefined = (window as any).NEXUS_CONFIG?.loadTestUrl;
+  const loadTestRequest = useMemo<BatchRequest | null>(() => {
+    const basePath = sameOriginPath(baseUrl);
+    if (!loadTestUrl || isMultipart || basePath === null) return null;
+    const requestHeaders = { ...headers };
+    if (bodyValue) requestHeaders["Content-Type"] = "application/json";
+    return {
+      method: endpoint.method,
+      path: `${basePath}${finalPath}`,
+      headers: requestHeaders,
+      body: bodyValue || undefined,
+    };
+  }, [loadTestUrl, isMultipart, baseUrl, endpoint.method, finalPath, headers, bodyValue]);
+
+  // On-demand profiling (f_docs(..., profile_token=...))
+  const profilesUrl: string | undefined = (window as any).NEXUS_CONFIG?.profilesUrl;
+  const [profileEnabled, setProfileEnabled] = useState(false);
+  const [profileToken, setProfileTokenState] = useState(getProfileToken);
+  const [profile, setProfile] = useState<RequestProfile | null>(null);
+  const [profileError, setProfileError] = useState<string | null>(null);
+
   const handleExecute = async () => {
     // Validation
     const missingFields: string[] = [];
@@ -288,15 +327,32 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
         });
         finalBody = formData;
       }
+      setUploadProgress(null);
+
+      const profiling = Boolean(profilesUrl && profileEnabled && profileToken);
+      setProfile(null);
+      setProfileError(null);
 
       const res = await executeRequest(
         baseUrl,
         endpoint.method,
         finalPath,
         finalBody,
-        headers,
+        profiling ? { ...headers, [PROFILE_HEADER]: profileToken } : headers,
+        isMultipart ? (loaded, total) => setUploadProgress({ loaded, total }) : undefined,
       );
       setResponse(res);
+
+      const profileId = res.headers?.[PROFILE_ID_HEADER];
+      if (profiling && profilesUrl) {
+        if (profileId) {
+          loadProfile(profilesUrl, profileId, profileToken)
+            .then(setProfile)
+            .catch((e) => setProfileError(e.message));
+        } else {
+          setProfileError(res.status === 403 ? "Invalid profiling token" : "The server did not return a profile");
+        }
+      }
     } finally {
       setIsLoading(false);
     }
@@ -975,6 +1031,32 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
                 )}
               </div>
 
+              {profilesUrl && (
+                <div className="flex items-center gap-2 mb-2 text-xs text-zinc-500">
+                  <label className="flex items-center gap-1.5 shrink-0 cursor-pointer">
+                    <input
+                      type="checkbox"
+                      checked={profileEnabled}
+                      onChange={(e) => setProfileEnabled(e.target.checked)}
+                    />
+                    <Flame size={12} className={profileEnabled ? "text-orange-500" : ""} />
+                    Profile
+                  </label>
+                  {profileEnabled && (
+                    <input
+                      type="password"
+                      placeholder="Profiling token"
+                      value={profileToken}
+                      onChange={(e) => {
+                        setProfileTokenState(e.target.value);
+                        setProfileToken(e.target.value);
+                      }}
+                      className="flex-1 min-w-0 bg-zinc-50 dark:bg-zinc-900 border border-zinc-200 dark:border-zinc-800 rounded px-2 py-1 font-mono text-zinc-800 dark:text-zinc-200"
+                    />
+                  )}
+                </div>
+              )}
+
               <button
                 onClick={handleExecute}
                 disabled={isLoading}
@@ -1014,6 +1096,32 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
                     />
                     Live
                   </button>
+                  {(profile || profileError) && (
+                    <button
+                      onClick={() => setRightPanelTab("profile")}
+                      className={`px-3 py-1 text-xs font-medium rounded-full transition-all flex items-center gap-1.5 whitespace-nowrap ${
+                        rightPanelTab === "profile"
+                          ? "bg-white dark:bg-zinc-700 text-zinc-900 dark:text-white shadow-sm ring-1 ring-zinc-200 dark:ring-zinc-600"
+                          : "text-zinc-500 hover:text-zinc-700 dark:hover:text-zinc-300 hover:bg-zinc-100 dark:hover:bg-zinc-800/50"
+                      }`}
+                    >
+                      <Flame size={10} className={rightPanelTab === "profile" ? "text-orange-500" : ""} />
+                      Profile
+                    </button>
+                  )}
+                  {loadTestUrl && (
+                    <button
+                      onClick={() => setRightPanelTab("load")}
+                      className={`px-3 py-1 text-xs font-medium rounded-full transition-all flex items-center gap-1.5 whitespace-nowrap ${
+                        rightPanelTab === "load"
+                          ? "bg-white dark:bg-zinc-700 text-zinc-900 dark:text-white shadow-sm ring-1 ring-zinc-200 dark:ring-zinc-600"
+                          : "text-zinc-500 hover:text-zinc-700 dark:hover:text-zinc-300 hover:bg-zinc-100 dark:hover:bg-zinc-800/50"
+                      }`}
+                    >
+                      <Gauge size={10} />
+                      Load
+                    </button>
+                  )}
                   {/* Removed cURL Tab */}
                   <div className="w-px h-4 bg-zinc-300 dark:bg-zinc-800 mx-1 self-center"></div>
                   {responseCodes.map((code) => (
@@ -1058,9 +1166,23 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
                           size={32}
                           className="text-blue-500 animate-spin mb-3"
                         />
-                        <p className="text-zinc-400 text-xs font-medium animate-pulse">
-                          Sending Request...
-                        </p>
+                        {uploadProgress && uploadProgress.loaded < uploadProgress.total ? (
+                          <div className="w-48 flex flex-col items-center gap-1.5">
+                            <div className="w-full h-1.5 rounded-full bg-zinc-200 dark:bg-zinc-800 overflow-hidden">
+                              <div
+                                className="h-full bg-blue-500 transition-all"
+                                style={{ width: `${(uploadProgress.loaded / uploadProgress.total) * 100}%` }}
+                              />
+                            </div>
+                            <p className="text-zinc-400 text-xs font-medium font-mono">
+                              Uploading {formatBytes(uploadProgress.loaded)} / {formatBytes(uploadProgress.total)}
+                            </p>
+                          </div>
+                        ) : (
+                          <p className="text-zinc-400 text-xs font-medium animate-pulse">
+                            {uploadProgress ? "Waiting for response..." : "Sending Request..."}
+                          </p>
+                        )}
                       </div>
                     )}
 
@@ -1095,14 +1217,33 @@ export const EndpointCard: React.FC<EndpointCardProps> = ({
                             )}
                           </button>
                         </div>
+                        <TimingWaterfall entries={parseServerTiming(response.headers?.["server-timing"])} />
                         <div className="flex-1 p-4 overflow-y-auto custom-scrollbar min-h-0">
-                            <JsonDisplay data={response.data} />
+                            {response.preview ? (
+                              <BinaryPreviewView preview={response.preview} />
+                            ) : (
+                              <JsonDisplay data={response.data} />
+                            )}
                         </div>
                       </>
                     )}
                   </div>
                 )}
 
+                {/* Profile Tab */}
+                {rightPanelTab === "profile" && (
+                  profile ? (
+                    <FlameGraph profile={profile} />
+                  ) : (
+                    <div className="flex-1 flex items-center justify-center p-6 text-xs text-red-400">{profileError}</div>
+                  )
+                )}
+
+                {/* Load Test Tab */}
+                {rightPanelTab === "load" && loadTestUrl && (
+                  <LoadTestPanel loadTestUrl={loadTestUrl} request={loadTestRequest} />
+                )}
+
                 {/* 2. Example Response Tabs (Replaces the bottom table description) */}
                 {responseCodes.includes(rightPanelTab) &&
                   endpoint.responses[parseInt(rightPanelTab)] && (
@@ -0,0 +1,58 @@
+import React, { useMemo, useState } from "react";
+import { buildFlameTree, FlameNode, RequestProfile } from "../services/profileService";
+
+const COLORS = ["bg-orange-500/80", "bg-amber-500/80", "bg-red-500/70", "bg-yellow-500/80"];
+
+const FlameRow: React.FC<{ node: FlameNode; total: number; depth: number; onFocus: (node: FlameNode) => void }> = ({
+  node,
+  total,
+  depth,
+  onFocus,
+}) => (
+  <div className="flex flex-col min-w-0" style={{ width: `${(node.value / total) * 100}%` }}>
+    <button
+      onClick={() => onFocus(node)}
+      title={`${node.name}: ${node.value} samples (${((node.value / total) * 100).toFixed(1)}%)`}
+      className={`h-5 px-1 text-[10px] font-mono text-left text-zinc-900 truncate border-r border-b border-white/40 dark:border-zinc-950/40 hover:brightness-110 ${COLORS[depth % COLORS.length]}`}
+    >
+      {node.name}
+    </button>
+    <div className="flex">
+      {node.children
+        .slice()
+        .sort((a, b) => b.value - a.value)
+        .map((child) => (
+          <FlameRow key={child.name} node={child} total={node.value} depth={depth + 1} onFocus={onFocus} />
+        ))}
+    </div>
+  </div>
+);
+
+/** Icicle-style flame graph of a request profile; click a frame to zoom in. */
+export const FlameGraph: React.FC<{ profile: RequestProfile }> = ({ profile }) => {
+  const tree = useMemo(() => buildFlameTree(profile.stacks), [profile]);
+  const [focus, setFocus] = useState<FlameNode | null>(null);
+  const root = focus || tree;
+
+  return (
+    <div className="flex-1 flex flex-col gap-2 p-4 overflow-auto custom-scrollbar min-h-0">
+      <div className="flex items-center justify-between text-[10px] font-mono text-zinc-500">
+        <span>
+          {profile.method} {profile.path} · {profile.durationMs}ms · {profile.samples} samples
+        </span>
+        {focus && (
+          <button onClick={() => setFocus(null)} className="text-blue-500 hover:underline">
+            Reset zoom
+          </button>
+        )}
+      </div>
+      {root.value === 0 ? (
+        <div className="text-xs text-zinc-500">The request finished before any sample was taken.</div>
+      ) : (
+        <div className="flex">
+          <FlameRow node={root} total={root.value} depth={0} onFocus={setFocus} />
+        </div>
+      )}
+    </div>
+  );
+};
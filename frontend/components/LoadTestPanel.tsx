@@ -0,0 +1,148 @@
+import React, { useEffect, useRef, useState } from "react";
+import { Activity, Loader2, Play, Square } from "lucide-react";
+import { BatchRequest } from "../services/mockApiService";
+import { LoadTestEvent, runLoadTest } from "../services/loadTestService";
+
+interface LoadTestPanelProps {
+  loadTestUrl: string;
+  /** The card's prepared request; null when it cannot be replayed on the server. */
+  request: BatchRequest | null;
+}
+
+const Stat: React.FC<{ label: string; value: string; tone?: string }> = ({ label, value, tone }) => (
+  <div className="rounded-md border border-zinc-200 dark:border-zinc-800 px-3 py-2">
+    <div className="text-[10px] uppercase tracking-wide text-zinc-500">{label}</div>
+    <div className={`text-sm font-mono font-bold ${tone || "text-zinc-800 dark:text-zinc-200"}`}>{value}</div>
+  </div>
+);
+
+// Over HTTP only when the server has a network_origin to target
+const networkTests = Boolean((window as any).NEXUS_CONFIG?.networkTests);
+
+export const LoadTestPanel: React.FC<LoadTestPanelProps> = ({ loadTestUrl, request }) => {
+  const [total, setTotal] = useState(1000);
+  const [concurrency, setConcurrency] = useState(20);
+  const [rps, setRps] = useState("");
+  const [mode, setMode] = useState<"asgi" | "http">("asgi");
+  const [event, setEvent] = useState<LoadTestEvent | null>(null);
+  const [error, setError] = useState<string | null>(null);
+  const [isRunning, setIsRunning] = useState(false);
+  const abortRef = useRef<AbortController | null>(null);
+
+  useEffect(() => () => abortRef.current?.abort(), []);
+
+  const handleRun = async () => {
+    if (!request) return;
+    const controller = new AbortController();
+    abortRef.current = controller;
+    setIsRunning(true);
+    setError(null);
+    setEvent(null);
+    try {
+      await runLoadTest(
+        loadTestUrl,
+        request,
+        { total, concurrency, rps: rps ? Number(rps) : undefined, mode },
+        setEvent,
+        controller.signal
+      );
+    } catch (e: any) {
+      if (e.name !== "AbortError") setError(e.message);
+    } finally {
+      setIsRunning(false);
+    }
+  };
+
+  const maxBucket = Math.max(1, ...(event?.histogram || []).map(([, count]) => count));
+  const inputClass =
+    "w-full bg-zinc-50 dark:bg-zinc-900 border border-zinc-200 dark:border-zinc-800 rounded px-2 py-1 text-xs font-mono text-zinc-800 dark:text-zinc-200";
+
+  if (!request) {
+    return (
+      <div className="flex-1 flex items-center justify-center p-6 text-xs text-zinc-500 text-center">
+        Load tests replay JSON requests against this server; multipart bodies and external base URLs are not supported.
+      </div>
+    );
+  }
+
+  return (
+    <div className="flex-1 flex flex-col gap-3 p-4 overflow-y-auto custom-scrollbar min-h-0">
+      <div className="grid grid-cols-2 sm:grid-cols-4 gap-2">
+        <label className="text-[10px] uppercase tracking-wide text-zinc-500">
+          Requests
+          <input type="number" min={1} value={total} onChange={(e) => setTotal(Number(e.target.value))} className={inputClass} />
+        </label>
+        <label className="text-[10px] uppercase tracking-wide text-zinc-500">
+          Concurrency
+          <input type="number" min={1} value={concurrency} onChange={(e) => setConcurrency(Number(e.target.value))} className={inputClass} />
+        </label>
+        <label className="text-[10px] uppercase tracking-wide text-zinc-500">
+          Target RPS
+          <input type="number" min={1} placeholder="max" value={rps} onChange={(e) => setRps(e.target.value)} className={inputClass} />
+        </label>
+        <label className="text-[10px] uppercase tracking-wide text-zinc-500">
+          Transport
+          <select value={mode} onChange={(e) => setMode(e.target.value as "asgi" | "http")} className={inputClass}>
+            <option value="asgi">In-process</option>
+            {networkTests && <option value="http">HTTP</option>}
+          </select>
+        </label>
+      </div>
+
+      <button
+        onClick={isRunning ? () => abortRef.current?.abort() : handleRun}
+        className="self-start flex items-center gap-1.5 px-3 py-1.5 rounded-md text-xs font-bold bg-blue-600 hover:bg-blue-500 text-white transition-colors"
+      >
+        {isRunning ? <Square size={12} /> : <Play size={12} />}
+        {isRunning ? "Stop" : "Run load test"}
+      </button>
+
+      {error && <div className="text-xs text-red-400">{error}</div>}
+
+      {isRunning && !event && (
+        <div className="flex items-center gap-2 text-xs text-zinc-500">
+          <Loader2 size={14} className="animate-spin" /> Warming up...
+        </div>
+      )}
+
+      {event && (
+        <>
+          <div className="flex items-center gap-2 text-xs text-zinc-500">
+            <Activity size={12} />
+            {event.completed}/{event.total} requests in {event.elapsed.toFixed(2)}s
+            {event.type === "progress" && <Loader2 size={12} className="animate-spin" />}
+          </div>
+          <div className="grid grid-cols-2 sm:grid-cols-4 gap-2">
+            <Stat label="Throughput" value={`${event.throughput} req/s`} />
+            <Stat
+              label="Errors"
+              value={`${(event.errorRate * 100).toFixed(1)}%`}
+              tone={event.errorRate > 0 ? "text-red-400" : "text-emerald-400"}
+            />
+            <Stat label="p50" value={`${event.latency.p50} ms`} />
+            <Stat label="p90" value={`${event.latency.p90} ms`} />
+            <Stat label="p99" value={`${event.latency.p99} ms`} />
+            <Stat label="Max" value={`${event.latency.max} ms`} />
+            <Stat label="Mean" value={`${event.latency.mean} ms`} />
+            <Stat
+              label="Statuses"
+              value={Object.entries(event.statuses).map(([code, n]) => `${code}×${n}`).join(" ")}
+            />
+          </div>
+          {event.histogram && event.histogram.length > 0 && (
+            <div className="flex items-end gap-px h-24 border-b border-zinc-200 dark:border-zinc-800">
+              {event.histogram.map(([upper, count]) => (
+                <div
+                  key={upper}
+                  title={`≤ ${upper} ms: ${count}`}
+                  className="flex-1 min-w-[2px] bg-blue-500/70"
+                  style={{ height: `${(count / maxBucket) * 100}%` }}
+                />
+              ))}
+            </div>
+          )}
+        </>
+      )}
+    </div>
+  );
+};
@@ -0,0 +1,198 @@
+import React, { useEffect, useRef, useState } from "react";
+import { ChevronDown, ChevronRight, Gauge, Loader2, Play, Plus, Square, Trash2 } from "lucide-react";
+import { McpTool } from "../hooks/useMcp";
+import { formatLatency } from "../services/metricsService";
+import { formatBytes } from "../services/socketIoCatalogService";
+import { McpBenchmarkEvent, McpToolStats, runMcpBenchmark } from "../services/mcpBenchmarkService";
+
+interface McpBenchmarkPanelProps {
+  benchmarkUrl: string;
+  tools: McpTool[];
+  /** Tool selected in the sidebar, used for the first call of the mix. */
+  selectedTool?: string;
+}
+
+interface CallRow {
+  tool: string;
+  args: string;
+  weight: number;
+}
+
+/** Fires a mix of MCP tool calls at a given concurrency and compares them with direct route calls. */
+export const McpBenchmarkPanel: React.FC<McpBenchmarkPanelProps> = ({ benchmarkUrl, tools, selectedTool }) => {
+  const [isOpen, setIsOpen] = useState(false);
+  const [rows, setRows] = useState<CallRow[]>([{ tool: selectedTool || tools[0]?.name || "", args: "{}", weight: 1 }]);
+  const [total, setTotal] = useState(500);
+  const [concurrency, setConcurrency] = useState(10);
+  const [compareDirect, setCompareDirect] = useState(true);
+  const [event, setEvent] = useState<McpBenchmarkEvent | null>(null);
+  const [error, setError] = useState<string | null>(null);
+  const [isRunning, setIsRunning] = useState(false);
+  const abortRef = useRef<AbortController | null>(null);
+
+  useEffect(() => () => abortRef.current?.abort(), []);
+
+  const updateRow = (index: number, patch: Partial<CallRow>) =>
+    setRows((current) => current.map((row, i) => (i === index ? { ...row, ...patch } : row)));
+
+  const handleRun = async () => {
+    let calls;
+    try {
+      calls = rows.map((row) => ({ tool: row.tool, arguments: JSON.parse(row.args || "{}"), weight: row.weight }));
+    } catch {
+      setError("Arguments must be valid JSON objects");
+      return;
+    }
+    const controller = new AbortController();
+    abortRef.current = controller;
+    setIsRunning(true);
+    setError(null);
+    setEvent(null);
+    try {
+      await runMcpBenchmark(benchmarkUrl, { calls, total, concurrency, compareDirect }, setEvent, controller.signal);
+    } catch (e: any) {
+      if (e.name !== "AbortError") setError(e.message);
+    } finally {
+      setIsRunning(false);
+    }
+  };
+
+  const direct: Record<string, McpToolStats> = {};
+  for (const stats of event?.tools || []) {
+    if (stats.via === "direct") direct[stats.tool] = stats;
+  }
+  const inputClass =
+    "w-full bg-zinc-50 dark:bg-zinc-900 border border-zinc-200 dark:border-zinc-800 rounded px-2 py-1 text-xs font-mono text-zinc-800 dark:text-zinc-200";
+  const labelClass = "text-[10px] uppercase tracking-wide text-zinc-500";
+
+  return (
+    <div className="rounded-lg border border-zinc-200 dark:border-zinc-800 bg-white dark:bg-zinc-900/50 mb-6">
+      <button
+        onClick={() => setIsOpen(!isOpen)}
+        className="w-full flex items-center gap-2 px-3 py-2 text-xs font-bold text-zinc-700 dark:text-zinc-200"
+      >
+        {isOpen ? <ChevronDown size={12} /> : <ChevronRight size={12} />}
+        <Gauge size={12} /> Tool-call benchmark
+        {isRunning && event && (
+          <span className="ml-auto font-mono font-normal text-zinc-500">
+            {event.completed}/{event.total} calls · {event.throughput.toFixed(0)}/s
+          </span>
+        )}
+      </button>
+
+      {isOpen && (
+        <div className="flex flex-col gap-3 px-3 pb-3">
+          {rows.map((row, index) => (
+            <div key={index} className="grid grid-cols-[1fr_2fr_4rem_auto] gap-2 items-end">
+              <label className={labelClass}>
+                Tool
+                <select value={row.tool} onChange={(e) => updateRow(index, { tool: e.target.value })} className={inputClass}>
+                  {tools.map((tool) => <option key={tool.name} value={tool.name}>{tool.name}</option>)}
+                </select>
+              </label>
+              <label className={labelClass}>
+                Arguments
+                <input value={row.args} onChange={(e) => updateRow(index, { args: e.target.value })} className={inputClass} />
+              </label>
+              <label className={labelClass}>
+                Weight
+                <input type="number" min={1} max={100} value={row.weight} onChange={(e) => updateRow(index, { weight: Number(e.target.value) })} className={inputClass} />
+              </label>
+              <button
+                disabled={rows.length === 1}
+                onClick={() => setRows((current) => current.filter((_, i) => i !== index))}
+                className="p-1.5 text-zinc-500 hover:text-red-500 disabled:opacity-30 disabled:hover:text-zinc-500"
+                title="Remove call"
+              >
+                <Trash2 size={12} />
+              </button>
+            </div>
+          ))}
+          <button
+            onClick={() => setRows((current) => [...current, { tool: tools[0]?.name || "", args: "{}", weight: 1 }])}
+            className="self-start flex items-center gap-1 text-[10px] font-bold text-zinc-500 hover:text-blue-500"
+          >
+            <Plus size={10} /> Add call to the mix
+          </button>
+
+          <div className="grid grid-cols-3 gap-2 items-end">
+            <label className={labelClass}>
+              Calls
+              <input type="number" min={1} value={total} onChange={(e) => setTotal(Number(e.target.value))} className={inputClass} />
+            </label>
+            <label className={labelClass}>
+              Concurrent sessions
+              <input type="number" min={1} value={concurrency} onChange={(e) => setConcurrency(Number(e.target.value))} className={inputClass} />
+            </label>
+            <label className="flex items-center gap-2 text-xs text-zinc-600 dark:text-zinc-300 pb-1">
+              <input type="checkbox" checked={compareDirect} onChange={(e) => setCompareDirect(e.target.checked)} />
+              Compare with direct route calls
+            </label>
+          </div>
+
+          <button
+            disabled={!rows.every((row) => row.tool)}
+            onClick={isRunning ? () => abortRef.current?.abort() : handleRun}
+            className="self-start flex items-center gap-1.5 px-3 py-1.5 rounded-md text-xs font-bold bg-blue-600 hover:bg-blue-500 disabled:opacity-40 text-white transition-colors"
+          >
+            {isRunning ? <Square size={12} /> : <Play size={12} />}
+            {isRunning ? "Stop" : "Run benchmark"}
+          </button>
+
+          {error && <div className="text-xs text-red-400">{error}</div>}
+
+          {isRunning && !event && (
+            <div className="flex items-center gap-2 text-xs text-zinc-500">
+              <Loader2 size={14} className="animate-spin" /> Opening sessions...
+            </div>
+          )}
+
+          {event && (
+            <>
+              <div className="text-[10px] font-mono text-zinc-500">
+                {event.sessions} sessions (p99 {formatLatency(event.sessionLatency.p99)} to open)
+                {event.sessionErrors > 0 && <span className="text-amber-500"> · {event.sessionErrors} failed to open</span>}
+                {" "}· {event.elapsed.toFixed(1)}s
+              </div>
+              <table className="w-full text-[10px] font-mono">
+                <thead>
+                  <tr className="text-left uppercase tracking-wide text-zinc-500 border-b border-zinc-200 dark:border-zinc-800">
+                    <th className="py-1 font-normal">Tool</th>
+                    <th className="py-1 font-normal">Via</th>
+                    <th className="py-1 font-normal text-right">Calls</th>
+                    <th className="py-1 font-normal text-right">Errors</th>
+                    <th className="py-1 font-normal text-right">p50</th>
+                    <th className="py-1 font-normal text-right">p99</th>
+                    <th className="py-1 font-normal text-right">Req / resp</th>
+                    <th className="py-1 font-normal text-right">Overhead p50</th>
+                  </tr>
+                </thead>
+                <tbody className="divide-y divide-zinc-100 dark:divide-zinc-800 text-zinc-800 dark:text-zinc-200">
+                  {event.tools.map((stats) => {
+                    const baseline = stats.via === "mcp" ? direct[stats.tool] : undefined;
+                    return (
+                      <tr key={`${stats.tool} ${stats.via}`}>
+                        <td className="py-1">{stats.tool}</td>
+                        <td className="py-1 text-zinc-500">{stats.via}</td>
+                        <td className="py-1 text-right">{stats.calls}</td>
+                        <td className={`py-1 text-right ${stats.errors ? "text-amber-500" : ""}`}>{(stats.errorRate * 100).toFixed(1)}%</td>
+                        <td className="py-1 text-right">{formatLatency(stats.latency.p50)}</td>
+                        <td className="py-1 text-right">{formatLatency(stats.latency.p99)}</td>
+                        <td className="py-1 text-right" title={`largest response ${formatBytes(stats.maxResponseBytes)}`}>
+                          {formatBytes(stats.requestBytes)} / {formatBytes(stats.responseBytes)}
+                        </td>
+                        <td className="py-1 text-right">
+                          {baseline ? `+${formatLatency(Math.max(0, stats.latency.p50 - baseline.latency.p50))}` : ""}
+                        </td>
+                      </tr>
+                    );
+                  })}
+                </tbody>
+              </table>
+            </>
+          )}
+        </div>
+      )}
+    </div>
+  );
+};
@@ -0,0 +1,161 @@
+import React, { useEffect, useRef, useState } from "react";
+import { ChevronDown, ChevronRight, Gauge, Loader2, Play, Square } from "lucide-react";
+import { formatLatency } from "../services/metricsService";
+import { SoakEvent, runSoak } from "../services/soakService";
+
+interface SoakPanelProps {
+  soakUrl: string;
+  /** WebSocket routes known to the tester, offered as targets. */
+  paths: string[];
+}
+
+const DEFAULT_MESSAGE = '{"type": "soak", "id": "{id}"}';
+
+// Over the network only when the server has a network_origin to target
+const networkTests = Boolean((window as any).NEXUS_CONFIG?.networkTests);
+
+/** Drives many concurrent server-side WebSocket clients against one route. */
+export const SoakPanel: React.FC<SoakPanelProps> = ({ soakUrl, paths }) => {
+  const [isOpen, setIsOpen] = useState(false);
+  const [path, setPath] = useState(paths[0] || "/ws");
+  const [clients, setClients] = useState(500);
+  const [duration, setDuration] = useState(10);
+  const [rate, setRate] = useState(1);
+  const [rampUp, setRampUp] = useState(2);
+  const [message, setMessage] = useState(DEFAULT_MESSAGE);
+  const [mode, setMode] = useState<"asgi" | "ws">("asgi");
+  const [event, setEvent] = useState<SoakEvent | null>(null);
+  const [error, setError] = useState<string | null>(null);
+  const [isRunning, setIsRunning] = useState(false);
+  const abortRef = useRef<AbortController | null>(null);
+
+  useEffect(() => () => abortRef.current?.abort(), []);
+
+  const handleRun = async () => {
+    const controller = new AbortController();
+    abortRef.current = controller;
+    setIsRunning(true);
+    setError(null);
+    setEvent(null);
+    try {
+      await runSoak(soakUrl, { path, clients, duration, rate, rampUp, message, mode }, setEvent, controller.signal);
+    } catch (e: any) {
+      if (e.name !== "AbortError") setError(e.message);
+    } finally {
+      setIsRunning(false);
+    }
+  };
+
+  const maxBucket = Math.max(1, ...(event?.histogram || []).map(([, count]) => count));
+  const inputClass =
+    "w-full bg-zinc-50 dark:bg-zinc-900 border border-zinc-200 dark:border-zinc-800 rounded px-2 py-1 text-xs font-mono text-zinc-800 dark:text-zinc-200";
+  const labelClass = "text-[10px] uppercase tracking-wide text-zinc-500";
+
+  return (
+    <div className="rounded-lg border border-zinc-200 dark:border-zinc-800 bg-white dark:bg-zinc-900/50 mb-6">
+      <button
+        onClick={() => setIsOpen(!isOpen)}
+        className="w-full flex items-center gap-2 px-3 py-2 text-xs font-bold text-zinc-700 dark:text-zinc-200"
+      >
+        {isOpen ? <ChevronDown size={12} /> : <ChevronRight size={12} />}
+        <Gauge size={12} /> Soak test
+        {isRunning && event && (
+          <span className="ml-auto font-mono font-normal text-zinc-500">
+            {event.active}/{event.clients} connected · {event.elapsed.toFixed(1)}s
+          </span>
+        )}
+      </button>
+
+      {isOpen && (
+        <div className="flex flex-col gap-3 px-3 pb-3">
+          <div className="grid grid-cols-2 sm:grid-cols-3 lg:grid-cols-6 gap-2">
+            <label className={labelClass}>
+              Path
+              <input list="f-docs-soak-paths" value={path} onChange={(e) => setPath(e.target.value)} className={inputClass} />
+              <datalist id="f-docs-soak-paths">
+                {paths.map((p) => <option key={p} value={p} />)}
+              </datalist>
+            </label>
+            <label className={labelClass}>
+              Clients
+              <input type="number" min={1} value={clients} onChange={(e) => setClients(Number(e.target.value))} className={inputClass} />
+            </label>
+            <label className={labelClass}>
+              Duration (s)
+              <input type="number" min={1} value={duration} onChange={(e) => setDuration(Number(e.target.value))} className={inputClass} />
+            </label>
+            <label className={labelClass}>
+              Msg/s per client
+              <input type="number" min={0} step="0.1" value={rate} onChange={(e) => setRate(Number(e.target.value))} className={inputClass} />
+            </label>
+            <label className={labelClass}>
+              Ramp-up (s)
+              <input type="number" min={0} value={rampUp} onChange={(e) => setRampUp(Number(e.target.value))} className={inputClass} />
+            </label>
+            <label className={labelClass}>
+              Transport
+              <select value={mode} onChange={(e) => setMode(e.target.value as "asgi" | "ws")} className={inputClass}>
+                <option value="asgi">In-process</option>
+                {networkTests && <option value="ws">Network</option>}
+              </select>
+            </label>
+          </div>
+          <label className={labelClass}>
+            Message ({"{id}"} is replaced by a token used to match echoes)
+            <input value={message} onChange={(e) => setMessage(e.target.value)} className={inputClass} />
+          </label>
+
+          <button
+            onClick={isRunning ? () => abortRef.current?.abort() : handleRun}
+            className="self-start flex items-center gap-1.5 px-3 py-1.5 rounded-md text-xs font-bold bg-blue-600 hover:bg-blue-500 text-white transition-colors"
+          >
+            {isRunning ? <Square size={12} /> : <Play size={12} />}
+            {isRunning ? "Stop" : "Run soak test"}
+          </button>
+
+          {error && <div className="text-xs text-red-400">{error}</div>}
+
+          {isRunning && !event && (
+            <div className="flex items-center gap-2 text-xs text-zinc-500">
+              <Loader2 size={14} className="animate-spin" /> Connecting...
+            </div>
+          )}
+
+          {event && (
+            <>
+              <div className="grid grid-cols-2 sm:grid-cols-4 lg:grid-cols-8 gap-2 text-[10px] font-mono">
+                {[
+                  ["connected", `${event.connected}/${event.clients} (peak ${event.peakActive})`, false],
+                  ["connect errors", String(event.connectErrors), event.connectErrors > 0],
+                  ["closed by server", String(event.closedByServer), event.closedByServer > 0],
+                  ["connect p99", formatLatency(event.connectLatency.p99), false],
+                  ["sent/s", event.sentPerSecond.toFixed(1), false],
+                  ["received/s", event.receivedPerSecond.toFixed(1), false],
+                  ["dropped", String(event.dropped), event.dropped > 0],
+                  ["round trip p50 / p99", `${formatLatency(event.roundTrip.p50)} / ${formatLatency(event.roundTrip.p99)}`, false],
+                ].map(([label, value, warn]) => (
+                  <div key={label as string} className="rounded-md border border-zinc-200 dark:border-zinc-800 px-2 py-1.5">
+                    <div className="uppercase tracking-wide text-zinc-500">{label}</div>
+                    <div className={`font-bold ${warn ? "text-amber-500" : "text-zinc-800 dark:text-zinc-200"}`}>{value}</div>
+                  </div>
+                ))}
+              </div>
+              {event.histogram && event.histogram.length > 0 && (
+                <div className="flex items-end gap-px h-20 border-b border-zinc-200 dark:border-zinc-800">
+                  {event.histogram.map(([upper, count]) => (
+                    <div
+                      key={upper}
+                      title={`≤ ${upper} ms: ${count}`}
+                      className="flex-1 min-w-[2px] bg-blue-500/70"
+                      style={{ height: `${(count / maxBucket) * 100}%` }}
+                    />
+                  ))}
+                </div>
+              )}
+            </>
+          )}
+        </div>
+      )}
+    </div>
+  );
+};
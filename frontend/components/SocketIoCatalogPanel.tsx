@@ -0,0 +1,140 @@
+import React, { useEffect, useRef, useState } from "react";
+import { ArrowDown, ArrowUp, Ear, Send } from "lucide-react";
+import { formatLatency } from "../services/metricsService";
+import { SocketIoCatalog, formatBytes, loadSocketIoCatalog } from "../services/socketIoCatalogService";
+
+const POLL_MS = 2000;
+
+interface SocketIoCatalogPanelProps {
+  url: string;
+  isConnected: boolean;
+  listening: string[];
+  addListener: (eventName: string) => void;
+  emitEvent: (eventName: string, messageData: string) => void;
+}
+
+interface Rate {
+  messages: number;
+  bytes: number;
+}
+
+/** Events the server handles and emits, with emit rates derived between polls. */
+export const SocketIoCatalogPanel: React.FC<SocketIoCatalogPanelProps> = ({
+  url,
+  isConnected,
+  listening,
+  addListener,
+  emitEvent,
+}) => {
+  const [catalog, setCatalog] = useState<SocketIoCatalog | null>(null);
+  const [rates, setRates] = useState<Record<string, Rate>>({});
+  const previousRef = useRef<Record<string, { count: number; bytes: number; at: number }>>({});
+
+  useEffect(() => {
+    let cancelled = false;
+    const refresh = async () => {
+      try {
+        const next = await loadSocketIoCatalog(url);
+        if (cancelled) return;
+        const now = Date.now();
+        const nextRates: Record<string, Rate> = {};
+        for (const emit of next.emits) {
+          const key = `${emit.namespace} ${emit.event}`;
+          const previous = previousRef.current[key];
+          if (previous && now > previous.at) {
+            nextRates[key] = {
+              messages: ((emit.count - previous.count) * 1000) / (now - previous.at),
+              bytes: ((emit.bytes - previous.bytes) * 1000) / (now - previous.at),
+            };
+          }
+          previousRef.current[key] = { count: emit.count, bytes: emit.bytes, at: now };
+        }
+        setCatalog(next);
+        setRates(nextRates);
+      } catch (e) {
+        console.warn("Failed to load Socket.IO catalog:", e);
+      }
+    };
+    refresh();
+    const timer = setInterval(refresh, POLL_MS);
+    return () => {
+      cancelled = true;
+      clearInterval(timer);
+    };
+  }, [url]);
+
+  if (!catalog) return null;
+
+  const handled = catalog.namespaces.flatMap((ns) =>
+    ns.events.filter((e) => !e.lifecycle).map((e) => ({ ...e, namespace: ns.namespace }))
+  );
+  const buttonClass =
+    "flex items-center gap-1 px-2 py-0.5 rounded text-[10px] font-bold border border-zinc-200 dark:border-zinc-700 text-zinc-600 dark:text-zinc-300 hover:border-blue-500 hover:text-blue-500 disabled:opacity-40 disabled:hover:border-zinc-200 disabled:hover:text-zinc-600 transition-colors";
+
+  return (
+    <div className="grid grid-cols-1 xl:grid-cols-2 gap-3 mb-6">
+      <div className="rounded-lg border border-zinc-200 dark:border-zinc-800 bg-white dark:bg-zinc-900/50 p-3">
+        <div className="flex items-center gap-2 mb-2 text-xs font-bold text-zinc-700 dark:text-zinc-200">
+          <ArrowUp size={12} /> Handled events
+        </div>
+        {handled.length === 0 && <p className="text-[10px] text-zinc-500">No event handlers registered.</p>}
+        <div className="flex flex-col divide-y divide-zinc-100 dark:divide-zinc-800">
+          {handled.map((event) => (
+            <div key={`${event.namespace} ${event.name}`} className="py-1.5 flex items-start justify-between gap-3">
+              <div className="min-w-0">
+                <div className="font-mono text-xs text-zinc-800 dark:text-zinc-200">
+                  {event.name}
+                  <span className="text-zinc-500">({event.args.join(", ")})</span>
+                  {event.namespace !== "/" && <span className="ml-2 text-[10px] text-zinc-500">{event.namespace}</span>}
+                </div>
+                {event.doc && <div className="text-[10px] text-zinc-500 truncate" title={event.doc}>{event.doc}</div>}
+              </div>
+              <button
+                disabled={!isConnected || event.namespace !== "/"}
+                onClick={() => emitEvent(event.name, JSON.stringify(event.sample ?? {}))}
+                title={JSON.stringify(event.sample ?? {}, null, 2)}
+                className={buttonClass}
+              >
+                <Send size={10} /> Emit sample
+              </button>
+            </div>
+          ))}
+        </div>
+      </div>
+
+      <div className="rounded-lg border border-zinc-200 dark:border-zinc-800 bg-white dark:bg-zinc-900/50 p-3">
+        <div className="flex items-center gap-2 mb-2 text-xs font-bold text-zinc-700 dark:text-zinc-200">
+          <ArrowDown size={12} /> Emitted events
+        </div>
+        {catalog.emits.length === 0 && <p className="text-[10px] text-zinc-500">Nothing emitted yet.</p>}
+        <div className="flex flex-col divide-y divide-zinc-100 dark:divide-zinc-800">
+          {catalog.emits.map((emit) => {
+            const key = `${emit.namespace} ${emit.event}`;
+            const rate = rates[key];
+            return (
+              <div key={key} className="py-1.5 flex items-center justify-between gap-3">
+                <div className="min-w-0">
+                  <div className="font-mono text-xs text-zinc-800 dark:text-zinc-200" title={JSON.stringify(emit.sample, null, 2)}>
+                    {emit.event}
+                    {emit.namespace !== "/" && <span className="ml-2 text-[10px] text-zinc-500">{emit.namespace}</span>}
+                  </div>
+                  <div className="text-[10px] font-mono text-zinc-500">
+                    {(rate?.messages ?? emit.messagesPerSecond).toFixed(1)} msg/s ·{" "}
+                    {formatBytes(rate?.bytes ?? emit.bytesPerSecond)}/s · p99 {formatLatency(emit.latency.p99)} · {emit.count} sent
+                  </div>
+                </div>
+                <button
+                  disabled={listening.includes(emit.event)}
+                  onClick={() => addListener(emit.event)}
+                  className={buttonClass}
+                >
+                  <Ear size={10} /> Listen
+                </button>
+              </div>
+            );
+          })}
+        </div>
+      </div>
+    </div>
+  );
+};
@@ -12,6 +12,7 @@ import {
 } from "lucide-react";
 import { ListenerData, ListenerItem } from "../hooks/useSocketIO";
 import { JsonDisplay } from "./JsonDisplay";
+import { SocketIoCatalogPanel } from "./SocketIoCatalogPanel";
 
 interface SocketIoTesterProps {
   url: string;
@@ -53,6 +54,7 @@ export const SocketIoTester: React.FC<SocketIoTesterProps> = ({
 
 
   const enabledListeners = activeListeners.filter(l => l.isEnabled);
+  const catalogUrl: string | undefined = (window as any).NEXUS_CONFIG?.socketIoCatalogUrl;
 
   return (
     <div className="p-6 h-full flex flex-col w-full">
@@ -71,6 +73,16 @@ export const SocketIoTester: React.FC<SocketIoTesterProps> = ({
         </div>
       </div>
 
+      {catalogUrl && (
+        <SocketIoCatalogPanel
+          url={catalogUrl}
+          isConnected={isConnected}
+          listening={activeListeners.map(l => l.name)}
+          addListener={addListener}
+          emitEvent={emitEvent}
+        />
+      )}
+
       <div className="grid grid-cols-1 lg:grid-cols-4 gap-6 flex-1 min-h-0">
         
 
@@ -0,0 +1,42 @@
+import React from "react";
+import { TimingEntry } from "../services/serverTiming";
+
+const COLORS: Record<string, string> = {
+  routing: "bg-zinc-400",
+  body: "bg-sky-500",
+  validation: "bg-violet-500",
+  dependencies: "bg-amber-500",
+  handler: "bg-emerald-500",
+  serialize: "bg-pink-500",
+};
+
+/** Server-side phases of a request, laid out one after another. */
+export const TimingWaterfall: React.FC<{ entries: TimingEntry[] }> = ({ entries }) => {
+  const phases = entries.filter((entry) => entry.name !== "total");
+  const total =
+    entries.find((entry) => entry.name === "total")?.duration ||
+    phases.reduce((sum, entry) => sum + entry.duration, 0);
+  if (!phases.length || total <= 0) return null;
+
+  let offset = 0;
+  return (
+    <div className="px-4 py-2 border-b border-zinc-200 dark:border-zinc-800 space-y-1 shrink-0">
+      {phases.map((entry) => {
+        const left = (offset / total) * 100;
+        offset += entry.duration;
+        return (
+          <div key={entry.name} className="flex items-center gap-2 text-[10px] font-mono" title={entry.description}>
+            <span className="w-20 shrink-0 text-zinc-500 truncate">{entry.name}</span>
+            <div className="flex-1 relative h-2 rounded bg-zinc-100 dark:bg-zinc-900">
+              <div
+                className={`absolute top-0 h-2 rounded ${COLORS[entry.name] || "bg-blue-500"}`}
+                style={{ left: `${left}%`, width: `${Math.max((entry.duration / total) * 100, 0.5)}%` }}
+              />
+            </div>
+            <span className="w-16 shrink-0 text-right text-zinc-500">{entry.duration.toFixed(2)}ms</span>
+          </div>
+        );
+      })}
+    </div>
+  );
+};
@@ -2,6 +2,8 @@ import React, { useState, useEffect, useRef } from 'react';
 import { Activity, Radio, X, Send, AlertCircle, Check } from 'lucide-react';
 import { PathData, PathItem, WebSocketMessage } from '../hooks/useWebSocket';
 import { MessageRenderer } from './MessageRenderer';
+import { BroadcastMetricsPanel } from './BroadcastMetricsPanel';
+import { SoakPanel } from './SoakPanel';
 
 interface WebSocketTesterProps {
   baseUrl: string;
@@ -24,6 +26,8 @@ export const WebSocketTester: React.FC<WebSocketTesterProps> = ({
   clearPathError
 }) => {
   const connectedPaths = activePaths.filter(p => p.isConnected);
+  const broadcastMetricsUrl: string | undefined = (window as any).NEXUS_CONFIG?.broadcastMetricsUrl;
+  const soakUrl: string | undefined = (window as any).NEXUS_CONFIG?.soakUrl;
 
   return (
     <div className="p-6 h-full flex flex-col w-full">
@@ -36,6 +40,9 @@ export const WebSocketTester: React.FC<WebSocketTesterProps> = ({
         </div>
       </div>
 
+      {broadcastMetricsUrl && <BroadcastMetricsPanel url={broadcastMetricsUrl} />}
+      {soakUrl && <SoakPanel soakUrl={soakUrl} paths={activePaths.map(p => p.name).filter(name => name.startsWith('/'))} />}
+
       <div className="flex-1 overflow-y-auto custom-scrollbar p-1">
         {connectedPaths.length === 0 ? (
           <div className="h-full flex flex-col items-center justify-center text-zinc-500 opacity-50">
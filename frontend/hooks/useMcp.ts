@@ -50,7 +50,8 @@ const getErrorMessage = (error: unknown): string => {
 
 export const useMcp = () => {
   // Connection State
-  const [url, setUrl] = useState('/mcp');
+  // f_docs(..., mcp_path=...) tells us where its MCP server is mounted
+  const [url, setUrl] = useState<string>(() => (window as any).NEXUS_CONFIG?.mcpUrl || '/mcp');
   const [includeCredentials, setIncludeCredentials] = useState(false);
   const [customHeaders, setCustomHeaders] = useState<HeaderEntry[]>([]);
   const [error, setError] = useState<string | null>(null);
@@ -0,0 +1,33 @@
+// Writes .gz and .br siblings next to every built asset so FDocs can serve
+// them without compressing at runtime.
+import { readdirSync, readFileSync, writeFileSync, statSync } from 'fs';
+import { join } from 'path';
+import { fileURLToPath } from 'url';
+import { gzipSync, brotliCompressSync, constants } from 'zlib';
+
+const ASSETS_DIR = fileURLToPath(new URL('../../FDocs/dist/assets', import.meta.url));
+const MIN_SIZE = 512;
+
+const walk = (dir) => readdirSync(dir).flatMap(name => {
+  const full = join(dir, name);
+  return statSync(full).isDirectory() ? walk(full) : [full];
+});
+
+for (const file of walk(ASSETS_DIR)) {
+  if (file.endsWith('.gz') || file.endsWith('.br')) continue;
+  const content = readFileSync(file);
+  if (content.length < MIN_SIZE) continue;
+
+  const gz = gzipSync(content, { level: 9 });
+  if (gz.length < content.length) writeFileSync(`${file}.gz`, gz);
+
+  const br = brotliCompressSync(content, {
+    params: {
+      [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+      [constants.BROTLI_PARAM_SIZE_HINT]: content.length,
+    },
+  });
+  if (br.length < content.length) writeFileSync(`${file}.br`, br);
+
+  console.log(`${file}: ${content.length} -> gzip ${gz.length}, br ${br.length}`);
+}
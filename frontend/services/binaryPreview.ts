@@ -0,0 +1,91 @@
+/** Bytes fetched to preview a binary response (images up to this size render in full). */
+export const PREVIEW_BYTES = 1024 * 1024;
+
+/** Bytes shown in the hex dump. */
+const HEX_BYTES = 512;
+
+export interface BinaryPreview {
+  contentType: string;
+  /** Full size in bytes, when the server reported it. */
+  size: number | null;
+  /** Whether the server answers Range requests. */
+  acceptRanges: boolean;
+  /** Where media elements can stream from: an object URL, or the resource itself when no credentials are needed. */
+  src?: string;
+  /** Hex dump of the first bytes. */
+  hex?: string;
+  /** True when only a prefix of the body was fetched. */
+  truncated: boolean;
+}
+
+export const isBinaryContentType = (contentType: string): boolean =>
+  /^(image|audio|video|font)\//.test(contentType) ||
+  /^application\/(octet-stream|pdf|zip|gzip|x-tar|x-7z-compressed|wasm)/.test(contentType);
+
+const isMedia = (contentType: string) => /^(audio|video)\//.test(contentType);
+
+const hexDump = (bytes: Uint8Array): string => {
+  const lines: string[] = [];
+  for (let offset = 0; offset < bytes.length; offset += 16) {
+    const row = Array.from(bytes.subarray(offset, offset + 16));
+    const hex = row.map((b) => b.toString(16).padStart(2, '0')).join(' ');
+    const ascii = row.map((b) => (b >= 32 && b < 127 ? String.fromCharCode(b) : '.')).join('');
+    lines.push(`${offset.toString(16).padStart(8, '0')}  ${hex.padEnd(47)}  ${ascii}`);
+  }
+  return lines.join('\n');
+};
+
+/** Preview of bytes already in memory (e.g. an in-process response). */
+export const previewFromBlob = async (
+  blob: Blob,
+  contentType: string,
+  size: number | null,
+  acceptRanges = false,
+  truncated = false
+): Promise<BinaryPreview> => {
+  const head = new Uint8Array(await blob.slice(0, HEX_BYTES).arrayBuffer());
+  const renderable = !truncated && (contentType.startsWith('image/') || isMedia(contentType));
+  return {
+    contentType,
+    size: size ?? blob.size,
+    acceptRanges,
+    src: renderable ? URL.createObjectURL(new Blob([blob], { type: contentType })) : undefined,
+    hex: hexDump(head),
+    truncated,
+  };
+};
+
+/**
+ * Builds a preview of a binary response without reading its whole body:
+ * the original body is cancelled and at most PREVIEW_BYTES are fetched
+ * again with a Range request. Audio and video that need no credentials
+ * stream straight from the URL, letting the media element issue its own
+ * range requests.
+ */
+export const loadBinaryPreview = async (
+  url: string,
+  headers: Record<string, string>,
+  res: Response
+): Promise<BinaryPreview> => {
+  const contentType = (res.headers.get('content-type') || 'application/octet-stream').split(';')[0].trim();
+  const length = res.headers.get('content-length');
+  const size = length !== null ? Number(length) : null;
+  const acceptRanges = res.headers.get('accept-ranges') === 'bytes';
+  await res.body?.cancel().catch(() => undefined);
+
+  const needsCredentials = Object.keys(headers).some((name) => name.toLowerCase() === 'authorization');
+  if (isMedia(contentType) && !needsCredentials) {
+    return { contentType, size, acceptRanges, src: url, truncated: false };
+  }
+  if (!acceptRanges && (size === null || size > PREVIEW_BYTES)) {
+    // Without range support the only way to peek is to download everything
+    return { contentType, size, acceptRanges, truncated: true };
+  }
+
+  const partial = await fetch(url, {
+    headers: { ...headers, Range: `bytes=0-${PREVIEW_BYTES - 1}` },
+  });
+  const blob = await partial.blob();
+  const total = Number(partial.headers.get('content-range')?.split('/')[1]) || size;
+  return previewFromBlob(blob, contentType, total, acceptRanges, total !== null && blob.size < total);
+};
@@ -0,0 +1,27 @@
+import { LatencySummary } from './loadTestService';
+
+export interface BroadcastHubMetrics {
+  name: string;
+  policy: 'drop_oldest' | 'disconnect';
+  queueSize: number;
+  connections: number;
+  peakConnections: number;
+  broadcasts: number;
+  delivered: number;
+  dropped: number;
+  evicted: number;
+  sendErrors: number;
+  queued: number;
+  maxQueued: number;
+  uptime: number;
+  deliveredPerSecond: number;
+  deliveryLatency: LatencySummary;
+}
+
+/** Fetches the counters of every BroadcastHub (f_docs(..., broadcast_metrics=True)). */
+export const loadBroadcastMetrics = async (url: string): Promise<BroadcastHubMetrics[]> => {
+  const res = await fetch(url, { cache: 'no-store' });
+  if (!res.ok) throw new Error(`Failed to fetch broadcast metrics: HTTP ${res.status}`);
+  const { hubs } = await res.json();
+  return hubs;
+};
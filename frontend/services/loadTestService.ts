@@ -0,0 +1,87 @@
+import { BatchRequest } from './mockApiService';
+
+export interface LatencySummary {
+  count: number;
+  mean: number;
+  min: number;
+  max: number;
+  p50: number;
+  p90: number;
+  p99: number;
+  p999: number;
+}
+
+export interface LoadTestEvent {
+  type: 'progress' | 'result';
+  completed: number;
+  total: number;
+  elapsed: number;
+  throughput: number;
+  errorRate: number;
+  statuses: Record<string, number>;
+  latency: LatencySummary;
+  /** `[upper bound in ms, count]` pairs; only on the final result. */
+  histogram?: [number, number][];
+}
+
+export interface LoadTestOptions {
+  total: number;
+  concurrency: number;
+  rps?: number;
+  mode?: 'asgi' | 'http';
+}
+
+/**
+ * POSTs `body` to a streaming endpoint and reports each NDJSON line as it
+ * arrives. Resolves with the last event.
+ */
+export const postNdjson = async <T>(
+  url: string,
+  body: unknown,
+  onEvent: (event: T) => void,
+  signal?: AbortSignal,
+  label = 'Request'
+): Promise<T | null> => {
+  const res = await fetch(url, {
+    method: 'POST',
+    // F-Docs rejects runner requests without this header (see _reject_cross_site)
+    headers: { 'Content-Type': 'application/json', 'X-FDocs-Request': '1' },
+    body: JSON.stringify(body),
+    signal,
+  });
+  if (!res.ok || !res.body) {
+    const detail = await res.json().catch(() => null);
+    throw new Error(detail?.detail || `${label} failed with HTTP ${res.status}`);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = '';
+  let last: T | null = null;
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffered += decoder.decode(value, { stream: true });
+    const lines = buffered.split('\n');
+    buffered = lines.pop() || '';
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      last = JSON.parse(line) as T;
+      onEvent(last);
+    }
+  }
+  return last;
+};
+
+/**
+ * Starts a server-side load test (f_docs(..., load_testing=True)) and reports
+ * each NDJSON progress line as it arrives. Resolves with the final result.
+ */
+export const runLoadTest = (
+  loadTestUrl: string,
+  request: BatchRequest,
+  options: LoadTestOptions,
+  onEvent: (event: LoadTestEvent) => void,
+  signal?: AbortSignal
+): Promise<LoadTestEvent | null> =>
+  postNdjson<LoadTestEvent>(loadTestUrl, { request, ...options }, onEvent, signal, 'Load test');
@@ -0,0 +1,54 @@
+import { LatencySummary, postNdjson } from './loadTestService';
+
+export interface McpBenchmarkCall {
+  tool: string;
+  arguments: Record<string, any>;
+  /** Share of the mix relative to the other calls. */
+  weight: number;
+}
+
+export interface McpToolStats {
+  tool: string;
+  /** `mcp` through the bridge, `direct` straight to the route behind the tool. */
+  via: 'mcp' | 'direct';
+  calls: number;
+  errors: number;
+  errorRate: number;
+  /** Average request and response sizes in bytes. */
+  requestBytes: number;
+  responseBytes: number;
+  maxResponseBytes: number;
+  latency: LatencySummary;
+}
+
+export interface McpBenchmarkEvent {
+  type: 'progress' | 'result';
+  completed: number;
+  total: number;
+  elapsed: number;
+  throughput: number;
+  sessions: number;
+  sessionErrors: number;
+  sessionLatency: LatencySummary;
+  tools: McpToolStats[];
+}
+
+export interface McpBenchmarkOptions {
+  calls: McpBenchmarkCall[];
+  total: number;
+  concurrency: number;
+  compareDirect?: boolean;
+  headers?: Record<string, string>;
+}
+
+/**
+ * Starts a server-side MCP tool-call benchmark (f_docs(..., mcp_path=...,
+ * load_testing=True)) and reports each NDJSON progress line as it arrives.
+ */
+export const runMcpBenchmark = (
+  benchmarkUrl: string,
+  options: McpBenchmarkOptions,
+  onEvent: (event: McpBenchmarkEvent) => void,
+  signal?: AbortSignal
+): Promise<McpBenchmarkEvent | null> =>
+  postNdjson<McpBenchmarkEvent>(benchmarkUrl, options, onEvent, signal, 'MCP benchmark');
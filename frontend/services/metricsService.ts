@@ -0,0 +1,25 @@
+import { LatencySummary } from './loadTestService';
+
+export interface RouteMetrics {
+  count: number;
+  throughput: number;
+  statuses: Partial<Record<'1xx' | '2xx' | '3xx' | '4xx' | '5xx', number>>;
+  latency: LatencySummary;
+}
+
+export interface MetricsSnapshot {
+  since: number;
+  uptime: number;
+  /** Keyed by endpoint id (`${method}-${path}`). */
+  routes: Record<string, RouteMetrics>;
+}
+
+/** Fetches the per-route metrics recorded by f_docs(..., route_metrics=True). */
+export const loadRouteMetrics = async (metricsUrl: string): Promise<MetricsSnapshot> => {
+  const res = await fetch(metricsUrl, { cache: 'no-store' });
+  if (!res.ok) throw new Error(`Failed to fetch metrics: HTTP ${res.status}`);
+  return res.json();
+};
+
+export const formatLatency = (ms: number): string =>
+  ms >= 1000 ? `${(ms / 1000).toFixed(1)}s` : ms >= 10 ? `${Math.round(ms)}ms` : `${ms.toFixed(1)}ms`;
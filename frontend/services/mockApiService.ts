@@ -1,4 +1,5 @@
 import { Method, SimulationResponse } from '../types';
+import { isBinaryContentType, loadBinaryPreview, previewFromBlob } from './binaryPreview';
 
 /**
  * Executes a request. 
@@ -10,17 +11,200 @@ export const executeRequest = async (
   method: Method,
   path: string,
   body?: string | FormData,
-  headers: Record<string, string> = {}
+  headers: Record<string, string> = {},
+  onUploadProgress?: UploadProgressHandler
 ): Promise<SimulationResponse> => {
   const isInternalDemo = baseUrl.includes('api.cosmos-store.io');
 
   if (isInternalDemo) {
     return mockInternalRequest(method, path, body);
-  } else {
-    return executeRealRequest(baseUrl, method, path, body, headers);
   }
+
+  const config = (window as any).NEXUS_CONFIG || {};
+  const sameOrigin = sameOriginPath(baseUrl);
+
+  // Ask our own server for a Server-Timing breakdown (f_docs(..., server_timing=True))
+  if (config.serverTiming && sameOrigin !== null) {
+    headers = { ...headers, 'X-FDocs-Timing': '1' };
+  }
+
+  // Same-origin JSON calls can run in-process on the server (f_docs(..., execute_requests=True))
+  const executeUrl: string | undefined = config.executeUrl;
+  const basePath = executeUrl && !(body instanceof FormData) ? sameOrigin : null;
+  if (executeUrl && basePath !== null) {
+    const requestHeaders = { ...headers };
+    if (typeof body === 'string') requestHeaders['Content-Type'] = 'application/json';
+    return queueExecution(executeUrl, {
+      method,
+      path: `${basePath}${path}`,
+      headers: requestHeaders,
+      body: typeof body === 'string' ? body : undefined,
+    });
+  }
+  if (onUploadProgress && body instanceof FormData) {
+    return executeUploadRequest(baseUrl, method, path, body, headers, onUploadProgress);
+  }
+  return executeRealRequest(baseUrl, method, path, body, headers);
 };
 
+/** Bytes of the request body sent so far, out of `total`. */
+export type UploadProgressHandler = (loaded: number, total: number) => void;
+
+/**
+ * Sends a multipart request with XMLHttpRequest, which (unlike fetch)
+ * reports upload progress.
+ */
+const executeUploadRequest = (
+  baseUrl: string,
+  method: Method,
+  path: string,
+  body: FormData,
+  customHeaders: Record<string, string>,
+  onUploadProgress: UploadProgressHandler
+): Promise<SimulationResponse> =>
+  new Promise((resolve) => {
+    const start = performance.now();
+    const xhr = new XMLHttpRequest();
+    xhr.open(method, `${baseUrl.replace(/\/$/, '')}${path}`);
+    Object.entries(customHeaders).forEach(([name, value]) => {
+      // The browser sets the multipart Content-Type with its boundary
+      if (name.toLowerCase() !== 'content-type') xhr.setRequestHeader(name, value);
+    });
+    xhr.upload.onprogress = (e) => {
+      if (e.lengthComputable) onUploadProgress(e.loaded, e.total);
+    };
+    xhr.onload = () => {
+      const responseHeaders: Record<string, string> = {};
+      xhr.getAllResponseHeaders().trim().split(/[\r\n]+/).forEach((line) => {
+        const index = line.indexOf(':');
+        if (index > 0) responseHeaders[line.slice(0, index).trim().toLowerCase()] = line.slice(index + 1).trim();
+      });
+      let data: any = xhr.responseText;
+      if ((responseHeaders['content-type'] || '').includes('application/json')) {
+        try {
+          data = JSON.parse(xhr.responseText);
+        } catch {
+          // Leave malformed JSON as text
+        }
+      }
+      resolve({
+        status: xhr.status,
+        data,
+        latency: Math.round(performance.now() - start),
+        headers: responseHeaders,
+      });
+    };
+    xhr.onerror = () => {
+      resolve({ status: 0, data: { error: "Network Error", details: "Upload failed" }, latency: 0 });
+    };
+    xhr.send(body);
+  });
+
+export interface BatchRequest {
+  method: string;
+  path: string;
+  headers?: Record<string, string>;
+  body?: string;
+}
+
+interface BatchResult {
+  status: number;
+  headers: [string, string][];
+  body: string;
+  bodyEncoding?: 'base64';
+  error?: string;
+  elapsedMs: number;
+  firstByteMs: number;
+}
+
+/** Path prefix of `baseUrl` when it points at the docs' own origin, otherwise null. */
+export const sameOriginPath = (baseUrl: string): string | null => {
+  try {
+    const target = new URL(baseUrl || '/', window.location.href);
+    if (target.origin !== window.location.origin) return null;
+    return target.pathname.replace(/\/$/, '');
+  } catch {
+    return null;
+  }
+};
+
+const toSimulationResponse = async (result: BatchResult): Promise<SimulationResponse> => {
+  if (result.error) {
+    return { status: 0, data: { error: result.error }, latency: 0 };
+  }
+  let data: any = result.body;
+  let preview;
+  const contentType = result.headers.find(([name]) => name === 'content-type')?.[1] || '';
+  if (!result.bodyEncoding && contentType.includes('application/json')) {
+    try {
+      data = JSON.parse(result.body);
+    } catch {
+      // Leave malformed JSON as text
+    }
+  } else if (result.bodyEncoding === 'base64' && isBinaryContentType(contentType)) {
+    const bytes = Uint8Array.from(atob(result.body), (c) => c.charCodeAt(0));
+    preview = await previewFromBlob(new Blob([bytes]), contentType.split(';')[0].trim(), bytes.length);
+    data = `[${preview.contentType}, ${bytes.length} bytes]`;
+  }
+  // Server-measured time, without the network round trip
+  return {
+    status: result.status,
+    data,
+    latency: Math.round(result.elapsedMs),
+    headers: Object.fromEntries(result.headers),
+    preview,
+  };
+};
+
+/**
+ * Runs a batch of requests against the app in one round trip.
+ * Results come back in request order.
+ */
+export const executeBatch = async (
+  executeUrl: string,
+  requests: BatchRequest[]
+): Promise<SimulationResponse[]> => {
+  try {
+    const res = await fetch(executeUrl, {
+      method: 'POST',
+      // F-Docs rejects runner requests without this header (see _reject_cross_site)
+      headers: { 'Content-Type': 'application/json', 'X-FDocs-Request': '1' },
+      body: JSON.stringify({ requests }),
+    });
+    if (!res.ok) throw new Error(`Batch execution failed with HTTP ${res.status}`);
+    const { responses } = (await res.json()) as { responses: BatchResult[] };
+    return Promise.all(responses.map(toSimulationResponse));
+  } catch (error: any) {
+    return requests.map(() => ({
+      status: 0,
+      data: { error: "Network Error", details: error.message },
+      latency: 0
+    }));
+  }
+};
+
+// Keep in step with MAX_BATCH_SIZE in FDocs/execute.py
+const MAX_BATCH_SIZE = 100;
+
+// Calls made in the same tick are coalesced into a single batch
+let pending: { request: BatchRequest; resolve: (res: SimulationResponse) => void }[] = [];
+
+const queueExecution = (executeUrl: string, request: BatchRequest): Promise<SimulationResponse> =>
+  new Promise((resolve) => {
+    pending.push({ request, resolve });
+    if (pending.length > 1) return;
+    setTimeout(() => {
+      const batch = pending;
+      pending = [];
+      for (let start = 0; start < batch.length; start += MAX_BATCH_SIZE) {
+        const slice = batch.slice(start, start + MAX_BATCH_SIZE);
+        executeBatch(executeUrl, slice.map((entry) => entry.request)).then((results) =>
+          slice.forEach((entry, i) => entry.resolve(results[i]))
+        );
+      }
+    }, 0);
+  });
+
 const executeRealRequest = async (
   baseUrl: string, 
   method: Method, 
@@ -56,10 +240,25 @@ const executeRealRequest = async (
 
     const res = await fetch(url, options);
     const end = performance.now();
-    
+
+    const responseHeaders: Record<string, string> = {};
+    res.headers.forEach((value, name) => {
+      responseHeaders[name] = value;
+    });
+
     let data;
     const contentType = res.headers.get("content-type");
-    if (contentType && contentType.includes("application/json")) {
+    if (method === Method.GET && contentType && isBinaryContentType(contentType)) {
+        // Files and media are previewed through range requests, never held whole in memory
+        const preview = await loadBinaryPreview(url, options.headers as Record<string, string>, res);
+        return {
+          status: res.status,
+          data: `[${preview.contentType}${preview.size !== null ? `, ${preview.size} bytes` : ''}]`,
+          latency: Math.round(end - start),
+          headers: responseHeaders,
+          preview,
+        };
+    } else if (contentType && contentType.includes("application/json")) {
         data = await res.json();
     } else {
         data = await res.text();
@@ -68,7 +267,8 @@ const executeRealRequest = async (
     return {
       status: res.status,
       data: data,
-      latency: Math.round(end - start)
+      latency: Math.round(end - start),
+      headers: responseHeaders
     };
 
   } catch (error: any) {
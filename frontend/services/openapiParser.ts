@@ -1,12 +1,21 @@
 import { Endpoint, ApiTag, Method, ApiSpec, SecurityRequirement, ResponseDefinition, RequestBodyProperty } from '../types';
 import { DEFAULT_SPEC, BASE_URL } from '../constants';
 
-export const parseOpenApi = async (url: string): Promise<ApiSpec> => {
+export const parseOpenApi = async (url: string, docsIndexUrl?: string): Promise<ApiSpec> => {
   if (!url) {
     // Return the default internal spec provided by the user
     return parseSpec(DEFAULT_SPEC, BASE_URL);
   }
 
+  // Prefer the index pre-normalized by the Python backend (FDocs/docs_index.py)
+  if (docsIndexUrl) {
+    try {
+      return await loadDocsIndex(docsIndexUrl);
+    } catch (error) {
+      console.warn("Docs index unavailable, parsing the OpenAPI spec instead:", error);
+    }
+  }
+
   try {
     const response = await fetch(url);
 
@@ -23,6 +32,36 @@ export const parseOpenApi = async (url: string): Promise<ApiSpec> => {
   }
 };
 
+const loadDocsIndex = async (url: string): Promise<ApiSpec> => {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`Failed to fetch docs index: ${response.status} ${response.statusText}`);
+  return await response.json() as ApiSpec;
+};
+
+// Outline of the backend's docs (FDocs lazy_chunks): tags and operation summaries only
+export const loadManifest = async (url: string): Promise<ApiSpec> => {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`Failed to fetch docs manifest: ${response.status} ${response.statusText}`);
+  const manifest = await response.json();
+  const endpoints: Endpoint[] = manifest.endpoints.map((ep: any) => ({
+    ...ep,
+    description: '',
+    parameters: [],
+    responses: {},
+    isStub: true
+  }));
+  return { ...manifest, endpoints };
+};
+
+// Fully normalized endpoints for one tag
+export const loadTagChunk = async (chunksUrl: string, tag: string): Promise<Endpoint[]> => {
+  // Chunk files are named after the escaped tag (`chunk_file_name`), escaped again as a URL path segment
+  const response = await fetch(`${chunksUrl}/${encodeURIComponent(encodeURIComponent(tag))}.json`);
+  if (!response.ok) throw new Error(`Failed to fetch endpoints for tag ${tag}: ${response.status} ${response.statusText}`);
+  const chunk = await response.json();
+  return chunk.endpoints;
+};
+
 const parseSpec = (spec: any, sourceUrl: string): ApiSpec => {
     const title = spec.info?.title || "Unknown API";
     const version = spec.info?.version || "1.0.0";
@@ -301,7 +340,8 @@ function generateExampleFromSchema(schema: any, spec: any, depth = 0): any {
   }
 
   if (schema.type === 'string') {
-    if (schema.format === 'date-time') return new Date().toISOString();
+    // Same fixed value as EXAMPLE_DATE_TIME in FDocs/docs_index.py
+    if (schema.format === 'date-time') return '2024-01-01T00:00:00.000Z';
     if (schema.format === 'uuid') return "3fa85f64-5717-4562-b3fc-2c963f66afa6";
     if (schema.enum && schema.enum.length > 0) return schema.enum[0];
     return "string";
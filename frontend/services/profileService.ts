@@ -0,0 +1,57 @@
+export interface RequestProfile {
+  id: string;
+  method: string;
+  path: string;
+  started: number;
+  durationMs: number;
+  intervalMs: number;
+  samples: number;
+  /** Collapsed stacks (`outer;inner;leaf`) with their sample counts, heaviest first. */
+  stacks: [string, number][];
+}
+
+export interface FlameNode {
+  name: string;
+  value: number;
+  children: FlameNode[];
+}
+
+export const PROFILE_HEADER = 'X-FDocs-Profile';
+export const PROFILE_ID_HEADER = 'x-fdocs-profile-id';
+
+const TOKEN_KEY = 'f-docs-profile-token';
+
+export const getProfileToken = (): string => sessionStorage.getItem(TOKEN_KEY) || '';
+export const setProfileToken = (token: string) => sessionStorage.setItem(TOKEN_KEY, token);
+
+/** Fetches a profile recorded by f_docs(..., profile_token=...). */
+export const loadProfile = async (profilesUrl: string, id: string, token: string): Promise<RequestProfile> => {
+  const res = await fetch(`${profilesUrl}/${encodeURIComponent(id)}`, {
+    headers: { [PROFILE_HEADER]: token },
+    cache: 'no-store',
+  });
+  if (!res.ok) {
+    const detail = await res.json().catch(() => null);
+    throw new Error(detail?.detail || `Failed to fetch profile: HTTP ${res.status}`);
+  }
+  return res.json();
+};
+
+/** Folds collapsed stacks into a tree for rendering as a flame graph. */
+export const buildFlameTree = (stacks: [string, number][]): FlameNode => {
+  const root: FlameNode = { name: 'all', value: 0, children: [] };
+  for (const [stack, count] of stacks) {
+    root.value += count;
+    let node = root;
+    for (const frame of stack.split(';')) {
+      let child = node.children.find((c) => c.name === frame);
+      if (!child) {
+        child = { name: frame, value: 0, children: [] };
+        node.children.push(child);
+      }
+      child.value += count;
+      node = child;
+    }
+  }
+  return root;
+};
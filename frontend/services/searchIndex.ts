@@ -0,0 +1,65 @@
+// Client for the inverted index built by FDocs/search.py
+
+export interface SearchIndex {
+  version: string;
+  ids: string[];
+  tokens: [string, number[]][];
+}
+
+export interface LoadedSearchIndex {
+  version: string;
+  ids: string[];
+  keys: string[]; // Sorted tokens, for prefix lookups
+  postings: number[][];
+}
+
+// Keep in step with _WORDS in FDocs/search.py
+const WORDS = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+|[^\P{L}A-Za-z]+/gu;
+
+export const tokenize = (text: string): string[] =>
+  (text.match(WORDS) || []).map(word => word.toLowerCase());
+
+export const loadSearchIndex = async (url: string): Promise<LoadedSearchIndex> => {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`Failed to fetch search index: ${response.status} ${response.statusText}`);
+  const index: SearchIndex = await response.json();
+  // Sorted by the server, but re-sorted in JavaScript string order, which lowerBound relies on
+  // (Python orders characters outside the BMP differently)
+  const tokens = [...index.tokens].sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+  return {
+    version: index.version,
+    ids: index.ids,
+    keys: tokens.map(([key]) => key),
+    postings: tokens.map(([, positions]) => positions)
+  };
+};
+
+// First key >= prefix
+const lowerBound = (keys: string[], prefix: string): number => {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (keys[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+// Endpoint ids matching every word of the query (each word as a prefix)
+export const searchIndex = (index: LoadedSearchIndex, query: string): Set<string> | null => {
+  const words = tokenize(query);
+  if (words.length === 0) return null;
+
+  let matches: Set<number> | null = null;
+  for (const word of words) {
+    const hits = new Set<number>();
+    for (let i = lowerBound(index.keys, word); i < index.keys.length && index.keys[i].startsWith(word); i++) {
+      for (const position of index.postings[i]) hits.add(position);
+    }
+    matches = matches === null ? hits : new Set([...matches].filter(position => hits.has(position)));
+    if (matches.size === 0) break;
+  }
+
+  return new Set([...(matches || [])].map(position => index.ids[position]));
+};
@@ -0,0 +1,24 @@
+export interface TimingEntry {
+  name: string;
+  duration: number;
+  description?: string;
+}
+
+/** Parses a `Server-Timing` header (`name;dur=1.2;desc="..."`, comma separated). */
+export const parseServerTiming = (header: string | undefined): TimingEntry[] => {
+  if (!header) return [];
+  return header
+    .split(/,(?=(?:[^"]*"[^"]*")*[^"]*$)/)
+    .map((metric) => {
+      const [name, ...params] = metric.trim().split(';');
+      const entry: TimingEntry = { name: name.trim(), duration: 0 };
+      for (const param of params) {
+        const [key, raw = ''] = param.trim().split('=');
+        const value = raw.replace(/^"(.*)"$/, '$1');
+        if (key === 'dur') entry.duration = parseFloat(value) || 0;
+        else if (key === 'desc') entry.description = value;
+      }
+      return entry;
+    })
+    .filter((entry) => entry.name);
+};
@@ -0,0 +1,45 @@
+import { LatencySummary, postNdjson } from './loadTestService';
+
+export interface SoakEvent {
+  type: 'progress' | 'result';
+  clients: number;
+  elapsed: number;
+  connected: number;
+  active: number;
+  peakActive: number;
+  connectErrors: number;
+  closedByServer: number;
+  sent: number;
+  received: number;
+  receivedBytes: number;
+  dropped: number;
+  sentPerSecond: number;
+  receivedPerSecond: number;
+  connectLatency: LatencySummary;
+  roundTrip: LatencySummary;
+  /** Round-trip `[upper bound in ms, count]` pairs; only on the final result. */
+  histogram?: [number, number][];
+}
+
+export interface SoakOptions {
+  path: string;
+  clients: number;
+  duration: number;
+  /** Messages per second per client; 0 only holds the connections open. */
+  rate: number;
+  rampUp?: number;
+  /** Message template; `{id}` is replaced by a per-message token. */
+  message?: string;
+  mode?: 'asgi' | 'ws';
+}
+
+/**
+ * Starts a server-side WebSocket soak (f_docs(..., websocket_soak=True)) and
+ * reports each NDJSON progress line as it arrives.
+ */
+export const runSoak = (
+  soakUrl: string,
+  options: SoakOptions,
+  onEvent: (event: SoakEvent) => void,
+  signal?: AbortSignal
+): Promise<SoakEvent | null> => postNdjson<SoakEvent>(soakUrl, options, onEvent, signal, 'Soak test');
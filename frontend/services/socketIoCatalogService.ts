@@ -0,0 +1,43 @@
+import { LatencySummary } from './loadTestService';
+
+export interface SocketIoHandledEvent {
+  name: string;
+  handler: string;
+  doc: string;
+  /** connect/disconnect, called by the server itself. */
+  lifecycle: boolean;
+  args: string[];
+  sample: unknown;
+}
+
+export interface SocketIoNamespace {
+  namespace: string;
+  events: SocketIoHandledEvent[];
+}
+
+export interface SocketIoEmitStats {
+  event: string;
+  namespace: string;
+  count: number;
+  bytes: number;
+  messagesPerSecond: number;
+  bytesPerSecond: number;
+  lastEmitted: number;
+  latency: LatencySummary;
+  sample: unknown;
+}
+
+export interface SocketIoCatalog {
+  namespaces: SocketIoNamespace[];
+  emits: SocketIoEmitStats[];
+}
+
+/** Fetches the server's event catalog and emit counters (f_docs(..., socketio_server=sio)). */
+export const loadSocketIoCatalog = async (url: string): Promise<SocketIoCatalog> => {
+  const res = await fetch(url, { cache: 'no-store' });
+  if (!res.ok) throw new Error(`Failed to fetch Socket.IO catalog: HTTP ${res.status}`);
+  return res.json();
+};
+
+export const formatBytes = (bytes: number): string =>
+  bytes >= 1048576 ? `${(bytes / 1048576).toFixed(1)} MB` : bytes >= 1024 ? `${(bytes / 1024).toFixed(1)} KB` : `${Math.round(bytes)} B`;
@@ -1,3 +1,5 @@
+import type { BinaryPreview } from './services/binaryPreview';
+
 export enum Method {
   GET = 'GET',
   POST = 'POST',
@@ -46,6 +48,7 @@ export interface Endpoint {
   requestBodyProperties?: RequestBodyProperty[]; // For multipart/form-data fields
   responses: Record<number, ResponseDefinition>;
   security?: SecurityRequirement[];
+  isStub?: boolean; // Outline from the docs manifest; details arrive with the tag's chunk
 }
 
 export interface ApiTag {
@@ -57,6 +60,10 @@ export interface SimulationResponse {
   status: number;
   data: any;
   latency: number;
+  /** Response headers, lowercased; absent for mocked responses. */
+  headers?: Record<string, string>;
+  /** Set instead of a decoded body for binary files and media. */
+  preview?: BinaryPreview;
 }
 
 export interface OAuthFlows {
@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import Depends, FastAPI
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
+
+from FDocs import aggregate
+from FDocs.aggregate import AggregatedOpenAPI, merge_specs
+
+
+def secured_app(scheme):
+    sub = FastAPI()
+
+    @sub.get("/me")
+    async def me(token: str = Depends(scheme)):
+        return {}
+
+    return sub
+
+
+def test_security_requirements_follow_renamed_schemes():
+    app = FastAPI()
+    app.mount("/billing", secured_app(OAuth2PasswordBearer(tokenUrl="token", scheme_name="auth")))
+    app.mount("/users", secured_app(APIKeyHeader(name="X-Key", scheme_name="auth")))
+    spec = AggregatedOpenAPI(app)()
+
+    schemes = spec["components"]["securitySchemes"]
+    assert schemes["auth"]["flows"]["password"]["tokenUrl"] == "billing/token"
+    assert schemes["users_auth"] == {"type": "apiKey", "in": "header", "name": "X-Key"}
+    assert spec["paths"]["/billing/me"]["get"]["security"] == [{"auth": []}]
+    assert spec["paths"]["/users/me"]["get"]["security"] == [{"users_auth": []}]
+
+
+def test_oauth_urls_get_the_mount_prefix():
+    def spec(token_url):
+        flows = {"password": {"tokenUrl": token_url, "scopes": {}}}
+        return {"components": {"securitySchemes": {"auth": {"type": "oauth2", "flows": flows}}}}
+
+    for url, expected in [
+        ("token", "v1/token"),
+        ("/token", "/v1/token"),
+        ("https://auth.example.com/token", "https://auth.example.com/token"),
+    ]:
+        merged = merge_specs({}, [("/v1", spec(url))])
+        assert merged["components"]["securitySchemes"]["auth"]["flows"]["password"]["tokenUrl"] == expected
+    # The same relative URL of two sources points at two endpoints
+    merged = merge_specs({}, [("/a", spec("token")), ("/b", spec("token"))])
+    assert merged["components"]["securitySchemes"]["b_auth"]["flows"]["password"]["tokenUrl"] == "b/token"
+
+
+def test_unfinished_sources_are_cancelled(monkeypatch):
+    executors = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def shutdown(self, wait=True, **kwargs):
+            executors.append(kwargs)
+            super().shutdown(wait)
+
+    monkeypatch.setattr(aggregate, "ThreadPoolExecutor", RecordingExecutor)
+    app = FastAPI()
+    app.mount("/sub", secured_app(APIKeyHeader(name="X-Key")))
+    assert "/sub/me" in AggregatedOpenAPI(app)()["paths"]
+    assert executors == [{}]
+
+
+def test_discovery_walk_is_cached(monkeypatch):
+    app = FastAPI()
+    app.mount("/sub", secured_app(APIKeyHeader(name="X-Key")))
+    aggregated = AggregatedOpenAPI(app)
+    walks = []
+    discover_apps = aggregate.discover_apps
+    monkeypatch.setattr(aggregate, "discover_apps", lambda app, prefix="": walks.append(prefix) or discover_apps(app, prefix))
+
+    fingerprint = aggregated.fingerprint()
+    assert aggregated.fingerprint() == fingerprint
+    walks.clear()
+    assert aggregated.fingerprint() == fingerprint
+    assert walks == []
+
+    app.mount("/other", FastAPI())
+    assert aggregated.fingerprint() != fingerprint
+    assert list(aggregated.discovered_apps()) == ["/sub", "/other"]
+    assert walks[0] == ""
+
+
+def test_module_stamps_are_rechecked_after_their_ttl(monkeypatch):
+    stats = []
+    monkeypatch.setattr(aggregate, "_module_stamp", lambda path: stats.append(path) or len(stats))
+    aggregated = AggregatedOpenAPI(FastAPI(), {"/ext": "json:loads"}, discover=False)
+    first = aggregated.fingerprint()
+    assert aggregated.fingerprint() == first
+    assert len(stats) == 1
+
+    monkeypatch.setattr(aggregate, "STAMP_TTL", 0.0)
+    assert aggregated.fingerprint() != first
+
+
+def test_renames_do_not_collide_with_each_other():
+    host = {"components": {"schemas": {"Item": {"type": "string"}, "Item_": {"type": "string"}, "b_Item": {}}}}
+    source = {"components": {"schemas": {"Item": {"type": "integer"}, "Item_": {"type": "boolean"}}}}
+    schemas = merge_specs(host, [("/b", source)])["components"]["schemas"]
+    assert schemas["b_Item_"] == {"type": "integer"}
+    assert schemas["b_Item__"] == {"type": "boolean"}
+
+
+def test_memoized_spec_is_rebuilt_when_a_source_changes():
+    app = FastAPI()
+    sub = secured_app(APIKeyHeader(name="X-Key"))
+    app.mount("/sub", sub)
+    aggregated = AggregatedOpenAPI(app)
+    first = aggregated()
+    assert aggregated() is first
+
+    @sub.get("/new")
+    async def new():
+        return {}
+
+    assert "/sub/new" in aggregated()["paths"]
@@ -0,0 +1,60 @@
+import gc
+
+import pytest
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from FDocs import BroadcastHub
+from FDocs.broadcast import registered_hubs
+
+
+def test_hub_names_are_unique_among_live_hubs():
+    hub = BroadcastHub("unique")
+    with pytest.raises(ValueError):
+        BroadcastHub("unique")
+    assert registered_hubs()["unique"] is hub
+    del hub
+    gc.collect()
+    assert BroadcastHub("unique").name == "unique"
+
+
+def test_personal_messages_are_queued_behind_broadcasts():
+    app = FastAPI()
+    hub = BroadcastHub("personal")
+
+    @app.websocket("/ws")
+    async def chat(websocket: WebSocket):
+        await hub.connect(websocket)
+        try:
+            while True:
+                text = await websocket.receive_text()
+                await hub.broadcast({"all": text})
+                assert await hub.send_personal_message(f"only you: {text}", websocket)
+        except WebSocketDisconnect:
+            hub.disconnect(websocket)
+
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        websocket.send_text("hi")
+        assert websocket.receive_json() == {"all": "hi"}
+        assert websocket.receive_text() == "only you: hi"
+    assert hub.metrics()["delivered"] == 2
+
+
+def test_personal_messages_need_a_connection():
+    app = FastAPI()
+    hub = BroadcastHub("strangers")
+    errors = []
+
+    @app.websocket("/ws")
+    async def endpoint(websocket: WebSocket):
+        await websocket.accept()
+        try:
+            await hub.send_personal_message("hello", websocket)
+        except ValueError as exc:
+            errors.append(exc)
+        await websocket.close()
+
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_text()
+    assert len(errors) == 1
@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs.docs_index import chunk_file_name
+from FDocs.export import export_site
+
+
+def make_client():
+    app = FastAPI()
+
+    @app.get("/users", tags=["users"])
+    async def list_users():
+        return []
+
+    @app.get("/reports", tags=["billing/reports"])
+    async def list_reports():
+        return []
+
+    @app.get("/up", tags=[".."])
+    async def up():
+        return []
+
+    f_docs(app, lazy_chunks=True)
+    return app, TestClient(app)
+
+
+def test_serves_chunks_of_known_tags():
+    _, client = make_client()
+    response = client.get("/docs/chunks/users.json")
+    assert response.status_code == 200
+    assert [e["path"] for e in response.json()["endpoints"]] == ["/users"]
+
+
+def test_serves_chunks_by_escaped_file_name():
+    app, _ = make_client()
+
+    async def get(path):
+        # Not TestClient, which unquotes paths twice
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://test") as client:
+            return await client.get(path)
+
+    # As the UI requests it: the chunk file name, escaped again
+    response = asyncio.run(get("/docs/chunks/billing%252Freports.json"))
+    assert response.json()["tag"] == "billing/reports"
+    assert asyncio.run(get("/docs/chunks/billing/reports.json")).status_code == 404
+
+
+def test_unknown_tags_are_not_cached():
+    app, client = make_client()
+    for i in range(20):
+        assert client.get(f"/docs/chunks/nope-{i}.json").status_code == 404
+    assert not any(name.startswith("chunk:nope") for name in app.state.f_docs_openapi._derived)
+
+
+def test_chunk_file_names_match_encode_uri_component():
+    assert chunk_file_name("billing/reports") == "billing%2Freports.json"
+    assert chunk_file_name("a b&c!*'()~") == "a%20b%26c!*'()~.json"
+    assert chunk_file_name("..") == "...json"
+
+
+def test_export_writes_one_flat_file_per_tag(tmp_path):
+    app, _ = make_client()
+    export_site(app, tmp_path, lazy_chunks=True)
+    (chunks_dir,) = tmp_path.glob("chunks.*")
+    names = sorted(path.name for path in chunks_dir.iterdir() if path.suffix == ".json")
+    assert names == ["...json", "billing%2Freports.json", "users.json"]
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+
+
+@pytest.mark.parametrize("fast_docs", [False, True])
+def test_features_install_together(fast_docs):
+    app = FastAPI()
+
+    @app.get("/items", tags=["items"])
+    async def items():
+        return []
+
+    f_docs(
+        app,
+        cache_openapi=True,
+        docs_index=True,
+        lazy_chunks=True,
+        search_index=True,
+        warm_openapi=True,
+        execute_requests=True,
+        load_testing=True,
+        route_metrics=True,
+        profile_token="secret",
+        server_timing=True,
+        broadcast_metrics=True,
+        websocket_soak=True,
+        fast_docs=fast_docs,
+    )
+    with TestClient(app) as client:
+        for url in (
+            "/docs",
+            "/openapi.json",
+            "/docs/index.json",
+            "/docs/manifest.json",
+            "/docs/chunks/items.json",
+            "/docs/search.json",
+            "/docs/ready",
+            "/docs/metrics.json",
+            "/docs/broadcast.json",
+        ):
+            assert client.get(url).status_code == 200, url
+        assert client.get("/docs/profiles/nope", headers={"X-FDocs-Profile": "secret"}).status_code == 404
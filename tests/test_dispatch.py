@@ -0,0 +1,80 @@
+import re
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs._http import CachedBody
+from FDocs.dispatch import DocsDispatcher, install_fast_path
+
+
+class CountingMiddleware:
+    def __init__(self, app, seen):
+        self.app = app
+        self.seen = seen
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.seen.append(scope["path"])
+        await self.app(scope, receive, send)
+
+
+def make_app(seen):
+    app = FastAPI(docs_url=None)
+    app.add_middleware(CountingMiddleware, seen=seen)
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    f_docs(app, fast_docs=True, cache_openapi=True)
+    return app
+
+
+def test_docs_traffic_skips_the_app_middleware():
+    seen = []
+    client = TestClient(make_app(seen))
+
+    # The first spec request builds it through the regular route; later ones are answered from memory
+    assert client.get("/openapi.json").status_code == 200
+    assert seen == ["/openapi.json"]
+    seen.clear()
+
+    assert client.get("/openapi.json").status_code == 200
+    page = client.get("/docs")
+    assert page.status_code == 200
+    assert page.headers["content-type"].startswith("text/html")
+    for asset in re.findall(r'(?:src|href)="([^"]*/assets/[^"]+)"', page.text):
+        assert client.get(asset).status_code == 200
+    assert seen == []
+
+    assert client.get("/items").json() == []
+    assert client.post("/docs").status_code == 405
+    assert seen == ["/items", "/docs"]
+
+
+def test_wraps_a_started_app():
+    seen = []
+    app = FastAPI()
+    app.add_middleware(CountingMiddleware, seen=seen)
+    client = TestClient(app)
+    client.get("/")
+    seen.clear()
+
+    install_fast_path(app, {"/fast": lambda scope: CachedBody(b"fast", "text/plain")}, {})
+    assert client.get("/fast").text == "fast"
+    assert client.get("/slow").status_code == 404
+    assert seen == ["/slow"]
+
+
+def test_unbuilt_bodies_fall_through_to_the_app():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["path"])
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    dispatcher = DocsDispatcher(app, {"/index.json": lambda scope: None}, {})
+    assert TestClient(dispatcher).get("/index.json").status_code == 204
+    assert seen == ["/index.json"]
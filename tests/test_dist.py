@@ -0,0 +1,41 @@
+import json
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs.core import DEFAULT_ASSETS_PATH
+
+
+def docs_config():
+    # FastAPI's own Swagger page would otherwise answer /docs
+    app = FastAPI(docs_url=None)
+    f_docs(
+        app,
+        docs_index=True,
+        lazy_chunks=True,
+        search_index=True,
+        live_updates=True,
+        execute_requests=True,
+        load_testing=True,
+        route_metrics=True,
+        profile_token="secret",
+        server_timing=True,
+        broadcast_metrics=True,
+        websocket_soak=True,
+        network_origin="http://127.0.0.1:8000",
+    )
+    page = TestClient(app).get("/docs").text
+    return json.loads(re.search(r"window\.NEXUS_CONFIG = (\{.*?\});</script>", page).group(1))
+
+
+# The bundle in FDocs/dist predates the frontend changes of the backlog and
+# must be rebuilt with `npm run build` (which needs the npm registry). Strict,
+# so the marker has to go once the rebuilt bundle is committed.
+@pytest.mark.xfail(strict=True, raises=AssertionError, reason="FDocs/dist is stale: run `npm run build` in frontend/")
+def test_bundle_reads_every_config_key():
+    bundle = "".join(path.read_text(encoding="utf-8") for path in DEFAULT_ASSETS_PATH.glob("*.js"))
+    missing = sorted(key for key in docs_config() if key not in bundle)
+    assert missing == []
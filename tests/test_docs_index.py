@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from FDocs import f_docs
+from FDocs.docs_index import EXAMPLE_DATE_TIME, build_docs_index
+
+
+class Event(BaseModel):
+    name: str
+    at: datetime
+
+
+def make_app(**options):
+    app = FastAPI()
+
+    @app.post("/events")
+    async def create_event(event: Event) -> Event:
+        return event
+
+    return f_docs(app, **options)
+
+
+def test_plain_f_docs_adds_no_index_routes():
+    paths = {getattr(route, "path", None) for route in make_app().routes}
+    assert "/docs/index.json" not in paths
+    assert "/docs/search.json" not in paths
+
+
+def test_index_is_served_when_enabled():
+    client = TestClient(make_app(docs_index=True))
+    response = client.get("/docs/index.json")
+    assert response.status_code == 200
+    assert [e["path"] for e in response.json()["endpoints"]] == ["/events"]
+
+
+def test_examples_are_deterministic():
+    spec = make_app().openapi()
+    first, second = build_docs_index(spec), build_docs_index(spec)
+    assert first == second
+    assert EXAMPLE_DATE_TIME in repr(first)
@@ -0,0 +1,73 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+
+DOCS_HEADERS = {"X-FDocs-Request": "1"}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int, request: Request):
+        return {"id": item_id, "cookie": request.headers.get("cookie")}
+
+    f_docs(app, execute_requests=True, load_testing=True, websocket_soak=True)
+    return TestClient(app)
+
+
+def execute(client, *requests, **kwargs):
+    kwargs.setdefault("headers", DOCS_HEADERS)
+    return client.post("/docs/execute", json={"requests": list(requests)}, **kwargs)
+
+
+def test_runs_requests_in_process(client):
+    client.cookies.set("session", "abc")
+    response = execute(client, {"method": "GET", "path": "/items/1"}, {"method": "GET", "path": "/items/x"})
+    assert response.status_code == 200
+    first, second = response.json()["responses"]
+    assert first["status"] == 200
+    assert '"cookie":"session=abc"' in first["body"]
+    assert second["status"] == 422
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/docs/execute",
+        "/docs/execute/",
+        "/docs/%65xecute",
+        "/docs//execute",
+        "/docs/./execute",
+        "/items/../docs/execute",
+        "/docs/loadtest",
+        "/docs/%6Coadtest?x=1",
+        "/docs/soak",
+        "/docs/mcp-bench",
+    ],
+)
+def test_refuses_runner_endpoints(client, path):
+    response = execute(client, {"method": "POST", "path": path, "body": "{}"})
+    assert response.status_code == 200
+    result = response.json()["responses"][0]
+    assert result["status"] == 0
+    assert "cannot be batched" in result["error"]
+
+
+def test_refuses_non_json_posts(client):
+    # A cross-site form or "simple" fetch can only send these content types
+    for content_type in ("text/plain", "application/x-www-form-urlencoded", "multipart/form-data"):
+        response = client.post(
+            "/docs/execute",
+            content=b'{"requests": [{"path": "/items/1"}]}',
+            headers={"Content-Type": content_type, **DOCS_HEADERS},
+        )
+        assert response.status_code == 415
+
+
+def test_requires_docs_header(client):
+    response = execute(client, {"method": "GET", "path": "/items/1"}, headers={})
+    assert response.status_code == 403
@@ -0,0 +1,57 @@
+import json
+import sys
+
+from fastapi import FastAPI
+
+from FDocs.__main__ import main
+from FDocs.export import export_site
+
+APP_MODULE = '''
+from fastapi import FastAPI
+
+app = FastAPI(title="Exported")
+
+
+@app.get("/items", tags=["items"])
+async def list_items():
+    return []
+'''
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/items", tags=["items"])
+    async def list_items():
+        return []
+
+    return app
+
+
+def test_export_leaves_the_app_alone(tmp_path):
+    app = make_app()
+    routes = list(app.routes)
+    written = export_site(app, tmp_path)
+
+    assert app.routes == routes
+    assert not hasattr(app.state, "f_docs_openapi")
+    (spec_name,) = [name for name in written if name.startswith("openapi.") and name.endswith(".json")]
+    assert "/items" in json.loads((tmp_path / spec_name).read_text())["paths"]
+
+
+def test_export_command(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.delitem(sys.modules, "exported_app", raising=False)
+    (tmp_path / "exported_app.py").write_text(APP_MODULE)
+    output = tmp_path / "site"
+
+    code = main(["export", "exported_app:app", "--app-dir", str(tmp_path), "-o", str(output), "--lazy-chunks"])
+
+    assert code == 0
+    assert f"to {output}" in capsys.readouterr().out
+    html = (output / "index.html").read_text()
+    (spec_path,) = output.glob("openapi.*.json")
+    assert spec_path.name in html
+    assert json.loads(spec_path.read_text())["info"]["title"] == "Exported"
+    assert (output / next(output.glob("chunks.*")).name / "items.json").is_file()
+    sys.modules.pop("exported_app", None)
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import serve_file
+from FDocs.files import ZEROCOPY_EXTENSION, FileDownload, _single_range
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / "data.bin").write_bytes(CONTENT)
+    return tmp_path
+
+
+@pytest.fixture
+def client(directory):
+    app = FastAPI()
+
+    @app.get("/files/{filename}")
+    async def get_file(filename: str):
+        return await serve_file(directory, filename)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("bytes=0-9", (0, 10)),
+        ("bytes=1000-", (1000, 1024)),
+        ("bytes=-24", (1000, 1024)),
+        ("bytes=1000-5000", (1000, 1024)),
+        ("bytes=2000-", None),
+        ("bytes=9-0", None),
+        ("bytes=0-1,4-5", None),
+        ("items=0-9", None),
+        ("bytes=x-9", None),
+    ],
+)
+def test_single_range(value, expected):
+    assert _single_range(value, len(CONTENT)) == expected
+
+
+def test_serves_ranges_and_conditional_requests(client):
+    response = client.get("/files/data.bin", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == "bytes 10-19/1024"
+
+    etag = client.get("/files/data.bin").headers["etag"]
+    assert client.get("/files/data.bin", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/files/../data.bin").status_code == 404
+    assert client.get("/files/missing.bin").status_code == 404
+
+
+def send_zerocopy(directory, headers, extensions):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+        "extensions": extensions,
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == ZEROCOPY_EXTENSION:
+            file = message["file"]
+            file.seek(message["offset"])
+            message = {"type": message["type"], "body": file.read(message["count"])}
+        messages.append(message)
+
+    asyncio.run(FileDownload(directory / "data.bin")(scope, receive, send))
+    return messages
+
+
+def test_zerocopy_sends_single_ranges(directory):
+    start, body = send_zerocopy(directory, {"range": "bytes=-4"}, {ZEROCOPY_EXTENSION: {}})
+    assert start["status"] == 206
+    assert dict(start["headers"])[b"content-range"] == b"bytes 1020-1023/1024"
+    assert body == {"type": ZEROCOPY_EXTENSION, "body": CONTENT[-4:]}
+
+
+def test_zerocopy_leaves_the_rest_to_file_response(directory):
+    extensions = {ZEROCOPY_EXTENSION: {}, "http.response.pathsend": {}}
+    start, body = send_zerocopy(directory, {}, extensions)
+    assert start["status"] == 200
+    assert body["type"] == "http.response.pathsend"
+
+    start, *_ = send_zerocopy(directory, {"range": "bytes=0-1,4-5"}, {ZEROCOPY_EXTENSION: {}})
+    assert start["status"] == 206
+    assert b"multipart/byteranges" in dict(start["headers"])[b"content-type"]
+
+    start, _ = send_zerocopy(directory, {"range": "bytes=0-1", "if-range": '"stale"'}, {ZEROCOPY_EXTENSION: {}})
+    assert start["status"] == 200
@@ -0,0 +1,77 @@
+import pytest
+
+from FDocs._http import CachedBody, accepted_encodings, etag_matches
+
+CONTENT = b'{"openapi":"3.1.0"}' * 64
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", ("br", "gzip")),
+        ("gzip", ("gzip",)),
+        ("br;q=0.5, gzip;q=1.0", ("br", "gzip")),
+        ("br;q=0, gzip", ("gzip",)),
+        ("gzip; q=0", ()),
+        ("gzip;q=0.0, identity", ()),
+        ("*", ("br", "gzip")),
+        ("*, br;q=0", ("gzip",)),
+        ("*;q=0", ()),
+        ("GZIP;q=bogus", ()),
+        ("", ()),
+    ],
+)
+def test_accepted_encodings(header, expected):
+    assert accepted_encodings(header) == expected
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        ('"abc123"', True),
+        ('W/"abc123"', True),
+        ('"abc123-gzip"', True),
+        ('W/"abc123-br"', True),
+        ('"other", "abc123"', True),
+        ('"other",W/"abc123-gzip"', True),
+        ("*", True),
+        ('"other"', False),
+        ('"abc1234"', False),
+        ('"other", W/"nope"', False),
+    ],
+)
+def test_etag_matches(header, matches):
+    assert etag_matches(header, "abc123") is matches
+
+
+def test_cached_body_serves_the_best_variant():
+    body = CachedBody(CONTENT, "application/json")
+    assert "gzip" in body.variants
+
+    status, headers, content = body.resolve("gzip, deflate", None)
+    assert status == 200
+    assert content == body.variants["gzip"]
+    assert (b"content-encoding", b"gzip") in headers
+    assert (b"vary", b"Accept-Encoding") in headers
+    assert (b"etag", f'"{body.digest}-gzip"'.encode()) in headers
+
+    status, headers, content = body.resolve("gzip;q=0", None)
+    assert content == CONTENT
+    assert dict(headers)[b"content-length"] == str(len(CONTENT)).encode()
+
+
+def test_cached_body_answers_not_modified():
+    body = CachedBody(CONTENT, "application/json", cache_control="no-cache")
+    status, headers, content = body.resolve("gzip", f'W/"{body.digest}-gzip"')
+    assert status == 304
+    assert content == b""
+    assert {name for name, _ in headers} == {b"etag", b"cache-control", b"vary"}
+
+    assert body.resolve("gzip", '"stale"')[0] == 200
+
+
+def test_small_bodies_are_not_compressed():
+    body = CachedBody(b"{}", "application/json")
+    assert list(body.variants) == ["identity"]
+    assert body.select("br, gzip") == "identity"
+    assert b"vary" not in dict(body.raw_headers["identity"])
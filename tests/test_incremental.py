@@ -0,0 +1,68 @@
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+from pydantic import BaseModel
+
+from FDocs.incremental import IncrementalOpenAPI
+
+
+def make_item(field: str):
+    # Two different models that both end up as the "Item" component
+    return type("Item", (BaseModel,), {"__annotations__": {field: int}})
+
+
+def rebuild(app):
+    app.openapi_schema = None
+    return app.openapi()
+
+
+def test_only_new_routes_are_generated():
+    app = FastAPI()
+    app.openapi = builder = IncrementalOpenAPI(app)
+
+    @app.get("/a")
+    async def a():
+        return {}
+
+    rebuild(app)
+    assert builder.fragments_built == 1
+
+    @app.get("/b")
+    async def b():
+        return {}
+
+    schema = rebuild(app)
+    assert builder.fragments_built == 2
+    assert set(schema["paths"]) == {"/a", "/b"}
+
+
+def test_conflicts_skip_the_fragment_pass_until_resolved():
+    app = FastAPI()
+    app.openapi = builder = IncrementalOpenAPI(app)
+    first, second = make_item("x"), make_item("y")
+
+    @app.post("/first")
+    async def post_first(item: first):
+        return {}
+
+    @app.post("/second")
+    async def post_second(item: second):
+        return {}
+
+    expected = get_openapi(title=app.title, version=app.version, routes=app.routes)
+    assert rebuild(app)["components"] == expected["components"]
+    assert builder.full_builds == 1
+    built = builder.fragments_built
+
+    @app.get("/other")
+    async def other():
+        return {}
+
+    schema = rebuild(app)
+    assert "/other" in schema["paths"]
+    assert builder.full_builds == 2
+    assert builder.fragments_built == built
+
+    app.router.routes[:] = [r for r in app.router.routes if getattr(r, "path", None) != "/second"]
+    schema = rebuild(app)
+    assert builder.full_builds == 2
+    assert set(schema["paths"]) == {"/first", "/other"}
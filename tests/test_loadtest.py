@@ -0,0 +1,123 @@
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+
+DOCS_HEADERS = {"X-FDocs-Request": "1"}
+
+
+def make_app(**options):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    f_docs(app, load_testing=True, execute_requests=True, **options)
+    return app
+
+
+def load_test(client, request, **payload):
+    payload = {"request": request, "total": 20, "concurrency": 4, **payload}
+    return client.post("/docs/loadtest", json=payload, headers=DOCS_HEADERS)
+
+
+def events(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_runs_in_process():
+    client = TestClient(make_app())
+    response = load_test(client, {"method": "GET", "path": "/ping"})
+    assert response.status_code == 200
+    result = events(response)[-1]
+    assert result["type"] == "result"
+    assert result["completed"] == 20
+    assert result["statuses"] == {"200": 20}
+
+
+@pytest.mark.parametrize("path", ["/docs/loadtest", "/docs/%6Coadtest", "/docs//execute/", "/docs/soak", "/docs/mcp-bench"])
+def test_refuses_runner_endpoints(path):
+    client = TestClient(make_app())
+    response = load_test(client, {"method": "POST", "path": path})
+    assert response.status_code == 422
+
+
+def test_invalid_body_is_rejected_before_streaming():
+    client = TestClient(make_app())
+    response = load_test(client, {"method": "POST", "path": "/ping", "body": "not base64!", "bodyEncoding": "base64"})
+    assert response.status_code == 422
+
+
+def test_refuses_cross_site_posts():
+    client = TestClient(make_app())
+    body = json.dumps({"request": {"path": "/ping"}})
+    response = client.post("/docs/loadtest", content=body, headers={"Content-Type": "text/plain", **DOCS_HEADERS})
+    assert response.status_code == 415
+    response = client.post("/docs/loadtest", content=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == 403
+
+
+def test_http_mode_needs_a_configured_origin():
+    client = TestClient(make_app())
+    response = load_test(client, {"method": "GET", "path": "/ping"}, mode="http")
+    assert response.status_code == 422
+
+
+def record_requests(monkeypatch, app):
+    """Routes httpx requests to `app` in-process and records their URLs."""
+    urls = []
+
+    class RecordingTransport(httpx.ASGITransport):
+        async def handle_async_request(self, request):
+            urls.append(str(request.url))
+            return await super().handle_async_request(request)
+
+    class RecordingClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            super().__init__(transport=RecordingTransport(app), **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingClient)
+    return urls
+
+
+def test_http_mode_ignores_the_host_header(monkeypatch):
+    app = make_app(network_origin="http://127.0.0.1:8000")
+    urls = record_requests(monkeypatch, app)
+    client = TestClient(app)
+    response = client.post(
+        "/docs/loadtest",
+        json={"request": {"method": "GET", "path": "/ping"}, "total": 5, "concurrency": 1, "mode": "http"},
+        headers={"Host": "internal.example:8080", **DOCS_HEADERS},
+    )
+    assert response.status_code == 200
+    assert urls == ["http://127.0.0.1:8000/ping"] * 5
+    assert events(response)[-1]["statuses"] == {"200": 5}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "http://169.254.169.254/latest/meta-data",
+        "//169.254.169.254/latest/meta-data",
+        "/\\169.254.169.254/latest",
+        "ping",
+    ],
+)
+@pytest.mark.parametrize("mode", ["http", "asgi"])
+def test_refuses_paths_off_the_origin(monkeypatch, path, mode):
+    app = make_app(network_origin="http://127.0.0.1:8000")
+    urls = record_requests(monkeypatch, app)
+    client = TestClient(app)
+    client.cookies.set("session", "abc")
+    response = client.post(
+        "/docs/loadtest",
+        json={"request": {"method": "GET", "path": path}, "total": 1, "concurrency": 1, "mode": mode},
+        headers={"Authorization": "Bearer secret", **DOCS_HEADERS},
+    )
+    assert response.status_code == 400
+    assert urls == []
@@ -0,0 +1,51 @@
+import pytest
+from fastapi import FastAPI
+
+pytest.importorskip("fastapi_mcp")
+
+from fastapi_mcp import FastApiMCP  # noqa: E402
+
+from FDocs import f_docs  # noqa: E402
+from FDocs.mcp_bridge import mount_mcp  # noqa: E402
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/ping", operation_id="ping")
+    async def ping():
+        return {"ok": True}
+
+    f_docs(app, mcp_path="/mcp")
+    return app
+
+
+def test_relies_on_fastapi_mcp_internals_that_exist():
+    # Pinned in the `mcp` extra; this fails first if a release drops them
+    server = FastApiMCP(FastAPI())
+    assert callable(server._filter_tools)
+    assert isinstance(server._describe_all_responses, bool)
+    assert isinstance(server._describe_full_response_schema, bool)
+
+
+def test_catalog_follows_routes_added_later():
+    app = make_app()
+    bridge = app.state.f_docs_mcp
+    bridge.sync()
+    assert [tool.name for tool in bridge.server.tools] == ["ping"]
+
+    @app.get("/pong", operation_id="pong")
+    async def pong():
+        return {"ok": True}
+
+    bridge.sync()
+    assert sorted(tool.name for tool in bridge.server.tools) == ["ping", "pong"]
+    assert "pong" in bridge.server.operation_map
+
+
+def test_mounted_once_per_app():
+    app = make_app()
+    bridge = app.state.f_docs_mcp
+    assert mount_mcp(app, app.state.f_docs_openapi, "/mcp") is bridge
+    with pytest.raises(RuntimeError):
+        mount_mcp(app, app.state.f_docs_openapi, "/other")
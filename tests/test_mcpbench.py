@@ -0,0 +1,38 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytest.importorskip("fastapi_mcp")
+
+from FDocs import f_docs  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/ping", operation_id="ping")
+    async def ping():
+        return {"ok": True}
+
+    f_docs(app, mcp_path="/mcp", load_testing=True)
+    return TestClient(app)
+
+
+def test_refuses_cross_site_posts(client):
+    body = json.dumps({"calls": [{"tool": "ping"}], "total": 1, "concurrency": 1})
+    response = client.post("/docs/mcp-bench", content=body, headers={"Content-Type": "text/plain", "X-FDocs-Request": "1"})
+    assert response.status_code == 415
+    response = client.post("/docs/mcp-bench", content=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == 403
+
+
+def test_rejects_unknown_tools(client):
+    response = client.post(
+        "/docs/mcp-bench",
+        json={"calls": [{"tool": "nope"}], "total": 1, "concurrency": 1},
+        headers={"X-FDocs-Request": "1"},
+    )
+    assert response.status_code == 422
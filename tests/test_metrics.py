@@ -0,0 +1,70 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    f_docs(app, route_metrics=True, execute_requests=True)
+    return app
+
+
+def routes(client):
+    return client.get("/docs/metrics.json").json()["routes"]
+
+
+def test_counts_requests_per_route_and_method(app):
+    client = TestClient(app)
+    for _ in range(3):
+        client.get("/items")
+    stats = routes(client)
+    assert set(stats) == {"get-/items"}
+    assert stats["get-/items"]["count"] == 3
+    assert stats["get-/items"]["statuses"] == {"2xx": 3}
+
+
+def test_unknown_methods_share_one_bucket(app):
+    client = TestClient(app)
+    for i in range(5):
+        assert client.request(f"X{i}", "/items").status_code == 405
+    client.delete("/items")
+    stats = routes(client)
+    assert set(stats) == {"other-/items"}
+    assert stats["other-/items"]["count"] == 6
+    assert stats["other-/items"]["statuses"] == {"4xx": 6}
+
+
+def test_skips_docs_routes_and_docs_traffic(app):
+    client = TestClient(app)
+    client.get("/docs")
+    client.post("/docs/execute", json={"requests": [{"path": "/items"}]}, headers={"X-FDocs-Request": "1"})
+    assert routes(client) == {}
+
+
+def test_reports_latency_percentiles():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    registry = MetricsRegistry()
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/items")
+    stats = registry.stats_for(route, "GET")
+    for ms in range(1, 101):
+        stats.record(200, ms / 1000)
+    latency = registry.snapshot()["routes"]["get-/items"]["latency"]
+    assert latency["count"] == 100
+    assert latency["min"] == 1.0 and latency["max"] == 100.0
+    # Buckets are within ~3% of the value
+    assert 50 <= latency["p50"] <= 52
+    assert 99 <= latency["p99"] <= 100
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs.openapi import OpenAPICache
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items():
+        return []
+
+    return app
+
+
+def test_spec_is_built_once():
+    app = make_app()
+    cache = OpenAPICache(app)
+    calls = []
+    openapi = app.openapi
+    app.openapi = lambda: calls.append(1) or openapi()
+
+    body = cache.get()
+    assert cache.get() is body
+    assert cache.version == body.digest
+    assert not cache.is_stale()
+    assert calls == [1]
+
+
+def test_adding_a_route_rebuilds_the_spec_and_derived_values():
+    app = make_app()
+    cache = OpenAPICache(app)
+    paths = cache.derive("paths", lambda schema: sorted(schema["paths"]))
+    assert paths == ["/items"]
+    version = cache.version
+
+    router = APIRouter()
+
+    @router.get("/users")
+    async def list_users():
+        return []
+
+    app.include_router(router)
+    assert cache.is_stale()
+    assert not cache.is_ready("paths")
+    assert cache.derive("paths", lambda schema: sorted(schema["paths"])) == ["/items", "/users"]
+    assert cache.version != version
+
+
+def test_invalidate_forces_a_rebuild():
+    app = make_app()
+    cache = OpenAPICache(app)
+    cache.get()
+    cache.invalidate()
+    assert cache.is_stale()
+
+
+def test_served_spec_revalidates():
+    app = make_app()
+    f_docs(app, cache_openapi=True)
+    client = TestClient(app)
+
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert client.get("/openapi.json", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+    @app.get("/new")
+    async def new():
+        return {}
+
+    response = client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "/new" in response.json()["paths"]
@@ -0,0 +1,53 @@
+import time
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs._http import expose_header
+
+TOKEN = "secret"
+
+
+def make_client(**options):
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], expose_headers=["X-Custom"])
+
+    @app.get("/slow")
+    async def slow():
+        time.sleep(0.02)
+        return {"ok": True}
+
+    f_docs(app, profile_token=TOKEN, **options)
+    return app, TestClient(app)
+
+
+def test_profiles_a_request():
+    app, client = make_client()
+    response = client.get("/slow", headers={"X-FDocs-Profile": TOKEN, "Origin": "http://example.com"})
+    assert response.status_code == 200
+    profile_id = response.headers["x-fdocs-profile-id"]
+    exposed = response.headers.get_list("access-control-expose-headers")
+    assert len(exposed) == 1
+    assert {item.strip() for item in exposed[0].split(",")} == {"X-Custom", "X-FDocs-Profile-Id"}
+
+    profile = client.get(f"/docs/profiles/{profile_id}", headers={"X-FDocs-Profile": TOKEN})
+    assert profile.status_code == 200
+    assert profile.json()["path"] == "/slow"
+    assert profile.json()["samples"] > 0
+    # Fetching the profile is not itself profiled
+    assert "x-fdocs-profile-id" not in profile.headers
+
+
+def test_rejects_invalid_tokens():
+    _, client = make_client()
+    assert client.get("/slow", headers={"X-FDocs-Profile": "wrong"}).status_code == 403
+    assert client.get("/docs/profiles/abc", headers={"X-FDocs-Profile": "wrong"}).status_code == 403
+
+
+def test_expose_header_merges():
+    assert expose_header([], b"A") == [(b"access-control-expose-headers", b"A")]
+    assert expose_header([(b"access-control-expose-headers", b"B")], b"A") == [(b"access-control-expose-headers", b"B, A")]
+    assert expose_header([(b"access-control-expose-headers", b"a")], b"A") == [(b"access-control-expose-headers", b"a")]
+    assert expose_header([(b"access-control-expose-headers", b"*")], b"A") == [(b"access-control-expose-headers", b"*")]
@@ -0,0 +1,40 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs.search import build_search_index, tokenize
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/errors/404", summary="Describe the not found error")
+    async def not_found():
+        return {}
+
+    @app.get("/users/{user_id}", summary="Read a user")
+    async def read_user(user_id: int):
+        return {}
+
+    return app
+
+
+def test_tokens_are_sorted_pairs():
+    index = build_search_index(make_app().openapi(), version="v1")
+    tokens = [token for token, _ in index["tokens"]]
+    assert tokens == sorted(tokens)
+    assert "404" in tokens and "user" in tokens
+    postings = dict(index["tokens"])
+    assert [index["ids"][p] for p in postings["404"]] == ["get-/errors/404"]
+
+
+def test_tokenize_splits_words():
+    assert tokenize("readUser_by-ID 42") == {"read", "user", "by", "id", "42"}
+
+
+def test_served_when_enabled():
+    app = make_app()
+    f_docs(app, search_index=True)
+    response = TestClient(app).get("/docs/search.json")
+    assert response.status_code == 200
+    assert isinstance(response.json()["tokens"], list)
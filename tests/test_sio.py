@@ -0,0 +1,101 @@
+import asyncio
+from typing import List
+
+from pydantic import BaseModel
+
+from FDocs import sio
+from FDocs.sio import SIZE_EVERY, EmitStats, EventCatalog
+
+
+class FakeServer:
+    """Just the parts of `socketio.AsyncServer` F-Docs touches."""
+
+    def __init__(self):
+        self.handlers = {"/": {}}
+        self.namespace_handlers = {}
+        self.emitted = []
+
+    def on(self, event, handler, namespace="/"):
+        self.handlers.setdefault(namespace, {})[event] = handler
+
+    async def emit(self, event, data=None, to=None, namespace=None):
+        self.emitted.append((event, data, namespace))
+
+
+class Message(BaseModel):
+    text: str
+    room: str = "lobby"
+
+
+def emit_all(server, calls):
+    async def run():
+        for args, kwargs in calls:
+            await server.emit(*args, **kwargs)
+
+    asyncio.run(run())
+
+
+def test_emits_are_counted_once_per_server():
+    server = FakeServer()
+    stats = EmitStats()
+    stats.instrument(server)
+    stats.instrument(server)
+    emit_all(server, [(("tick", {"n": 1}), {}), (("tick", b"\x00\x01"), {}), (("news", "hi"), {"namespace": "/feed"})])
+
+    assert len(server.emitted) == 3
+    events = {(e["namespace"], e["event"]): e for e in stats.snapshot()}
+    assert events[("/", "tick")]["count"] == 2
+    assert events[("/", "tick")]["bytes"] == len(b'{"n":1}') + 2
+    assert events[("/feed", "news")]["sample"] == "hi"
+
+
+def test_payloads_are_serialized_on_a_fraction_of_emits(monkeypatch):
+    calls = []
+    dumps = sio.dumps
+    monkeypatch.setattr(sio, "dumps", lambda value: calls.append(value) or dumps(value))
+    server = FakeServer()
+    stats = EmitStats()
+    stats.instrument(server)
+    emit_all(server, [(("tick", {"n": 1}), {})] * (SIZE_EVERY + 1))
+
+    assert len(calls) == 2
+    (event,) = stats.snapshot()
+    assert event["bytes"] == (SIZE_EVERY + 1) * len(b'{"n":1}')
+
+
+def test_sample_is_a_copy():
+    server = FakeServer()
+    stats = EmitStats()
+    stats.instrument(server)
+    payload = {"items": [1]}
+    emit_all(server, [(("update", payload), {})])
+    payload["items"].append(2)
+
+    assert stats.snapshot()[0]["sample"] == {"items": [1]}
+
+
+def test_catalog_describes_handlers_and_follows_changes():
+    server = FakeServer()
+
+    async def connect(sid, environ):
+        pass
+
+    async def chat(sid, message: Message):
+        """Posts to a room."""
+
+    server.on("connect", connect)
+    server.on("chat", chat)
+    catalog = EventCatalog(server)
+    (namespace,) = catalog.namespaces()
+    assert [e["name"] for e in namespace["events"]] == ["connect", "chat"]
+    chat_entry = namespace["events"][1]
+    assert chat_entry["doc"] == "Posts to a room."
+    assert chat_entry["sample"] == {"text": "string", "room": "lobby"}
+    assert catalog.namespaces() is catalog.namespaces()
+
+    async def tags(sid, names: List[str]):
+        pass
+
+    server.on("tags", tags, namespace="/admin")
+    assert [n["namespace"] for n in catalog.namespaces()] == ["/", "/admin"]
+    assert catalog.namespaces()[1]["events"][0]["sample"] == ["string"]
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs
+from FDocs import soak
+
+DOCS_HEADERS = {"X-FDocs-Request": "1"}
+
+
+def make_app(**options):
+    app = FastAPI()
+
+    @app.websocket("/ws")
+    async def echo(websocket: WebSocket):
+        await websocket.accept()
+        try:
+            while True:
+                await websocket.send_text(await websocket.receive_text())
+        except WebSocketDisconnect:
+            pass
+
+    f_docs(app, websocket_soak=True, **options)
+    return app
+
+
+def run(client, **payload):
+    payload = {"path": "/ws", "clients": 3, "duration": 0.3, "rate": 10, **payload}
+    return client.post("/docs/soak", json=payload, headers=DOCS_HEADERS)
+
+
+def test_soaks_in_process():
+    response = run(TestClient(make_app()))
+    assert response.status_code == 200
+    result = json.loads(response.text.splitlines()[-1])
+    assert result["type"] == "result"
+    assert result["connected"] == 3
+    assert result["sent"] > 0
+    assert result["dropped"] == 0
+
+
+def test_refuses_cross_site_posts():
+    client = TestClient(make_app())
+    body = json.dumps({"path": "/ws"})
+    response = client.post("/docs/soak", content=body, headers={"Content-Type": "text/plain", **DOCS_HEADERS})
+    assert response.status_code == 415
+    response = client.post("/docs/soak", content=body, headers={"Content-Type": "application/json"})
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"clients": soak.MAX_CLIENTS + 1},
+        {"duration": soak.MAX_DURATION + 1},
+        {"duration": soak.MAX_DURATION, "rampUp": 1},
+        {"rate": soak.MAX_RATE + 1},
+    ],
+)
+def test_caps_runs(payload):
+    assert run(TestClient(make_app()), **payload).status_code == 422
+
+
+def test_network_mode_needs_a_configured_origin():
+    assert run(TestClient(make_app()), mode="ws").status_code == 422
+
+
+def test_network_mode_ignores_the_host_header(monkeypatch):
+    urls = []
+
+    class RecordingWebSocket(soak._NetworkWebSocket):
+        async def connect(self):
+            urls.append(self.url)
+            raise OSError("not connecting in tests")
+
+    monkeypatch.setattr(soak, "_NetworkWebSocket", RecordingWebSocket)
+    client = TestClient(make_app(network_origin="http://127.0.0.1:8000"))
+    response = client.post(
+        "/docs/soak",
+        json={"path": "/ws", "clients": 2, "duration": 0.1, "mode": "ws"},
+        headers={"Host": "internal.example:8080", **DOCS_HEADERS},
+    )
+    assert response.status_code == 200
+    assert urls == ["ws://127.0.0.1:8000/ws"] * 2
+
+
+def test_client_slots_are_shared_between_runs():
+    app = make_app()
+
+    async def main():
+        slots = soak.ClientSlots(4)
+        base = {"type": "http", "headers": [], "root_path": ""}
+
+        async def one_run():
+            async for event in soak.run_soak(app, base, "/ws", clients=3, duration=0.3, slots=slots):
+                result = event
+            return result
+
+        results = await asyncio.gather(one_run(), one_run())
+        assert slots.free == 4
+        return results
+
+    first, second = asyncio.run(main())
+    assert first["connected"] + second["connected"] == 4
+    assert first["connectErrors"] + second["connectErrors"] == 2
+
+
+@pytest.mark.parametrize("path", ["ws://169.254.169.254/ws", "//169.254.169.254/ws", "ws"])
+def test_refuses_paths_off_the_origin(monkeypatch, path):
+    urls = []
+
+    class RecordingWebSocket(soak._NetworkWebSocket):
+        async def connect(self):
+            urls.append(self.url)
+            raise OSError("not connecting in tests")
+
+    monkeypatch.setattr(soak, "_NetworkWebSocket", RecordingWebSocket)
+    client = TestClient(make_app(network_origin="http://127.0.0.1:8000"))
+    assert run(client, path=path, mode="ws").status_code == 400
+    assert urls == []
@@ -0,0 +1,38 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs.static import IMMUTABLE, REVALIDATE, PrecompressedStaticFiles, is_hashed
+
+
+@pytest.mark.parametrize("key", ["index-Btr0A8ND.js", "index-v0gNXjRg.css", "vendor-a_b-C1d2.js"])
+def test_vite_hashed_names(key):
+    assert is_hashed(key)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "apple-touch-icon.png",
+        "favicon.ico",
+        "index.js",
+        "index.Btr0A8ND.js",
+        "index-Btr0A8NDx.js",
+        "index-Btr0A8N.js",
+        "fonts/inter-Btr0A8ND.woff2",
+    ],
+)
+def test_unhashed_names(key):
+    assert not is_hashed(key)
+
+
+def test_cache_control(tmp_path):
+    (tmp_path / "index-Btr0A8ND.js").write_text("console.log(1)")
+    (tmp_path / "apple-touch-icon.png").write_bytes(b"\x89PNG")
+    app = FastAPI()
+    app.mount("/assets", PrecompressedStaticFiles(tmp_path))
+    client = TestClient(app)
+
+    assert client.get("/assets/index-Btr0A8ND.js").headers["cache-control"] == IMMUTABLE
+    assert client.get("/assets/apple-touch-icon.png").headers["cache-control"] == REVALIDATE
+    assert client.get("/assets/missing.js").status_code == 404
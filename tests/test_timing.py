@@ -0,0 +1,83 @@
+import re
+import time
+
+from fastapi import APIRouter, FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from FDocs import ServerTimingRoute, f_docs
+from FDocs.timing import PHASES
+
+TIMING_HEADERS = {"X-FDocs-Timing": "1"}
+
+
+class Item(BaseModel):
+    name: str
+
+
+def make_app():
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], expose_headers=["X-Request-Id"])
+    f_docs(app, server_timing=True)
+
+    @app.post("/items")
+    async def create(item: Item):
+        return item
+
+    @app.get("/slow")
+    def slow():
+        time.sleep(0.02)
+        return {"ok": True}
+
+    router = APIRouter(route_class=ServerTimingRoute)
+
+    @router.get("/nested")
+    async def nested():
+        return {"ok": True}
+
+    app.include_router(router, prefix="/api")
+    return app
+
+
+def phases(response):
+    return {name: float(dur) for name, dur in re.findall(r'(\w+);dur=([\d.]+);desc="[^"]*"', response.headers["server-timing"])}
+
+
+def test_breaks_down_timed_requests():
+    client = TestClient(make_app())
+    response = client.post("/items", json={"name": "a"}, headers=TIMING_HEADERS)
+    assert response.status_code == 200
+    assert list(phases(response)) == [name for name, _ in PHASES] + ["total"]
+
+
+def test_times_sync_endpoints_and_included_routers():
+    client = TestClient(make_app())
+    slow = phases(client.get("/slow", headers=TIMING_HEADERS))
+    assert slow["handler"] >= 20
+    assert "handler" in phases(client.get("/api/nested", headers=TIMING_HEADERS))
+
+
+def test_merges_into_the_exposed_headers():
+    client = TestClient(make_app())
+    response = client.get("/slow", headers={"Origin": "http://example.com", **TIMING_HEADERS})
+    assert response.headers.get_list("access-control-expose-headers") == ["X-Request-Id, Server-Timing"]
+
+
+def test_untimed_requests_are_untouched():
+    client = TestClient(make_app())
+    response = client.post("/items", json={"name": "a"})
+    assert response.json() == {"name": "a"}
+    assert "server-timing" not in response.headers
+
+
+def test_routes_declared_before_get_the_outer_phases():
+    app = FastAPI()
+
+    @app.get("/early")
+    async def early():
+        return {}
+
+    f_docs(app, server_timing=True)
+    names = list(phases(TestClient(app).get("/early", headers=TIMING_HEADERS)))
+    assert names == ["routing", "total"]
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from FDocs import DirectoryListing, save_stream
+
+
+async def chunks(*parts, pause=0.0):
+    for part in parts:
+        await asyncio.sleep(pause)
+        yield part
+
+
+def test_concurrent_uploads_to_one_name_do_not_mix(tmp_path):
+    destination = tmp_path / "data.bin"
+
+    async def main():
+        return await asyncio.gather(
+            save_stream(chunks(b"a" * 10, b"a" * 10, pause=0.01), destination),
+            save_stream(chunks(b"b" * 5, b"b" * 5, pause=0.01), destination),
+        )
+
+    first, second = asyncio.run(main())
+    assert destination.read_bytes() in (b"a" * 20, b"b" * 10)
+    assert (first.size, second.size) == (20, 10)
+    assert [path.name for path in tmp_path.iterdir()] == ["data.bin"]
+
+
+def test_oversized_upload_leaves_nothing_behind(tmp_path):
+    with pytest.raises(HTTPException) as info:
+        asyncio.run(save_stream(chunks(b"x" * 8, b"x" * 8), tmp_path / "big.bin", max_size=10))
+    assert info.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_listing_skips_partial_uploads(tmp_path):
+    (tmp_path / "done.bin").write_bytes(b"1")
+    (tmp_path / "done.bin.0123abcd.part").write_bytes(b"2")
+    entries = asyncio.run(DirectoryListing(tmp_path).entries())
+    assert [entry["filename"] for entry in entries] == ["done.bin"]
@@ -0,0 +1,42 @@
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from FDocs import f_docs, is_docs_warm
+
+
+def wait_until_warm(app, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not is_docs_warm(app) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return is_docs_warm(app)
+
+
+@pytest.mark.parametrize("with_lifespan", [False, True])
+def test_warms_up_at_startup(with_lifespan):
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan) if with_lifespan else FastAPI()
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    f_docs(app, warm_openapi=True, docs_index=True)
+    client = TestClient(app)
+    assert client.get("/docs/ready").status_code == 503
+
+    with client:
+        assert wait_until_warm(app)
+        assert client.get("/docs/ready").json() == {"warm": True}
+        assert "docs_index" in app.state.f_docs_openapi._derived
+    assert events == (["startup", "shutdown"] if with_lifespan else [])